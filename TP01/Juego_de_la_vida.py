@@ -2,6 +2,9 @@ import pygame
 import numpy as np
 import time
 import random
+from vida_motor import LifeEngine
+from vida_ciclos import CycleDetector
+from render_celdas import CellRenderer
 #Tener en cuenta que para poder correr el juego es necesario instalar la librería pygame y la librería numpy
 
 pygame.init()
@@ -22,31 +25,22 @@ for y in range(0, nxC):
 
 
 
-while True:
-    newGameState = np.copy(gameState)
-    screen.fill(bg)
+engine = LifeEngine(gameState)  # Motor vectorizado (ver vida_motor.py)
+renderer = CellRenderer(screen, (nxC, nyC), (int(dimCW), int(dimCH)), [bg, (255, 255, 255)],
+                        outline={0: (128, 128, 128)})
+detector = CycleDetector()      # Detecta cuando el tablero se repite (ver vida_ciclos.py)
+detector.update(engine.state, engine.generation)   # El mismo tipo (uint8) que en cada paso
+period = None
+
+while period is None:           # Se detiene cuando el patrón entra en un ciclo
     time.sleep(0.1)
-    for y in range(0, nxC):
-        for x in range(0, nyC):
-            n_neigh = gameState[(x-1) % nxC, (y-1) % nyC] + \
-                    gameState[(x) % nxC, (y-1) % nyC] + \
-                    gameState[(x+1) % nxC, (y-1) % nyC] + \
-                    gameState[(x-1) % nxC, (y) % nyC] + \
-                    gameState[(x+1) % nxC, (y) % nyC] + \
-                    gameState[(x-1) % nxC, (y+1) % nyC] + \
-                    gameState[(x) % nxC, (y+1) % nyC] + \
-                    gameState[(x+1) % nxC, (y+1) % nyC]
-            if gameState[x, y] == 0 and n_neigh ==3:
-                newGameState[x,y]=1
-            elif gameState[x, y] == 1 and (n_neigh < 2 or n_neigh > 3):
-                newGameState[x, y] = 0
-            poly = [((x) * dimCW, y * dimCH),
-                    ((x+1) * dimCW, y * dimCH),
-                    ((x+1) * dimCW, (y+1) * dimCH),
-                    ((x) * dimCW, (y+1) * dimCH)]
-            if newGameState[x, y] == 0:
-                pygame.draw.polygon(screen, (128, 128, 128), poly, 1)
-            else:
-                pygame.draw.polygon(screen, (255, 255, 255), poly, 0)
-    gameState = np.copy(newGameState)
-    pygame.display.flip()
\ No newline at end of file
+    gameState = engine.step()  # Calcula la generación completa de una vez
+    period = detector.update(gameState, engine.generation)
+    pygame.display.update(renderer.draw(gameState))  # Solo las celdas que cambiaron
+
+if period == 1:
+    print(f"Naturaleza muerta alcanzada en la generación {engine.generation - 1}")
+else:
+    print(f"Ciclo de período {period} desde la generación {engine.generation - period}")
+time.sleep(2)
+pygame.quit()
\ No newline at end of file
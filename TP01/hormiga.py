@@ -1,24 +1,27 @@
 import pygame
 import random
+from render_celdas import CellRenderer
+from hormiga_motor import LangtonAnt
 
 GRID_SIZE = 100
 CELL_SIZE = 6
+STEPS_PER_FRAME = 1   # Pasos que avanza la hormiga entre un cuadro y el siguiente
 
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 ANT_COLOR = (255, 0, 0)
 
-DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-
 pygame.init()
 screen = pygame.display.set_mode((GRID_SIZE * CELL_SIZE, GRID_SIZE * CELL_SIZE))
 pygame.display.set_caption("Hormiga de Langton")
 
-grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+renderer = CellRenderer(screen, (GRID_SIZE, GRID_SIZE), CELL_SIZE, [WHITE, BLACK])
 
-x, y = random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1)
-dir_idx = random.randint(0, 3)
+# Motor de la hormiga (ver hormiga_motor.py); grid es una vista de su grilla: grid[y, x]
+ant = LangtonAnt(GRID_SIZE, random.randint(0, GRID_SIZE - 1), random.randint(0, GRID_SIZE - 1),
+                 random.randint(0, 3))
+grid = ant.grid_array()
 
 running = True
 clock = pygame.time.Clock()
@@ -28,24 +31,18 @@ while running:
         if event.type == pygame.QUIT:
             running = False
 
-    if grid[y][x] == 0:
-        grid[y][x] = 1
-        dir_idx = (dir_idx + 1) % 4
-    else:
-        grid[y][x] = 0
-        dir_idx = (dir_idx - 1) % 4
-
-    dx, dy = DIRECTIONS[dir_idx]
-    x = (x + dx) % GRID_SIZE
-    y = (y + dy) % GRID_SIZE
+    # Se dibuja solo cada STEPS_PER_FRAME pasos (si encuentra la autopista, la extrapola)
+    ant.run_fast(STEPS_PER_FRAME)
+    x, y = ant.x, ant.y
 
-    for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            color = WHITE if grid[row][col] == 0 else BLACK
-            pygame.draw.rect(screen, color, (col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+    # Solo se redibujan las celdas que cambiaron (las que pisó la hormiga)
+    rects = renderer.draw(grid.T)
 
-    pygame.draw.rect(screen, ANT_COLOR, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+    ant_rect = renderer.cell_rect(x, y)
+    pygame.draw.rect(screen, ANT_COLOR, ant_rect)
+    renderer.invalidate(x, y)  # En el próximo cuadro se repinta la celda debajo de la hormiga
+    rects.append(ant_rect)
 
-    pygame.display.flip()
+    pygame.display.update(rects)
 
 pygame.quit()
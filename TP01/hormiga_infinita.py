@@ -0,0 +1,177 @@
+import numpy as np
+from hormiga_motor import LangtonAnt, DX, DY
+
+# Hormiga de Langton en un plano infinito (sin dar la vuelta como el toro de hormiga.py).
+# La grilla se guarda en bloques (chunks) de CHUNK x CHUNK celdas que se crean recién
+# cuando la hormiga pisa una celda de ese bloque, así la memoria crece con el área
+# recorrida y no con el tamaño de una grilla reservada de antemano.
+
+CHUNK = 64
+
+
+class ChunkedGrid:
+    """Grilla infinita de celdas (0/1) guardada en un diccionario {(cx, cy): bytearray}."""
+
+    def __init__(self, chunk=CHUNK):
+        if chunk & (chunk - 1):
+            raise ValueError("El tamaño de bloque debe ser potencia de 2")
+        self.chunk = chunk
+        self.shift = chunk.bit_length() - 1
+        self.chunks = {}
+
+    def block(self, cx, cy):
+        """Devuelve el bloque (cx, cy), creándolo vacío si todavía no existe."""
+        data = self.chunks.get((cx, cy))
+        if data is None:
+            data = self.chunks[(cx, cy)] = bytearray(self.chunk * self.chunk)
+        return data
+
+    def __getitem__(self, pos):
+        x, y = pos
+        data = self.chunks.get((x >> self.shift, y >> self.shift))
+        if data is None:
+            return 0
+        mask = self.chunk - 1
+        return data[(y & mask) * self.chunk + (x & mask)]
+
+    def __setitem__(self, pos, value):
+        x, y = pos
+        mask = self.chunk - 1
+        self.block(x >> self.shift, y >> self.shift)[(y & mask) * self.chunk + (x & mask)] = value
+
+    def _view(self, cx, cy):
+        return np.frombuffer(self.block(cx, cy), dtype=np.uint8).reshape(self.chunk, self.chunk)
+
+    def _groups(self, xs, ys):
+        """Agrupa coordenadas por bloque: genera ((cx, cy), índices de las celdas de ese bloque)."""
+        cxs, cys = xs >> self.shift, ys >> self.shift
+        keys = (cxs << 32) + (cys & 0xFFFFFFFF)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+        for a, b in zip(starts.tolist(), ends.tolist()):
+            i = order[a]
+            yield (int(cxs[i]), int(cys[i])), order[a:b]
+
+    def get_many(self, xs, ys):
+        """Lee muchas celdas a la vez (arrays 1-D de coordenadas); los bloques inexistentes valen 0."""
+        xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+        out = np.zeros(xs.shape, dtype=np.uint8)
+        mask = self.chunk - 1
+        for key, idx in self._groups(xs, ys):
+            if key in self.chunks:
+                out[idx] = self._view(*key)[ys[idx] & mask, xs[idx] & mask]
+        return out
+
+    def set_many(self, xs, ys, values):
+        """Escribe muchas celdas a la vez (arrays 1-D), creando los bloques que hagan falta."""
+        xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+        values = np.asarray(values)
+        mask = self.chunk - 1
+        for key, idx in self._groups(xs, ys):
+            self._view(*key)[ys[idx] & mask, xs[idx] & mask] = values[idx]
+
+    def memory(self):
+        """Bytes ocupados por las celdas (solo los bloques creados)."""
+        return len(self.chunks) * self.chunk * self.chunk
+
+    def bounds(self):
+        """(x0, y0, x1, y1): rectángulo [x0, x1) x [y0, y1) que cubre todos los bloques creados."""
+        if not self.chunks:
+            return 0, 0, 0, 0
+        cxs = [cx for cx, _ in self.chunks]
+        cys = [cy for _, cy in self.chunks]
+        c = self.chunk
+        return min(cxs) * c, min(cys) * c, (max(cxs) + 1) * c, (max(cys) + 1) * c
+
+    def to_array(self):
+        """
+        Exporta todos los bloques a un único array denso indexado [y, x] (como hormiga.py).
+        Devuelve (array, (x0, y0)): la celda array[0, 0] es la (x0, y0) del plano.
+        """
+        x0, y0, x1, y1 = self.bounds()
+        dense = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        c = self.chunk
+        for (cx, cy), data in self.chunks.items():
+            x, y = cx * c - x0, cy * c - y0
+            dense[y:y + c, x:x + c] = np.frombuffer(data, dtype=np.uint8).reshape(c, c)
+        return dense, (x0, y0)
+
+
+class InfiniteLangtonAnt(LangtonAnt):
+    """
+    Igual que hormiga_motor.LangtonAnt (incluida la extrapolación de la autopista),
+    pero sobre una ChunkedGrid: la hormiga nunca da la vuelta.
+    """
+
+    def __init__(self, x=0, y=0, direction=0, chunk=CHUNK):
+        self.size = None
+        self.grid = ChunkedGrid(chunk)
+        self.x, self.y, self.direction = x, y, direction
+        self.steps = 0
+        self.extrapolated_steps = 0
+
+    def grid_array(self):
+        """Copia densa de la zona recorrida, indexada [y, x] (ver ChunkedGrid.to_array)."""
+        return self.grid.to_array()[0]
+
+    def _walk(self, steps, trace=None):
+        """Bucle principal: avanza dentro del bloque actual y solo cambia de bloque al salir de él."""
+        grid = self.grid
+        shift, size, mask = grid.shift, grid.chunk, grid.chunk - 1
+        x, y, d = self.x, self.y, self.direction
+        cx, cy = x >> shift, y >> shift
+        g = grid.block(cx, cy)
+        for _ in range(steps):
+            i = (y & mask) * size + (x & mask)
+            color = g[i]
+            if trace is not None:
+                trace.append((x, y, d, color))
+            if color:
+                g[i] = 0
+                d = (d - 1) & 3
+            else:
+                g[i] = 1
+                d = (d + 1) & 3
+            x += DX[d]
+            y += DY[d]
+            if x >> shift != cx or y >> shift != cy:
+                cx, cy = x >> shift, y >> shift
+                g = grid.block(cx, cy)
+        self.x, self.y, self.direction = x, y, d
+        self.steps += steps
+        return trace
+
+    def run(self, steps):
+        self._walk(steps)
+
+    def _trace(self, steps):
+        return self._walk(steps, [])
+
+    def _wrap(self, v):
+        return v
+
+    def _read(self, xs, ys):
+        return self.grid.get_many(xs, ys)
+
+    def _write(self, xs, ys, values):
+        self.grid.set_many(xs, ys, values)
+
+    def _block_limit(self, highway):
+        return highway.max_periods
+
+    def _move_to(self, x, y):
+        self.x, self.y = int(x), int(y)
+
+
+if __name__ == "__main__":
+    import time
+
+    ant = InfiniteLangtonAnt()
+    t0 = time.perf_counter()
+    ant.run_fast(10**8)
+    elapsed = time.perf_counter() - t0
+    print(f"{ant.steps} pasos en {elapsed:.2f} s ({ant.extrapolated_steps} extrapolados)")
+    print(f"Hormiga en ({ant.x}, {ant.y}); {len(ant.grid.chunks)} bloques, "
+          f"{ant.grid.memory() / 2**20:.1f} MiB")
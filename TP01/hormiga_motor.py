@@ -0,0 +1,217 @@
+import numpy as np
+
+# Motor sin ventana (headless) de la hormiga de Langton sobre un toro.
+# La grilla es un bytearray plano (celda (x, y) en y * size + x), lo que permite
+# avanzar millones de pasos por segundo en un bucle de Python muy simple.
+# Además detecta la "autopista": después de unos 10.000 pasos la hormiga repite
+# el mismo movimiento cada 104 pasos desplazándose en diagonal. Una vez detectada,
+# se extrapola por bloques de períodos en lugar de simular paso a paso.
+
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]   # Igual que en hormiga.py
+DX = tuple(d[0] for d in DIRECTIONS)
+DY = tuple(d[1] for d in DIRECTIONS)
+HIGHWAY_PERIOD = 104
+
+
+class LangtonAnt:
+    """Hormiga de Langton en una grilla toroidal de size x size."""
+
+    def __init__(self, size=100, x=None, y=None, direction=0):
+        self.size = size
+        self.grid = bytearray(size * size)
+        self.x = size // 2 if x is None else x
+        self.y = size // 2 if y is None else y
+        self.direction = direction
+        self.steps = 0
+        self.extrapolated_steps = 0   # Pasos que se resolvieron sin simular
+
+    def grid_array(self):
+        """Vista NumPy (sin copiar) de la grilla, indexada [y, x] como en hormiga.py."""
+        return np.frombuffer(self.grid, dtype=np.uint8).reshape(self.size, self.size)
+
+    def run(self, steps):
+        """Avanza 'steps' pasos simulando uno por uno."""
+        g, n = self.grid, self.size
+        x, y, d = self.x, self.y, self.direction
+        for _ in range(steps):
+            i = y * n + x
+            if g[i]:
+                g[i] = 0
+                d = (d - 1) & 3   # Celda negra: gira a la izquierda
+            else:
+                g[i] = 1
+                d = (d + 1) & 3   # Celda blanca: gira a la derecha
+            x = (x + DX[d]) % n
+            y = (y + DY[d]) % n
+        self.x, self.y, self.direction = x, y, d
+        self.steps += steps
+
+    # ======== Detección de la autopista ========
+    def _trace(self, steps):
+        """Igual que run(), pero guarda (x, y, dirección, color leído) antes de cada paso."""
+        g, n = self.grid, self.size
+        x, y, d = self.x, self.y, self.direction
+        trace = []
+        for _ in range(steps):
+            i = y * n + x
+            color = g[i]
+            trace.append((x, y, d, color))
+            if color:
+                g[i] = 0
+                d = (d - 1) & 3
+            else:
+                g[i] = 1
+                d = (d + 1) & 3
+            x = (x + DX[d]) % n
+            y = (y + DY[d]) % n
+        self.x, self.y, self.direction = x, y, d
+        self.steps += steps
+        return trace
+
+    def _wrap(self, v):
+        """Lleva una diferencia de coordenadas al rango [-size/2, size/2)."""
+        n = self.size
+        return (v + n // 2) % n - n // 2
+
+    def detect_highway(self, period=HIGHWAY_PERIOD, repeats=3):
+        """
+        Simula 'repeats' períodos registrando el recorrido. Si los colores leídos y las
+        direcciones se repiten con ese período y con un desplazamiento constante,
+        devuelve la plantilla del último período para extrapolar; si no, None.
+        """
+        trace = self._trace(period * repeats)
+        x0, y0 = trace[0][0], trace[0][1]
+        shift = (self._wrap(trace[period][0] - x0), self._wrap(trace[period][1] - y0))
+        for i in range(period * (repeats - 1)):
+            x, y, d, color = trace[i]
+            nx, ny, nd, ncolor = trace[i + period]
+            if nd != d or ncolor != color or \
+                    self._wrap(nx - x) != shift[0] or self._wrap(ny - y) != shift[1]:
+                return None
+
+        # Plantilla: cada celda del último período (relativa a la posición inicial de la
+        # hormiga) con su color antes del período y después del período.
+        start = period * (repeats - 1)
+        px, py = trace[start][0], trace[start][1]
+        before = {}
+        for x, y, _, color in trace[start:]:
+            before.setdefault((self._wrap(x - px), self._wrap(y - py)), color)
+        offsets = list(before)
+        o = np.array(offsets, dtype=np.int64)
+        after = self._read(px + o[:, 0], py + o[:, 1])
+        return _Highway(period, shift, offsets, [before[o] for o in offsets], after)
+
+    # Acceso vectorizado a la grilla, usado por la extrapolación (coordenadas sin envolver)
+    def _read(self, xs, ys):
+        return self.grid_array()[ys % self.size, xs % self.size]
+
+    def _write(self, xs, ys, values):
+        self.grid_array()[ys % self.size, xs % self.size] = values
+
+    def _block_limit(self, highway):
+        """Máximo de períodos por bloque sin dar la vuelta al toro (los períodos se pisarían)."""
+        n = self.size
+        ox, oy = highway.offsets[:, 0], highway.offsets[:, 1]
+        sx, sy = highway.shift
+        span_x = ox.max() - ox.min() + 1
+        span_y = oy.max() - oy.min() + 1
+        return min((n - span_x) // abs(sx) if sx else highway.max_periods,
+                   (n - span_y) // abs(sy) if sy else highway.max_periods)
+
+    def _move_to(self, x, y):
+        self.x, self.y = int(x % self.size), int(y % self.size)
+
+    def _extrapolate(self, highway, periods):
+        """
+        Aplica 'periods' períodos de la autopista de una sola vez con NumPy.
+        Es exacto: solo se aplica si todas las celdas que la hormiga leería tienen el
+        color que tenían en la plantilla (si no, la hormiga se desviaría).
+        Devuelve cuántos períodos se aplicaron.
+        """
+        ox, oy = highway.offsets[:, 0], highway.offsets[:, 1]
+        sx, sy = highway.shift
+        periods = max(0, min(periods, self._block_limit(highway), highway.max_periods))
+        while periods > 0:
+            k = np.arange(periods)[:, None]
+            xs = self.x + k * sx + ox
+            ys = self.y + k * sy + oy
+            check = highway.grid_checked[None, :] | (k < highway.inherit_from[None, :])
+            if np.array_equal(self._read(xs[check], ys[check]),
+                              np.broadcast_to(highway.before, xs.shape)[check]):
+                # Cada celda queda con el color del último período que la pisó
+                xs, ys = xs.ravel()[::-1], ys.ravel()[::-1]
+                values = np.broadcast_to(highway.after, k.shape[:1] + ox.shape).ravel()[::-1]
+                _, first = np.unique(xs * (1 << 32) + ys, return_index=True)
+                self._write(xs[first], ys[first], values[first])
+                self._move_to(self.x + periods * sx, self.y + periods * sy)
+                self.steps += periods * highway.period
+                self.extrapolated_steps += periods * highway.period
+                return periods
+            periods //= 2
+        return 0
+
+    def run_fast(self, steps, check_every=10000):
+        """
+        Avanza 'steps' pasos: simula, y cada 'check_every' pasos busca la autopista;
+        si la encuentra, la extrapola mientras siga siendo válida.
+        """
+        target = self.steps + steps
+        while self.steps < target:
+            remaining = target - self.steps
+            if remaining < 3 * HIGHWAY_PERIOD:
+                self.run(remaining)
+                break
+            self.run(min(check_every, remaining - 3 * HIGHWAY_PERIOD))
+            highway = self.detect_highway()
+            if highway is not None:
+                self._extrapolate(highway, (target - self.steps) // HIGHWAY_PERIOD)
+        return self
+
+
+class _Highway:
+    """Plantilla de un período de la autopista (desplazamiento y celdas que toca)."""
+
+    def __init__(self, period, shift, offsets, before, after):
+        self.period = period
+        self.shift = shift
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.before = np.array(before, dtype=np.uint8)
+        self.after = np.array(after, dtype=np.uint8)
+
+        # Para cada celda, cuántos períodos atrás la pisó la hormiga por última vez (0 si
+        # nunca). Si ese período cae dentro del bloque extrapolado, su color ya es el
+        # 'after' de ese período; si no, hay que leerlo de la grilla.
+        index = {tuple(o): i for i, o in enumerate(offsets)}
+        span = int(np.abs(self.offsets).max()) * 2 + 1
+        max_back = 1 if shift == (0, 0) else span // max(abs(shift[0]), abs(shift[1])) + 1
+        inherit = np.zeros(len(offsets), dtype=np.int64)
+        self.max_periods = 65536
+        for i, (ox, oy) in enumerate(offsets):
+            for m in range(1, max_back + 1):
+                j = index.get((ox + m * shift[0], oy + m * shift[1]))
+                if j is not None:
+                    inherit[i] = m
+                    if self.after[j] != self.before[i]:
+                        # Plantilla todavía no estable: solo vale mientras esa celda se lea de la grilla
+                        self.max_periods = min(self.max_periods, m)
+                    break
+        self.grid_checked = inherit == 0
+        self.inherit_from = inherit
+
+
+if __name__ == "__main__":
+    import time
+
+    ant = LangtonAnt(size=512)
+    t0 = time.perf_counter()
+    ant.run(1_000_000)
+    elapsed = time.perf_counter() - t0
+    print(f"Simulación paso a paso: {1_000_000 / elapsed / 1e6:.2f} millones de pasos/s")
+
+    # En un toro la autopista termina chocando con su propio rastro al dar la vuelta
+    # (unos 200.000 pasos en 4096x4096); hasta ahí se extrapola casi todo.
+    ant = LangtonAnt(size=4096)
+    t0 = time.perf_counter()
+    ant.run_fast(200_000)
+    elapsed = time.perf_counter() - t0
+    print(f"{ant.steps} pasos en {elapsed:.2f} s ({ant.extrapolated_steps} extrapolados)")
@@ -0,0 +1,91 @@
+import numpy as np
+import pygame
+
+# Dibujo de grillas de celdas (Juego de la Vida, hormiga de Langton) escribiendo
+# directamente en el buffer de píxeles de una superficie, en lugar de llamar a
+# pygame.draw.rect / pygame.draw.polygon una vez por celda en cada cuadro.
+# Solo se vuelven a dibujar las celdas que cambiaron desde el cuadro anterior,
+# y se devuelven los rectángulos modificados para pygame.display.update(rects).
+
+
+class CellRenderer:
+    """
+    Dibuja una grilla de celdas indexada como gameState: state[x, y].
+    - colors: color RGB de cada valor de celda (0, 1, 2, ...).
+    - outline: opcional, {valor: color} para dibujar el borde de esas celdas
+      (por ejemplo la grilla gris de las celdas muertas del Juego de la Vida).
+    - max_dirty: si cambian más celdas que esto, se redibuja todo con una sola copia.
+    """
+
+    def __init__(self, screen, shape, cell_size, colors, outline=None, max_dirty=4096):
+        self.screen = screen
+        self.nx, self.ny = shape
+        self.cw, self.ch = (cell_size, cell_size) if np.isscalar(cell_size) else cell_size
+        self.max_dirty = max_dirty
+        self.canvas = pygame.Surface((self.nx * self.cw, self.ny * self.ch), 0, screen)
+
+        # Un "azulejo" de píxeles (ya convertidos al formato de la superficie) por valor de celda
+        tiles = np.empty((len(colors), self.cw, self.ch), dtype=np.uint32)
+        for value, color in enumerate(colors):
+            tiles[value] = self.canvas.map_rgb(color)
+            if outline and value in outline:
+                border = self.canvas.map_rgb(outline[value])
+                tiles[value, [0, -1], :] = border
+                tiles[value, :, [0, -1]] = border
+        self._tiles = tiles
+        self._previous = None
+        self._forced = set()
+
+    def invalidate(self, x, y):
+        """Fuerza a redibujar la celda (x, y) en el próximo cuadro (p. ej. si se dibujó algo encima)."""
+        self._forced.add((x, y))
+
+    def cell_rect(self, x, y):
+        return pygame.Rect(x * self.cw, y * self.ch, self.cw, self.ch)
+
+    def draw(self, state, origin=(0, 0)):
+        """
+        Dibuja 'state' en la pantalla y devuelve la lista de rectángulos que cambiaron.
+        La primera vez (o si cambian muchas celdas) se redibuja la grilla completa.
+        """
+        state = np.asarray(state)
+        if state.dtype.kind not in "iu":
+            state = state.astype(np.uint8)
+        if self._previous is None:
+            changed = None
+        else:
+            diff = state != self._previous
+            for x, y in self._forced:
+                diff[x, y] = True
+            if np.count_nonzero(diff) > self.max_dirty:
+                changed = None
+            else:
+                xs, ys = np.nonzero(diff)
+                changed = list(zip(xs.tolist(), ys.tolist()))
+        self._forced.clear()
+
+        pixels = pygame.surfarray.pixels2d(self.canvas)
+        if changed is None:
+            # Toda la grilla: (nx, ny, cw, ch) -> (nx*cw, ny*ch)
+            full = self._tiles.take(state, axis=0).transpose(0, 2, 1, 3).reshape(self.nx * self.cw, self.ny * self.ch)
+            pixels[...] = full
+        else:
+            cw, ch, tiles = self.cw, self.ch, self._tiles
+            for x, y in changed:
+                pixels[x * cw:(x + 1) * cw, y * ch:(y + 1) * ch] = tiles[state[x, y]]
+        del pixels  # libera el bloqueo de la superficie antes de copiarla
+
+        ox, oy = origin
+        if changed is None:
+            rects = [self.screen.blit(self.canvas, origin)]
+        else:
+            rects = []
+            for x, y in changed:
+                rect = self.cell_rect(x, y)
+                rects.append(self.screen.blit(self.canvas, rect.move(ox, oy), rect))
+
+        if self._previous is None or self._previous.shape != state.shape:
+            self._previous = state.copy()
+        else:
+            self._previous[...] = state
+        return rects
@@ -0,0 +1,107 @@
+import numpy as np
+
+# Turmitas: generalización de la hormiga de Langton a muchas hormigas y muchos colores.
+# La regla es un texto con un giro por color, por ejemplo "RL" (la hormiga clásica de
+# hormiga.py), "RLR" o "LLRR": al pisar una celda de color c la hormiga gira según
+# rule[c], la celda pasa al color (c + 1) % len(rule) y la hormiga avanza una celda.
+# Todas las hormigas se actualizan juntas en cada paso con arrays de NumPy.
+# Para barridos de parámetros se pueden simular varios universos a la vez (uno por
+# regla), cada uno con su propia grilla toroidal y sus propias hormigas.
+
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]   # Igual que en hormiga.py
+TURNS = {"R": 1, "L": -1, "N": 0, "U": 2}          # Derecha, izquierda, seguir, media vuelta
+_DX = np.array([d[0] for d in DIRECTIONS])
+_DY = np.array([d[1] for d in DIRECTIONS])
+
+# Política cuando varias hormigas pisan la misma celda en el mismo paso
+# (todas leen el color antes de que nadie escriba, así que giran igual):
+# - "stack": cada hormiga avanza el color una vez (k hormigas -> color + k).
+# - "once": la celda avanza un solo color, sin importar cuántas hormigas haya.
+COLLISION_POLICIES = ("stack", "once")
+
+
+def parse_rule(rule):
+    """Convierte una regla como "RLR" en el array de giros por color."""
+    if not 2 <= len(rule) <= 256 or any(ch not in TURNS for ch in rule.upper()):
+        raise ValueError(f"Regla inválida: {rule!r} (usar entre 2 y 256 letras de {''.join(TURNS)})")
+    return np.array([TURNS[ch] for ch in rule.upper()], dtype=np.int64)
+
+
+class Turmites:
+    """
+    Varias turmitas en uno o más universos toroidales de height x width.
+    - rules: una regla, o una lista de reglas (un universo por regla).
+    - ants: cantidad de hormigas por universo, ubicadas al azar (con 'seed').
+    """
+
+    def __init__(self, rules, width=100, height=None, ants=1, collision="stack", seed=None):
+        if isinstance(rules, str):
+            rules = [rules]
+        if collision not in COLLISION_POLICIES:
+            raise ValueError(f"Política de colisión desconocida: {collision!r}")
+        self.rules = list(rules)
+        self.width = width
+        self.height = width if height is None else height
+        self.collision = collision
+        self.ticks = 0
+
+        turns = [parse_rule(r) for r in self.rules]
+        self.n_colors = np.array([len(t) for t in turns], dtype=np.int64)
+        self.turn_table = np.zeros((len(turns), self.n_colors.max()), dtype=np.int64)
+        for u, t in enumerate(turns):
+            self.turn_table[u, :len(t)] = t
+
+        universes = len(self.rules)
+        self.grid = np.zeros((universes, self.height, self.width), dtype=np.uint8)
+        rng = np.random.default_rng(seed)
+        self.universe = np.repeat(np.arange(universes), ants)
+        self.x = rng.integers(0, self.width, size=self.universe.size)
+        self.y = rng.integers(0, self.height, size=self.universe.size)
+        self.direction = rng.integers(0, 4, size=self.universe.size)
+
+    def place(self, x, y, direction, universe=None):
+        """Reemplaza las hormigas por las indicadas (arrays o listas de igual largo)."""
+        self.x = np.asarray(x, dtype=np.int64)
+        self.y = np.asarray(y, dtype=np.int64)
+        self.direction = np.asarray(direction, dtype=np.int64)
+        self.universe = np.zeros_like(self.x) if universe is None else np.asarray(universe, dtype=np.int64)
+
+    def step(self, ticks=1):
+        """Avanza todas las hormigas de todos los universos 'ticks' pasos."""
+        grid = self.grid.reshape(-1)
+        cells = self.height * self.width
+        for _ in range(ticks):
+            flat = self.universe * cells + self.y * self.width + self.x
+            colors = grid[flat]
+            self.direction = (self.direction + self.turn_table[self.universe, colors]) & 3
+
+            # Avanzar el color de las celdas pisadas según la política de colisión
+            cell, count = np.unique(flat, return_counts=True)
+            add = count if self.collision == "stack" else 1
+            grid[cell] = (grid[cell] + add) % self.n_colors[cell // cells]
+
+            self.x = (self.x + _DX[self.direction]) % self.width
+            self.y = (self.y + _DY[self.direction]) % self.height
+        self.ticks += ticks
+        return self
+
+    def color_counts(self):
+        """Cantidad de celdas de cada color por universo: array (universos, colores)."""
+        max_colors = self.turn_table.shape[1]
+        flat = self.grid.reshape(len(self.rules), -1)
+        return np.stack([np.bincount(g, minlength=max_colors) for g in flat])
+
+
+if __name__ == "__main__":
+    import time
+
+    rules = ["RL", "RLR", "LLRR", "LRRRRRLLR", "RRLLLRLLLRRR"]
+    sim = Turmites(rules, width=256, ants=1000, seed=0)
+    t0 = time.perf_counter()
+    sim.step(1000)
+    elapsed = time.perf_counter() - t0
+    total = sim.universe.size * sim.ticks
+    print(f"{sim.universe.size} hormigas x {sim.ticks} pasos en {elapsed:.2f} s "
+          f"({total / elapsed / 1e6:.1f} millones de pasos-hormiga/s)")
+    for rule, counts in zip(rules, sim.color_counts()):
+        print(f"{rule:>14}: {counts[1:].sum()} celdas coloreadas")
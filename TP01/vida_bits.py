@@ -0,0 +1,235 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+
+# Tablero del Juego de la Vida empaquetado en bits: cada fila del tablero
+# (tablero[x, :]) se guarda en palabras de 64 bits, 1 bit por celda, así que ocupa
+# 64 veces menos memoria que el gameState de float64 de Juego_de_la_vida.py.
+# La generación siguiente se calcula con lógica de sumadores completos bit a bit
+# sobre un toro, con las mismas reglas B3/S23.
+# Para tableros grandes, las filas se reparten en bandas que un pool de procesos
+# avanza en paralelo; cada banda lee las filas de borde (halo) de sus vecinas.
+
+WORD_BITS = 64
+_ONE = np.uint64(1)
+_HIGH = np.uint64(WORD_BITS - 1)
+
+
+def n_words(ncols):
+    """Cantidad de palabras de 64 bits necesarias para guardar 'ncols' celdas."""
+    return (ncols + WORD_BITS - 1) // WORD_BITS
+
+
+def pack(state):
+    """Empaqueta un tablero de 0s y 1s (nx, ny) en palabras uint64 (nx, n_words(ny))."""
+    state = np.asarray(state)
+    nx, ny = state.shape
+    packed = np.packbits(state.astype(bool), axis=1, bitorder="little")
+    words = np.zeros((nx, n_words(ny) * 8), dtype=np.uint8)
+    words[:, :packed.shape[1]] = packed
+    return words.view("<u8").astype(np.uint64)
+
+
+def unpack(words, ncols):
+    """Desempaqueta palabras uint64 en un tablero uint8 de 'ncols' columnas."""
+    as_bytes = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=ncols, bitorder="little")
+
+
+def random_packed(nrows, ncols, seed=None):
+    """Genera directamente un tablero aleatorio empaquetado (sin pasar por uno denso)."""
+    rng = np.random.default_rng(seed)
+    words = rng.integers(0, np.iinfo(np.uint64).max, size=(nrows, n_words(ncols)),
+                         dtype=np.uint64, endpoint=True)
+    words[:, -1] &= _last_word_mask(ncols)
+    return words
+
+
+def _last_word_mask(ncols):
+    """Máscara con los bits válidos de la última palabra de cada fila."""
+    used = ncols % WORD_BITS
+    if used == 0:
+        return np.uint64(np.iinfo(np.uint64).max)
+    return np.uint64((1 << used) - 1)
+
+
+def _neighbours_west_east(a, ncols):
+    """
+    Devuelve (W, E): para cada celda, el valor de su vecina en y-1 y en y+1,
+    desplazando las filas un bit (con acarreo entre palabras y vuelta toroidal).
+    """
+    last = np.uint64((ncols - 1) % WORD_BITS)
+
+    west = a << _ONE
+    west[:, 1:] |= a[:, :-1] >> _HIGH
+    west[:, 0] |= (a[:, -1] >> last) & _ONE     # la celda y=0 ve a y=ncols-1
+    west[:, -1] &= _last_word_mask(ncols)
+
+    east = a >> _ONE
+    east[:, :-1] |= a[:, 1:] << _HIGH
+    east[:, -1] |= (a[:, 0] & _ONE) << last     # la celda y=ncols-1 ve a y=0
+    return west, east
+
+
+def _step_rows(ext, ncols):
+    """
+    Calcula la generación siguiente de las filas interiores de 'ext'.
+    'ext' tiene una fila de halo arriba y otra abajo: (h+2, palabras) -> (h, palabras).
+    """
+    up, mid, down = ext[:-2], ext[1:-1], ext[2:]
+    uw, ue = _neighbours_west_east(up, ncols)
+    mw, me = _neighbours_west_east(mid, ncols)
+    dw, de = _neighbours_west_east(down, ncols)
+
+    # Suma de cada fila de vecinos como número de 2 bits (sumador completo / medio)
+    u0 = uw ^ up ^ ue
+    u1 = (uw & up) | (ue & (uw ^ up))
+    m0 = mw ^ me
+    m1 = mw & me
+    d0 = dw ^ down ^ de
+    d1 = (dw & down) | (de & (dw ^ down))
+
+    # Bit de las unidades (s0) y acarreo hacia el bit de los dos
+    s0 = u0 ^ m0 ^ d0
+    c0 = (u0 & m0) | (d0 & (u0 ^ m0))
+    # Bit de los dos (s1) y bit de los cuatro (s2); el 8 no hace falta: 8 vecinos -> muere
+    t = u1 ^ m1 ^ d1
+    k1 = (u1 & m1) | (d1 & (u1 ^ m1))
+    s1 = t ^ c0
+    s2 = k1 ^ (t & c0)
+
+    # B3/S23: vive si tiene 3 vecinos, o si estaba viva y tiene 2 (s1=1, s2=0)
+    return s1 & ~s2 & (s0 | mid)
+
+
+def _band_limits(nrows, n_bands):
+    """Divide las filas en 'n_bands' bandas contiguas [inicio, fin)."""
+    n_bands = max(1, min(n_bands, nrows))
+    edges = np.linspace(0, nrows, n_bands + 1).astype(int)
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _step_band(src, dst, lo, hi, ncols):
+    """Avanza las filas [lo, hi) de 'src' a 'dst', leyendo las filas halo lo-1 y hi."""
+    nrows = src.shape[0]
+    ext = np.empty((hi - lo + 2, src.shape[1]), dtype=np.uint64)
+    ext[0] = src[(lo - 1) % nrows]
+    ext[1:-1] = src[lo:hi]
+    ext[-1] = src[hi % nrows]
+    dst[lo:hi] = _step_rows(ext, ncols)
+
+
+def step(words, ncols, band_rows=1024):
+    """
+    Calcula la generación siguiente de un tablero empaquetado (en un solo proceso).
+    Se procesa por bandas de 'band_rows' filas para acotar la memoria temporal.
+    """
+    new = np.empty_like(words)
+    n_bands = -(-words.shape[0] // band_rows)
+    for lo, hi in _band_limits(words.shape[0], n_bands):
+        _step_band(words, new, lo, hi, ncols)
+    return new
+
+
+# ======== Ejecución en paralelo por bandas ========
+# Los dos buffers (generación actual y siguiente) viven en memoria compartida, así
+# el tablero no se copia entre procesos en cada generación: cada tarea solo indica
+# qué banda avanzar y desde qué buffer leer.
+_shared = {}
+
+
+def _attach(names, shape, ncols):
+    """Inicializador de cada proceso del pool: se conecta a los buffers compartidos."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _shared["blocks"] = blocks
+    _shared["buffers"] = [np.ndarray(shape, dtype=np.uint64, buffer=b.buf) for b in blocks]
+    _shared["ncols"] = ncols
+
+
+def _step_shared_band(args):
+    src_index, lo, hi = args
+    buffers = _shared["buffers"]
+    _step_band(buffers[src_index], buffers[1 - src_index], lo, hi, _shared["ncols"])
+    return hi - lo
+
+
+def run_parallel(words, ncols, generations, workers=None, bands=None):
+    """
+    Avanza 'generations' generaciones repartiendo las filas en bandas entre 'workers'
+    procesos. Entre generaciones el pool hace de barrera: ninguna banda empieza la
+    generación siguiente hasta que todas terminaron, así los halos leídos son correctos.
+    Devuelve un nuevo array con el tablero final.
+    """
+    workers = workers or os.cpu_count() or 1
+    bands = bands or workers * 4
+    limits = _band_limits(words.shape[0], bands)
+
+    blocks = [shared_memory.SharedMemory(create=True, size=max(words.nbytes, 1)) for _ in range(2)]
+    try:
+        buffers = [np.ndarray(words.shape, dtype=np.uint64, buffer=b.buf) for b in blocks]
+        buffers[0][...] = words
+        src = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=([b.name for b in blocks], words.shape, ncols)) as pool:
+            for _ in range(generations):
+                list(pool.map(_step_shared_band, [(src, lo, hi) for lo, hi in limits]))
+                src = 1 - src
+        result = buffers[src].copy()
+        del buffers
+    finally:
+        for b in blocks:
+            b.close()
+            b.unlink()
+    return result
+
+
+class PackedLife:
+    """Tablero empaquetado en bits con la misma interfaz básica que vida_motor.LifeEngine."""
+
+    def __init__(self, state=None, words=None, ncols=None):
+        if words is None:
+            state = np.asarray(state)
+            words, ncols = pack(state), state.shape[1]
+        self.words = words
+        self.ncols = ncols
+        self.generation = 0
+
+    @property
+    def state(self):
+        """Tablero desempaquetado (uint8, indexado [x, y] como gameState)."""
+        return unpack(self.words, self.ncols)
+
+    def population(self):
+        """Cantidad de celdas vivas (sin desempaquetar)."""
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    def step(self):
+        self.words = step(self.words, self.ncols)
+        self.generation += 1
+        return self.words
+
+    def run(self, generations, workers=1):
+        """Avanza 'generations' generaciones; con workers > 1 usa el pool por bandas."""
+        if workers == 1:
+            for _ in range(generations):
+                self.step()
+        else:
+            self.words = run_parallel(self.words, self.ncols, generations, workers)
+            self.generation += generations
+        return self.words
+
+
+if __name__ == "__main__":
+    import time
+
+    nx, ny, gens = 4096, 4096, 50
+    life = PackedLife(words=random_packed(nx, ny, seed=0), ncols=ny)
+    print(f"Memoria del tablero: {life.words.nbytes / 2**20:.1f} MiB "
+          f"(float64: {nx * ny * 8 / 2**20:.1f} MiB)")
+    for workers in sorted({1, os.cpu_count() or 1}):
+        board = PackedLife(words=life.words.copy(), ncols=ny)
+        t0 = time.perf_counter()
+        board.run(gens, workers=workers)
+        elapsed = time.perf_counter() - t0
+        print(f"{workers} proceso(s): {gens / elapsed:.1f} gen/s, vivas = {board.population()}")
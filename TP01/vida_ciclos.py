@@ -0,0 +1,106 @@
+from collections import deque
+import hashlib
+import numpy as np
+from vida_motor import LifeEngine, random_board
+
+# Detección de ciclos en el Juego de la Vida.
+# Se guarda un hash de cada uno de los últimos tableros; si un tablero se repite,
+# el patrón entró en un ciclo de período p (p = 1 es una naturaleza muerta).
+# Conocido el ciclo, el tablero de cualquier generación futura se obtiene
+# simulando a lo sumo p - 1 generaciones en lugar de todas.
+
+
+def board_hash(state):
+    """Hash de 128 bits del tablero (la probabilidad de colisión es despreciable)."""
+    return hashlib.blake2b(np.ascontiguousarray(state).tobytes(), digest_size=16).digest()
+
+
+class CycleDetector:
+    """
+    Recuerda los hashes de los últimos 'window' tableros.
+    Solo detecta ciclos de período <= window.
+    """
+
+    def __init__(self, window=256):
+        self.window = window
+        self._recent = deque()   # (hash, generación), del más viejo al más nuevo
+        self._seen = {}          # hash -> generación más reciente en la ventana
+
+    def update(self, state, generation):
+        """
+        Registra el tablero de la generación 'generation'.
+        Devuelve el período si el tablero ya apareció dentro de la ventana, si no None.
+        """
+        digest = board_hash(state)
+        previous = self._seen.get(digest)
+        self._recent.append((digest, generation))
+        self._seen[digest] = generation
+        if len(self._recent) > self.window:
+            old_digest, old_generation = self._recent.popleft()
+            if self._seen.get(old_digest) == old_generation:
+                del self._seen[old_digest]
+        if previous is not None:
+            return generation - previous
+        return None
+
+
+class CycleResult:
+    """Resultado de run_until_cycle."""
+
+    def __init__(self, engine, period, cycle_start):
+        self.engine = engine              # Motor detenido en la generación en que se detectó
+        self.period = period              # Período del ciclo (None si no se encontró)
+        self.cycle_start = cycle_start    # Primera generación que ya forma parte del ciclo
+
+    @property
+    def generation(self):
+        return self.engine.generation
+
+    @property
+    def state(self):
+        return self.engine.state
+
+    def state_at(self, n):
+        """
+        Tablero de la generación n >= cycle_start sin simular las generaciones intermedias:
+        como el tablero se repite cada 'period', basta avanzar (n - generación actual) % period.
+        """
+        if self.period is None:
+            raise ValueError("No se detectó ningún ciclo")
+        if n < self.cycle_start:
+            raise ValueError(f"La generación {n} es anterior al ciclo (empieza en {self.cycle_start})")
+        engine = LifeEngine(self.engine.state)
+        engine.run((n - self.generation) % self.period)
+        return engine.state.copy()
+
+
+def run_until_cycle(state, max_generations, window=256):
+    """
+    Simula hasta que el tablero entra en un ciclo de período <= window, o hasta
+    'max_generations'. Devuelve un CycleResult.
+    """
+    engine = LifeEngine(state)
+    detector = CycleDetector(window)
+    detector.update(engine.state, 0)
+    while engine.generation < max_generations:
+        engine.step()
+        period = detector.update(engine.state, engine.generation)
+        if period is not None:
+            return CycleResult(engine, period, engine.generation - period)
+    return CycleResult(engine, None, None)
+
+
+def run_soups(count, nxC, nyC, max_generations, seed=None, window=256):
+    """Genera 'count' tableros aleatorios y devuelve el resultado de cada uno."""
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        soup = random_board(nxC, nyC, seed=rng.integers(2**63))
+        yield run_until_cycle(soup, max_generations, window)
+
+
+if __name__ == "__main__":
+    for i, result in enumerate(run_soups(10, 64, 64, 5000, seed=0)):
+        if result.period is None:
+            print(f"Sopa {i}: sin ciclo tras {result.generation} generaciones")
+        else:
+            print(f"Sopa {i}: ciclo de período {result.period} desde la generación {result.cycle_start}")
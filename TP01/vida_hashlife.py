@@ -0,0 +1,263 @@
+from collections import OrderedDict
+import numpy as np
+
+# HashLife: Juego de la Vida sobre un plano infinito guardado como un quadtree.
+# Cada nodo de nivel k representa un cuadrado de 2^k x 2^k celdas y se construye a
+# partir de 4 hijos de nivel k-1 (a = arriba-izq, b = arriba-der, c = abajo-izq,
+# d = abajo-der). Los nodos son canónicos: dos regiones iguales son el mismo objeto,
+# así que un universo casi vacío o repetitivo ocupa muy poca memoria.
+# El resultado de avanzar cada nodo se memoriza, lo que permite saltar 2^k
+# generaciones en una sola llamada.
+# A diferencia de Juego_de_la_vida.py, el universo NO es un toro: las celdas que
+# salen del tablero importado siguen existiendo fuera de él.
+# Coordenadas: (x, y) como en gameState[x, y]; x crece hacia la derecha, y hacia abajo.
+
+
+class Node:
+    """Nodo del quadtree. 'n' es la cantidad de celdas vivas que contiene."""
+    __slots__ = ("k", "a", "b", "c", "d", "n")
+
+    def __init__(self, k, a, b, c, d, n):
+        self.k, self.a, self.b, self.c, self.d, self.n = k, a, b, c, d, n
+
+
+# Hojas (nivel 0): una celda muerta y una viva
+OFF = Node(0, None, None, None, None, 0)
+ON = Node(0, None, None, None, None, 1)
+
+
+class HashLife:
+    """
+    Universo HashLife con tabla de nodos canónicos y memoria de resultados acotadas.
+    - max_nodes: si la tabla de nodos supera este tamaño, se descartan los nodos
+      que ya no son alcanzables desde el universo actual (y la memoria de resultados).
+    - max_results: tamaño de la memoria de resultados; se descarta el menos usado (LRU).
+    """
+
+    def __init__(self, state=None, max_nodes=2_000_000, max_results=1_000_000):
+        self.max_nodes = max_nodes
+        self.max_results = max_results
+        self._nodes = {}
+        self._results = OrderedDict()
+        self._zeros = [OFF]
+        self.generation = 0
+        self.shape = (0, 0)
+        self.root = self._zero(3)
+        if state is not None:
+            self.load(state)
+
+    # ======== Construcción de nodos ========
+    def _join(self, a, b, c, d):
+        """Devuelve el nodo canónico con hijos a, b, c, d."""
+        key = (a, b, c, d)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(a.k + 1, a, b, c, d, a.n + b.n + c.n + d.n)
+            self._nodes[key] = node
+        return node
+
+    def _zero(self, k):
+        """Nodo vacío de nivel k."""
+        while len(self._zeros) <= k:
+            z = self._zeros[-1]
+            self._zeros.append(self._join(z, z, z, z))
+        return self._zeros[k]
+
+    def _centre(self, m):
+        """Devuelve un nodo de nivel k+1 con 'm' en el centro y borde vacío."""
+        z = self._zero(m.k - 1)
+        return self._join(self._join(z, z, z, m.a), self._join(z, z, m.b, z),
+                          self._join(z, m.c, z, z), self._join(m.d, z, z, z))
+
+    def _crop(self, m):
+        """Quita bordes vacíos mientras el patrón entre en el centro del nodo."""
+        while m.k > 3:
+            a, b, c, d = m.a, m.b, m.c, m.d
+            ring = (a.a.n + a.b.n + a.c.n + b.a.n + b.b.n + b.d.n +
+                    c.a.n + c.c.n + c.d.n + d.b.n + d.c.n + d.d.n)
+            if ring:
+                break
+            m = self._join(a.d, b.c, c.b, d.a)
+        return m
+
+    # ======== Avance en el tiempo ========
+    def _life_4x4(self, m):
+        """Nodo de nivel 2 -> centro 2x2 (nivel 1) tras una generación (reglas B3/S23)."""
+        cells = [
+            [m.a.a.n, m.a.b.n, m.b.a.n, m.b.b.n],
+            [m.a.c.n, m.a.d.n, m.b.c.n, m.b.d.n],
+            [m.c.a.n, m.c.b.n, m.d.a.n, m.d.b.n],
+            [m.c.c.n, m.c.d.n, m.d.c.n, m.d.d.n],
+        ]
+        out = []
+        for y in (1, 2):
+            for x in (1, 2):
+                n_neigh = sum(cells[y + dy][x + dx] for dy in (-1, 0, 1) for dx in (-1, 0, 1)) - cells[y][x]
+                alive = n_neigh == 3 or (cells[y][x] == 1 and n_neigh == 2)
+                out.append(ON if alive else OFF)
+        return self._join(*out)
+
+    def _successor(self, m, j):
+        """
+        Centro de 'm' (nivel k-1) avanzado 2^j generaciones, con j <= k-2.
+        Es el algoritmo recursivo de HashLife: se arman 9 subcuadrados solapados,
+        se avanzan y se combinan; si j == k-2 se avanza dos veces media distancia.
+        """
+        key = (m, j)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+
+        if m.n == 0:
+            result = m.a
+        elif m.k == 2:
+            result = self._life_4x4(m)
+        else:
+            join, succ = self._join, self._successor
+            a, b, c, d = m.a, m.b, m.c, m.d
+            c1 = succ(a, j)
+            c2 = succ(join(a.b, b.a, a.d, b.c), j)
+            c3 = succ(b, j)
+            c4 = succ(join(a.c, a.d, c.a, c.b), j)
+            c5 = succ(join(a.d, b.c, c.b, d.a), j)
+            c6 = succ(join(b.c, b.d, d.a, d.b), j)
+            c7 = succ(c, j)
+            c8 = succ(join(c.b, d.a, c.d, d.c), j)
+            c9 = succ(d, j)
+            if j < m.k - 2:
+                result = join(join(c1.d, c2.c, c4.b, c5.a), join(c2.d, c3.c, c5.b, c6.a),
+                              join(c4.d, c5.c, c7.b, c8.a), join(c5.d, c6.c, c8.b, c9.a))
+            else:
+                result = join(succ(join(c1, c2, c4, c5), j), succ(join(c2, c3, c5, c6), j),
+                              succ(join(c4, c5, c7, c8), j), succ(join(c5, c6, c8, c9), j))
+
+        self._results[key] = result
+        if len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+        return result
+
+    def _step_pow2(self, root, j):
+        """Avanza 'root' 2^j generaciones, agrandándolo lo necesario para no perder celdas."""
+        root = self._crop(root)
+        # El patrón crece como mucho 2^j celdas por lado: el resultado (la mitad
+        # central del nodo) tiene que tener lugar para el patrón más ese crecimiento.
+        target = max(root.k, j + 1) + 2
+        while root.k < target:
+            root = self._centre(root)
+        return self._successor(root, j)
+
+    def step_pow2(self, j):
+        """Salta 2^j generaciones en una sola llamada."""
+        self.root = self._crop(self._step_pow2(self.root, j))
+        self.generation += 1 << j
+        self._collect_if_needed()
+        return self
+
+    def advance(self, generations):
+        """Avanza una cantidad arbitraria de generaciones (suma de potencias de 2)."""
+        j = 0
+        while generations > 0:
+            if generations & 1:
+                self.step_pow2(j)
+            generations >>= 1
+            j += 1
+        return self
+
+    # ======== Memoria acotada ========
+    def _collect_if_needed(self):
+        if len(self._nodes) > self.max_nodes:
+            self.collect()
+
+    def collect(self):
+        """
+        Vacía la memoria de resultados y reconstruye la tabla de nodos solo con los
+        nodos alcanzables desde el universo actual; el resto queda libre.
+        """
+        self._results.clear()
+        old, self._nodes = self._nodes, {}
+        del old
+        stack = [self.root] + self._zeros[1:]
+        while stack:
+            m = stack.pop()
+            if m.k == 0:
+                continue
+            key = (m.a, m.b, m.c, m.d)
+            if key in self._nodes:
+                continue
+            self._nodes[key] = m
+            stack.extend(key)
+
+    # ======== Importar / exportar tableros densos ========
+    def load(self, state):
+        """Importa un tablero denso (como gameState) con la celda [0, 0] en (0, 0)."""
+        state = np.asarray(state)
+        nx, ny = state.shape
+        k = 3
+        while (1 << (k - 1)) < max(nx, ny):
+            k += 1
+        half = 1 << (k - 1)
+        self.root = self._crop(self._build(state, -half, -half, k))
+        self.shape = (nx, ny)
+        self.generation = 0
+        return self
+
+    def _build(self, state, x0, y0, k):
+        """Nodo de nivel k con la región de 'state' que empieza en (x0, y0)."""
+        size = 1 << k
+        nx, ny = state.shape
+        xa, xb = max(x0, 0), min(x0 + size, nx)
+        ya, yb = max(y0, 0), min(y0 + size, ny)
+        if xa >= xb or ya >= yb or not state[xa:xb, ya:yb].any():
+            return self._zero(k)
+        if k == 0:
+            return ON
+        h = size // 2
+        return self._join(self._build(state, x0, y0, k - 1), self._build(state, x0 + h, y0, k - 1),
+                          self._build(state, x0, y0 + h, k - 1), self._build(state, x0 + h, y0 + h, k - 1))
+
+    def to_array(self, x0=0, y0=0, width=None, height=None):
+        """
+        Exporta la región [x0, x0+width) x [y0, y0+height) como tablero denso uint8.
+        Por defecto exporta la misma región que se importó.
+        """
+        width = self.shape[0] if width is None else width
+        height = self.shape[1] if height is None else height
+        out = np.zeros((width, height), dtype=np.uint8)
+        half = 1 << (self.root.k - 1)
+        stack = [(self.root, -half, -half)]
+        while stack:
+            m, x, y = stack.pop()
+            size = 1 << m.k
+            if m.n == 0 or x >= x0 + width or y >= y0 + height or x + size <= x0 or y + size <= y0:
+                continue
+            if m.k == 0:
+                out[x - x0, y - y0] = 1
+                continue
+            h = size // 2
+            stack.extend(((m.a, x, y), (m.b, x + h, y), (m.c, x, y + h), (m.d, x + h, y + h)))
+        return out
+
+    def population(self):
+        """Cantidad de celdas vivas en todo el universo."""
+        return self.root.n
+
+
+if __name__ == "__main__":
+    import time
+
+    # Cañón de planeadores de Gosper
+    gun = [(24, 0), (22, 1), (24, 1), (12, 2), (13, 2), (20, 2), (21, 2), (34, 2), (35, 2),
+           (11, 3), (15, 3), (20, 3), (21, 3), (34, 3), (35, 3), (0, 4), (1, 4), (10, 4),
+           (16, 4), (20, 4), (21, 4), (0, 5), (1, 5), (10, 5), (14, 5), (16, 5), (17, 5),
+           (22, 5), (24, 5), (10, 6), (16, 6), (24, 6), (11, 7), (15, 7), (12, 8), (13, 8)]
+    gameState = np.zeros((36, 9), dtype=np.uint8)
+    for x, y in gun:
+        gameState[x, y] = 1
+
+    life = HashLife(gameState)
+    t0 = time.perf_counter()
+    life.advance(10**6)
+    elapsed = time.perf_counter() - t0
+    print(f"Generación {life.generation}: {life.population()} celdas vivas ({elapsed:.2f} s)")
+    print(f"Nodos en la tabla: {len(life._nodes)}")
@@ -0,0 +1,99 @@
+import numpy as np
+
+# Motor de simulación del Juego de la Vida sin ventana (headless).
+# Calcula una generación completa de una sola vez con NumPy sobre un toro,
+# con las mismas reglas B3/S23 que el if/elif de Juego_de_la_vida.py.
+# El tablero se indexa igual que gameState: tablero[x, y].
+
+
+def random_board(nxC, nyC, seed=None, density=0.5):
+    """Genera un tablero aleatorio de 0s y 1s (uint8) de tamaño nxC x nyC."""
+    rng = np.random.default_rng(seed)
+    return (rng.random((nxC, nyC)) < density).astype(np.uint8)
+
+
+class LifeEngine:
+    """
+    Motor vectorizado del Juego de la Vida sobre un toro.
+    Reserva los buffers una sola vez, así cada generación no pide memoria nueva:
+    - El tablero vive dentro de un buffer con un borde de 1 celda que copia la
+      fila/columna opuesta (así no hace falta usar % en los índices).
+    - Se suman las 3 filas vecinas y luego las 3 columnas vecinas (suma separable),
+      lo que da la suma del vecindario de 3x3 incluyendo la propia celda.
+    - Con esa suma N: nace/sobrevive si N == 3, o si está viva y N == 4 (B3/S23).
+    """
+
+    def __init__(self, state):
+        state = np.asarray(state)
+        if state.ndim != 2:
+            raise ValueError("El tablero debe ser una matriz de 2 dimensiones")
+        self.nxC, self.nyC = state.shape
+        self.generation = 0
+        # Dos buffers con borde de 1 celda: se lee de uno y se escribe en el otro
+        self._padded = np.zeros((self.nxC + 2, self.nyC + 2), dtype=np.uint8)
+        self._next = np.zeros_like(self._padded)
+        self._padded[1:-1, 1:-1] = state
+        self._rows = np.empty((self.nxC, self.nyC + 2), dtype=np.uint8)
+        self._count = np.empty((self.nxC, self.nyC), dtype=np.uint8)
+        self._alive = np.empty((self.nxC, self.nyC), dtype=bool)
+
+    @property
+    def state(self):
+        """Tablero actual (vista uint8 de tamaño nxC x nyC, sin el borde)."""
+        return self._padded[1:-1, 1:-1]
+
+    def step(self):
+        """Avanza una generación y devuelve el nuevo tablero (uint8)."""
+        p = self._padded
+        # Completar el borde toroidal (la fila/columna opuesta)
+        p[0, 1:-1] = p[-2, 1:-1]
+        p[-1, 1:-1] = p[1, 1:-1]
+        p[:, 0] = p[:, -2]
+        p[:, -1] = p[:, 1]
+
+        # Suma de las 3 filas (x-1, x, x+1) y después de las 3 columnas (y-1, y, y+1)
+        rows, count = self._rows, self._count
+        np.add(p[:-2], p[1:-1], out=rows)
+        rows += p[2:]
+        np.add(rows[:, :-2], rows[:, 1:-1], out=count)
+        count += rows[:, 2:]
+
+        # B3/S23 con la suma de 3x3 (incluye la celda): N == 3, o viva y N == 4
+        alive = self._alive
+        born = self._next[1:-1, 1:-1].view(bool)
+        np.equal(count, 3, out=born)
+        np.equal(count, 4, out=alive)
+        alive &= p[1:-1, 1:-1].view(bool)
+        born |= alive
+
+        self._padded, self._next = self._next, p
+        self.generation += 1
+        return self.state
+
+    def run(self, generations):
+        """Avanza 'generations' generaciones sin dibujar y devuelve el tablero final."""
+        for _ in range(generations):
+            self.step()
+        return self.state
+
+
+def step(state):
+    """Calcula la generación siguiente de 'state' sin modificarlo."""
+    return LifeEngine(state).step()
+
+
+def run(state, generations):
+    """Simula 'generations' generaciones a partir de 'state' y devuelve el tablero final."""
+    return LifeEngine(state).run(generations)
+
+
+if __name__ == "__main__":
+    import time
+
+    nx, ny, gens = 4096, 4096, 50
+    engine = LifeEngine(random_board(nx, ny, seed=0))
+    t0 = time.perf_counter()
+    engine.run(gens)
+    elapsed = time.perf_counter() - t0
+    print(f"{nx}x{ny}: {gens} generaciones en {elapsed:.2f} s ({gens / elapsed:.1f} gen/s)")
+    print(f"Celdas vivas: {int(engine.state.sum())}")
@@ -1,10 +1,13 @@
 import pygame
-import heapq
 import time
+from busqueda_grilla import GridMap, astar as grid_astar
+from jps import jps, JPSPlus
+from replanificacion import DStarLite
 
 # Configuración
 WIDTH, HEIGHT = 600, 600    # Dimensiones de la ventana
 ROWS, COLS = 17, 17          # Filas y columnas de la cuadrícula
+SEARCH = "astar"            # "astar", "jps" o "jps+" (todos dan caminos del mismo largo óptimo)
 CELL_SIZE = WIDTH // COLS       # Tamaño de cada celda
 
 # Colores
@@ -34,40 +37,51 @@ for r, c in obstacles:   # Agregar obstáculos a la cuadrícula
 
 start, end = None, None
 
+# Mapa de la grilla para las búsquedas: se crea una vez y se actualiza en toggle_wall(),
+# así JPS+ conserva sus tablas precalculadas entre consultas (las rehace solo si cambia
+# gmap.version, es decir, si se movió una pared).
+gmap = GridMap.from_rows(grid)
+jps_plus = None
+
 # --- Algoritmo A* ---
-def heuristic(a, b):            # Heurística de Manhattan
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])      # Calcula la distancia Manhattan entre dos puntos
-
-def astar(start, goal):             # Algoritmo A*
-    open_set = []
-    heapq.heappush(open_set, (0, start))
-    came_from = {}
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    while open_set:                             # Mientras haya nodos por explorar
-        _, current = heapq.heappop(open_set)       # Obtiene el nodo con menor costo
-        if current == goal:                        # Si se llega al objetivo....
-            path = []                               # Lista para almacenar el camino
-            while current in came_from:             # Retrocede por el camino
-                path.append(current)                # Se agrega el nodo actual al camino
-                current = came_from[current]        # Obtener el nodo anterior
-            return path[::-1]                       # Retornar el camino invertido
-
-        neighbors = [(0,1),(1,0),(0,-1),(-1,0)]     # Indica cuales son los mov válidos
-        for dx, dy in neighbors:
-            neighbor = (current[0] + dx, current[1] + dy)
-            if 0 <= neighbor[0] < ROWS and 0 <= neighbor[1] < COLS:     # Verifica los límites de la cuadrícula
-                if grid[neighbor[0]][neighbor[1]] == 1:             # Si es pared, se salta
-                    continue
-                tentative_g = g_score[current] + 1                  # Costo del movimiento
-                # Si encontramos un camino más barato hacia 'neighbor'...
-                if tentative_g < g_score.get(neighbor, float("inf")): 
-                    came_from[neighbor] = current                    # Se guarda el nodo actual como el anterior
-                    g_score[neighbor] = tentative_g                  # Se actualiza el costo g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, goal)     # Se actualiza el costo f  (f = g + h)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))  # Se agrega el vecino a la lista abierta
-    return None  # (Si no se encontró un camino)
+# La búsqueda en sí está en busqueda_grilla.py (arrays planos, conjunto cerrado,
+# desempate determinista), que también se puede usar sin la ventana de pygame.
+# Con SEARCH = "jps" o "jps+" se usa Jump Point Search (jps.py) sobre la misma grilla.
+# stats: opcional, un estadisticas.SearchStats (solo con SEARCH = "astar").
+def astar(start, goal, stats=None):  # Algoritmo A*
+    global jps_plus
+    if SEARCH == "jps":
+        result = jps(gmap, start, goal, diagonal=False)
+    elif SEARCH == "jps+":
+        if jps_plus is None:
+            jps_plus = JPSPlus(gmap, diagonal=False)
+        result = jps_plus.search(start, goal)
+    else:
+        result = grid_astar(gmap, start, goal, stats=stats)
+    if result is None:
+        return None  # (Si no se encontró un camino)
+    path, _ = result
+    return path[1:]  # Igual que antes: el camino sin la celda de inicio
+
+# --- Replanificación al cambiar obstáculos ---
+# Con inicio y fin elegidos, el click derecho pone o saca una pared; en lugar de
+# llamar de nuevo a astar() se repara el camino con D* Lite (replanificacion.py).
+planner = None
+
+def toggle_wall(cell):
+    global planner
+    r, c = cell
+    grid[r][c] = 0 if grid[r][c] else 1
+    gmap.set_blocked(cell, grid[r][c] == 1)     # Incrementa gmap.version
+    if not (start and end):
+        return []           # Todavía no hay camino que reparar
+    if planner is None:
+        planner = DStarLite(GridMap.from_rows(grid), start, end)
+    else:
+        planner.update_cells([(cell, grid[r][c] == 1)])
+        print(f"Replanificado: {planner.expanded} celdas re-expandidas")
+    result = planner.path()
+    return result[0][1:] if result else None
 
 # --- Dibujo ---
 def draw_grid():
@@ -123,6 +137,10 @@ while running:
         if event.type == pygame.MOUSEBUTTONDOWN: # Click del mouse
             x, y = pygame.mouse.get_pos()       # Posición en píxeles
             r, c = y // CELL_SIZE, x // CELL_SIZE   # Lo convierte a (fila, columna)
+            if event.button == 3:   # Click derecho: pone o saca una pared
+                if (r, c) not in (start, end):
+                    path = toggle_wall((r, c))
+                continue
             if not start:
                 start = (r, c)      # Primer click: fija el inicio
             elif not end:           # Segundo click: fija el final
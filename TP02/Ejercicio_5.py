@@ -1,5 +1,9 @@
 import heapq
-from collections import deque
+from collections import OrderedDict, deque
+from bidireccional import bidirectional_search, reverse_graph
+from grafo_csr import CSRGraph
+from cargar_grafo import load_graph
+from estadisticas import SearchStats, instrumented
 
 # Grafo representado como diccionario de adyacencia
 # Cada clave es un nodo y el valor es otro diccionario con sus vecinos y el costo de ir hacia ellos
@@ -28,6 +32,39 @@ goal = "F"
 # Se agregan como restricciones para los algoritmos de búsqueda
 walls = {("C","D"), ("D","E"), ("W","R"), ("T","F")}
 
+# Si se modifica 'graph' o 'walls' hay que incrementar graph_version:
+# así las heurísticas guardadas en caché para la versión anterior dejan de usarse.
+# (Un CSRGraph reconstruido con rebuild() ya cambia su propia versión: ver _graph_key.)
+graph_version = 0
+HEURISTIC_CACHE_SIZE = 32   # Objetivos en caché como máximo (cada uno es un dict del tamaño del grafo)
+_heuristic_cache = OrderedDict()   # (_graph_key(), goal) -> {nodo: distancia hasta goal}
+_reverse_cache = {}     # _graph_key() -> grafo invertido (solo el del grafo actual)
+
+
+def use_graph_file(path, walls_path=None, **options):
+    """
+    Reemplaza 'graph' por uno leído de archivo (lista de aristas o DIMACS .gr, ver
+    cargar_grafo.py). Las paredes de 'walls_path' se descartan al cargar, así que 'walls'
+    queda vacío; con cache_dir=... las cargas siguientes usan la caché binaria.
+    """
+    global graph, walls, graph_version
+    graph = load_graph(path, walls_path, **options)
+    walls = set()
+    graph_version += 1
+
+
+def _csr():
+    """
+    El grafo actual si es un CSRGraph sin paredes pendientes (ya las descartó al construirse):
+    entonces las búsquedas lo recorren por ids. Si no, None (se usa la interfaz de diccionario).
+    """
+    return graph if isinstance(graph, CSRGraph) and not walls else None
+
+
+def is_wall(a, b):
+    """True si la arista entre a y b está bloqueada por una pared (en cualquier sentido)."""
+    return (a, b) in walls or (b, a) in walls
+
 
 def maze_distance(start, goal):
     """
@@ -45,7 +82,7 @@ def maze_distance(start, goal):
         
         for neighbor in graph[node]:
             # Ignorar vecinos que estén bloqueados por paredes
-            if (node, neighbor) in walls or (neighbor, node) in walls:
+            if is_wall(node, neighbor):
                 continue
             if neighbor not in visited:
                 visited.add(neighbor)
@@ -54,81 +91,433 @@ def maze_distance(start, goal):
     # Si no hay camino posible, devolvemos infinito
     return float("inf")
 
-# Diccionario de heurística: para cada nodo precomputamos su distancia mínima al objetivo
-heuristic = {n: maze_distance(n, goal) for n in graph}
-print(heuristic)
+def _dijkstra(source, adjacency):
+    """Distancias con pesos desde 'source' siguiendo 'adjacency', sin usar aristas con pared."""
+    dist = {n: float("inf") for n in graph}
+    dist[source] = 0
+    frontier = [(0, source)]
+    while frontier:
+        d, node = heapq.heappop(frontier)
+        if d > dist[node]:
+            continue    # Entrada vieja: ya se encontró un camino más corto
+        for neighbor, w in adjacency.get(node, {}).items():
+            if is_wall(node, neighbor):
+                continue
+            if d + w < dist.get(neighbor, float("inf")):
+                dist[neighbor] = d + w
+                heapq.heappush(frontier, (d + w, neighbor))
+    return dist
+
+
+def _dijkstra_ids(csr, source):
+    """Como _dijkstra, sobre un CSRGraph y por ids: lista de distancias indexada por id."""
+    dist = [float("inf")] * len(csr)
+    dist[source] = 0
+    frontier = [(0, source)]
+    while frontier:
+        d, node = heapq.heappop(frontier)
+        if d > dist[node]:
+            continue
+        targets, weights = csr.edges(node)
+        for neighbor, w in zip(targets.tolist(), weights.tolist()):
+            if d + w < dist[neighbor]:
+                dist[neighbor] = d + w
+                heapq.heappush(frontier, (d + w, neighbor))
+    return dist
+
+
+def _graph_key():
+    """Identifica el grafo actual para las cachés: graph_version, el objeto y su propia versión."""
+    return graph_version, id(graph), getattr(graph, "version", 0)
+
+
+def reversed_graph():
+    """Grafo con las aristas invertidas (ver bidireccional.reverse_graph), una vez por grafo."""
+    key = _graph_key()
+    if key not in _reverse_cache:
+        _reverse_cache.clear()
+        _reverse_cache[key] = reverse_graph(graph)
+    return _reverse_cache[key]
+
+
+def goal_distances(goal):
+    """
+    Distancia real (con los pesos de las aristas) de cada nodo hasta 'goal',
+    respetando las paredes. Es un único Dijkstra desde 'goal' sobre el grafo
+    invertido, en lugar de un BFS por nodo como maze_distance().
+    Los nodos que no llegan a 'goal' quedan con distancia infinita.
+    Con un CSRGraph (ver _csr) devuelve una lista indexada por id en lugar de un diccionario.
+    """
+    csr = _csr()
+    if csr is not None:
+        return _dijkstra_ids(reversed_graph(), csr.ids[goal])
+    return _dijkstra(goal, reversed_graph())
+
+
+def build_heuristic(goal):
+    """
+    Heurística para Avara y A*: la distancia exacta hasta 'goal' (ver goal_distances).
+    Se calcula una sola vez por grafo y objetivo (ver _graph_key); las siguientes
+    consultas al mismo objetivo la toman de la caché. La caché guarda los últimos
+    HEURISTIC_CACHE_SIZE objetivos y descarta las de grafos anteriores.
+    """
+    key = (_graph_key(), goal)
+    if key in _heuristic_cache:
+        _heuristic_cache.move_to_end(key)
+        return _heuristic_cache[key]
+    for old in [k for k in _heuristic_cache if k[0] != key[0]]:
+        del _heuristic_cache[old]       # De otro grafo: no se van a volver a usar
+    heuristic = _heuristic_cache[key] = goal_distances(goal)
+    while len(_heuristic_cache) > HEURISTIC_CACHE_SIZE:
+        _heuristic_cache.popitem(last=False)
+    return heuristic
 
 
-def dfs(start, goal):
+def reconstruct_path(parent, node):
+    """
+    Arma el camino desde el inicio siguiendo los padres desde 'node'.
+    Las búsquedas guardan solo el padre de cada nodo, en lugar de copiar
+    el camino completo (path + [neighbor]) en cada entrada de la frontera.
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    return path[::-1]
+
+
+def smallest_path(parent, ties, start, goal, key=None):
+    """
+    Camino de A* cuando hubo empates: parent[n] y ties[n] son todos los padres con los que
+    n alcanza su menor costo. Entre esos caminos devuelve el menor en orden alfabético
+    (el que elegían las listas de la versión anterior), con una sola pasada al final:
+    se marcan los nodos desde los que se llega a 'goal' y se avanza desde 'start'
+    eligiendo siempre el menor sucesor marcado. Con nodos que son ids, 'key' da el orden
+    de sus nombres (ver CSRGraph.name_order).
+    """
+    if not ties:
+        return reconstruct_path(parent, goal)
+    succ = {goal: []}
+    pending = [goal]
+    while pending:
+        node = pending.pop()
+        for p in [parent[node]] + ties.get(node, []):
+            if p is None:
+                continue
+            if p not in succ:
+                succ[p] = []
+                pending.append(p)
+            succ[p].append(node)
+    path = [start]
+    while path[-1] != goal:
+        path.append(min(succ[path[-1]], key=key))
+    return path
+
+
+@instrumented
+def dfs(start, goal, stats=None):
     """
     Algoritmo DFS clásico (con pila).
     Explora caminos hasta encontrar la meta.
     No garantiza ser el mas optimo.
+    stats: opcional, un estadisticas.SearchStats donde se registran los contadores.
     """
-    stack = [(start, [start], 0)]  # (nodo actual, camino recorrido, costo acumulado)
-    visited = set()
-    
+    if _csr() is not None:
+        return _dfs_ids(_csr(), start, goal, stats)
+    stack = [(start, None, 0)]  # (nodo actual, nodo desde el que se llegó, costo acumulado)
+    parent = {}                 # Padre con el que se visitó cada nodo (también marca los visitados)
+
     while stack:
-        node, path, cost = stack.pop()
-        if node == goal:
-            return path, cost   
-        if node in visited: 
+        node, came_from, cost = stack.pop()
+        if node in parent:
             continue
-        visited.add(node)
-        
+        parent[node] = came_from
+        if node == goal:
+            return reconstruct_path(parent, node), cost
+
         # Se recorre en orden alfabético invertido para mantener consistencia en el recorrido
+        before = len(stack)
         for neighbor, w in sorted(graph[node].items(), reverse=True):
-            stack.append((neighbor, path + [neighbor], cost + w))
+            if not is_wall(node, neighbor):     # Las paredes se respetan igual que en avara/astar
+                stack.append((neighbor, node, cost + w))
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += len(stack) - before
+            stats.peak_frontier = max(stats.peak_frontier, len(stack))
     return None
 
-def avara(start, goal):
+
+def _dfs_ids(csr, start, goal, stats):
+    """dfs sobre un CSRGraph por ids; los nombres se traducen solo al entrar y al salir."""
+    names = csr.names
+    s, t = csr.ids[start], csr.ids[goal]
+    stack = [(s, None, 0)]
+    parent = [None] * len(csr)
+    visited = bytearray(len(csr))
+
+    while stack:
+        node, came_from, cost = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        parent[node] = came_from
+        if node == t:
+            return [names[i] for i in reconstruct_path(parent, node)], cost
+
+        # sorted_edges ya está en orden alfabético: se apila al revés, como sorted(..., reverse=True)
+        before = len(stack)
+        targets, weights = csr.sorted_edges(node)
+        for neighbor, w in zip(targets.tolist()[::-1], weights.tolist()[::-1]):
+            stack.append((neighbor, node, cost + w))
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += len(stack) - before
+            stats.peak_frontier = max(stats.peak_frontier, len(stack))
+    return None
+
+@instrumented
+def avara(start, goal, stats=None):
     """
     Algoritmo avara.
     Siempre expande el nodo cuya heurística es menor.
     NO garantiza el camino óptimo porque ignora el costo real recorrido.
+    A igual heurística se expande primero el de menor nombre (como con las tuplas de antes).
+    stats: opcional, un estadisticas.SearchStats donde se registran los contadores.
     """
-    frontier = [(heuristic[start], start, [start], 0)]  # (h(n), nodo, camino, costo real)
+    if _csr() is not None:
+        return _avara_ids(_csr(), start, goal, stats)
+    heuristic = build_heuristic(goal)
+    if heuristic.get(start, float("inf")) == float("inf"):
+        return None     # La heurística es la distancia exacta: 'start' no llega a 'goal'
+    frontier = [(heuristic[start], start)]  # (h(n), nodo): una sola entrada por nodo
+    parent = {start: None}   # Padre con el que cada nodo entró a la frontera
+    cost = {start: 0}        # Costo real del camino hasta cada nodo
     visited = set()
-    
+
     while frontier:
-        _, node, path, cost = heapq.heappop(frontier)  # Elige siempre el de menor heurística
+        _, node = heapq.heappop(frontier)  # Elige siempre el de menor heurística
         if node == goal:
-            return path, cost
-        
-        if node in visited: 
+            return reconstruct_path(parent, node), cost[node]
+
+        if node in visited:
             continue
         visited.add(node)
-        
+        if stats is not None:
+            stats.expanded += 1
+
         for neighbor, w in graph[node].items():
-            heapq.heappush(frontier, (heuristic[neighbor], neighbor, path+[neighbor], cost+w))
+            if is_wall(node, neighbor) or heuristic[neighbor] == float("inf"):
+                continue    # Con h infinita el vecino no llega a 'goal'
+            # Con la heurística exacta cada expansión deja en la frontera un vecino de h menor,
+            # así que los nodos salen con h estrictamente decreciente: un nodo que llega a
+            # expandirse no pudo recibir un segundo padre antes. Alcanza con el primero.
+            if neighbor not in parent:
+                parent[neighbor] = node
+                cost[neighbor] = cost[node] + w
+                heapq.heappush(frontier, (heuristic[neighbor], neighbor))
+                if stats is not None:
+                    stats.generated += 1
+                    stats.peak_frontier = max(stats.peak_frontier, len(frontier))
     return None
 
-def astar(start, goal):
+
+def _avara_ids(csr, start, goal, stats):
+    """avara sobre un CSRGraph por ids; en la frontera va la posición alfabética del nombre."""
+    names = csr.names
+    order, rank = csr.name_order()
+    heuristic = build_heuristic(goal)    # Lista indexada por id (ver goal_distances)
+    s, t = csr.ids[start], csr.ids[goal]
+    inf = float("inf")
+    if heuristic[s] == inf:
+        return None
+    frontier = [(heuristic[s], rank[s])]
+    parent = [None] * len(csr)
+    cost = [0] * len(csr)
+    seen = bytearray(len(csr))          # Ya entró a la frontera (tiene padre)
+    seen[s] = 1
+    visited = bytearray(len(csr))
+
+    while frontier:
+        node = order[heapq.heappop(frontier)[1]]
+        if node == t:
+            return [names[i] for i in reconstruct_path(parent, node)], cost[node]
+        if visited[node]:
+            continue
+        visited[node] = 1
+        if stats is not None:
+            stats.expanded += 1
+
+        targets, weights = csr.edges(node)
+        for neighbor, w in zip(targets.tolist(), weights.tolist()):
+            if seen[neighbor] or heuristic[neighbor] == inf:
+                continue
+            seen[neighbor] = 1
+            parent[neighbor] = node
+            cost[neighbor] = cost[node] + w
+            heapq.heappush(frontier, (heuristic[neighbor], rank[neighbor]))
+            if stats is not None:
+                stats.generated += 1
+                stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+    return None
+
+@instrumented
+def astar(start, goal, stats=None):
     """
     Algoritmo A*.
     Combina el costo real g(n) con la heurística h(n).
     Siempre expande el nodo con menor f(n) = g(n) + h(n).
     Garantiza ser el mas optimo si la heurística es admisible.
+    A igual f se prefiere menor g y, después, el de menor nombre; entre caminos de igual
+    costo se devuelve el menor en orden alfabético (ver smallest_path).
+    stats: opcional, un estadisticas.SearchStats donde se registran los contadores.
     """
-    frontier = [(heuristic[start], 0, start, [start])]  # (f, g, nodo, camino)
-    visited = {}  # Guarda el costo g más bajo con el que se visitó un nodo
-    
+    if _csr() is not None:
+        return _astar_ids(_csr(), start, goal, stats)
+    heuristic = build_heuristic(goal)
+    if heuristic.get(start, float("inf")) == float("inf"):
+        return None     # La heurística es la distancia exacta: 'start' no llega a 'goal'
+    frontier = [(heuristic[start], 0, start)]  # (f, g, nodo)
+    best_g = {start: 0}    # Costo g más bajo encontrado para cada nodo
+    parent = {start: None}
+    ties = {}              # Otros padres con el mismo g más bajo (solo si hay empates)
+    expanded = set()
+    ever_expanded = set() if stats is not None else None   # Solo para contar re-expansiones
+
     while frontier:
-        f, g, node, path = heapq.heappop(frontier)
+        f, g, node = heapq.heappop(frontier)
+        if g > best_g[node] or node in expanded:
+            continue    # Entrada vieja: ya se encontró un camino más barato
         if node == goal:
-            return path, g
-        
-        # Si ya encontramos un camino más barato antes, no seguimos este
-        if node in visited and visited[node] <= g:
-            continue
-        visited[node] = g
-        
+            return smallest_path(parent, ties, start, node), g
+        expanded.add(node)
+        if stats is not None:
+            stats.expanded += 1
+            if node in ever_expanded:
+                stats.reexpanded += 1
+            ever_expanded.add(node)
+
         for neighbor, w in graph[node].items():
+            if is_wall(node, neighbor):
+                continue    # Sin esto la heurística (que respeta las paredes) podría sobreestimar
+            if heuristic[neighbor] == float("inf"):
+                continue    # Desde ese vecino no se llega a 'goal'
+            g2 = g + w
+            old_g = best_g.get(neighbor, float("inf"))
+            if g2 < old_g:
+                best_g[neighbor] = g2
+                parent[neighbor] = node
+                ties.pop(neighbor, None)
+                expanded.discard(neighbor)
+                f2 = g2 + heuristic[neighbor]
+                heapq.heappush(frontier, (f2, g2, neighbor))
+                if stats is not None:
+                    stats.generated += 1
+                    stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+            elif g2 == old_g and neighbor not in expanded:
+                ties.setdefault(neighbor, []).append(node)   # Empate: se resuelve al final
+    return None
+
+
+def _astar_ids(csr, start, goal, stats):
+    """astar sobre un CSRGraph por ids; en la frontera va la posición alfabética del nombre."""
+    names = csr.names
+    order, rank = csr.name_order()
+    heuristic = build_heuristic(goal)    # Lista indexada por id (ver goal_distances)
+    s, t = csr.ids[start], csr.ids[goal]
+    inf = float("inf")
+    if heuristic[s] == inf:
+        return None
+    frontier = [(heuristic[s], 0, rank[s])]    # (f, g, posición del nombre)
+    best_g = [inf] * len(csr)
+    best_g[s] = 0
+    parent = [None] * len(csr)
+    ties = {}
+    expanded = bytearray(len(csr))
+    ever_expanded = bytearray(len(csr)) if stats is not None else None
+
+    while frontier:
+        f, g, r = heapq.heappop(frontier)
+        node = order[r]
+        if g > best_g[node] or expanded[node]:
+            continue
+        if node == t:
+            path = smallest_path(parent, ties, s, node, key=rank.__getitem__)
+            return [names[i] for i in path], g
+        expanded[node] = 1
+        if stats is not None:
+            stats.expanded += 1
+            if ever_expanded[node]:
+                stats.reexpanded += 1
+            ever_expanded[node] = 1
+
+        targets, weights = csr.edges(node)
+        for neighbor, w in zip(targets.tolist(), weights.tolist()):
+            h = heuristic[neighbor]
+            if h == inf:
+                continue
             g2 = g + w
-            f2 = g2 + heuristic[neighbor]
-            heapq.heappush(frontier, (f2, g2, neighbor, path+[neighbor]))
+            old_g = best_g[neighbor]
+            if g2 < old_g:
+                best_g[neighbor] = g2
+                parent[neighbor] = node
+                ties.pop(neighbor, None)
+                expanded[neighbor] = 0
+                heapq.heappush(frontier, (g2 + h, g2, rank[neighbor]))
+                if stats is not None:
+                    stats.generated += 1
+                    stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+            elif g2 == old_g and not expanded[neighbor]:
+                ties.setdefault(neighbor, []).append(node)
     return None
 
-print("DFS:", dfs("I", "F"))
-print("Avara:", avara("I", "F"))
-print("A*:", astar("I", "F"))
+def astar_bidireccional(start, goal):
+    """
+    A* bidireccional (ver bidireccional.py).
+    Busca a la vez desde 'start' y hacia atrás desde 'goal' (con el grafo invertido,
+    porque las aristas tienen sentido: W->I cuesta 30 pero I->W cuesta 1).
+    Devuelve (camino, costo, (expandidos desde start, expandidos desde goal)).
+    Por consulta no se recorre el grafo entero: la heurística hacia 'goal' y el grafo
+    invertido salen de la caché, la cota hacia 'start' es 0 y las paredes se saltean
+    al generar los vecinos.
+    """
+    h_goal = build_heuristic(goal)        # Distancia exacta n -> goal
+    if _csr() is not None:
+        ids, distances = graph.ids, h_goal    # Lista indexada por id (ver goal_distances)
+
+        def h_goal_of(n):
+            return distances[ids[n]]
+    else:
+        def h_goal_of(n):
+            return h_goal.get(n, float("inf"))
+    reverse = reversed_graph()
+
+    def forward(u):
+        return ((v, w) for v, w in graph.get(u, {}).items() if not is_wall(u, v))
+
+    def backward(v):
+        return ((u, w) for u, w in reverse.get(v, {}).items() if not is_wall(u, v))
+
+    return bidirectional_search(start, goal, forward, backward, h_goal_of, lambda n: 0)
+
+if __name__ == "__main__":
+    print(build_heuristic(goal))
+    print("DFS:", dfs("I", goal))
+    print("Avara:", avara("I", goal))
+    print("A*:", astar("I", goal))
+    print("A* bidireccional:", astar_bidireccional("I", goal))
+
+    # Comparación con números: nodos generados/expandidos, frontera, tiempo y memoria
+    for name, search in (("DFS", dfs), ("Avara", avara), ("A*", astar)):
+        stats = SearchStats(memory=True)
+        search("I", goal, stats=stats)
+        print(f"{name}: {stats}")
+
+    # Los mismos algoritmos sobre el grafo en formato CSR (grafo_csr.py): ids enteros,
+    # arrays de NumPy y las paredes ya descartadas al construirlo (por eso 'walls' queda vacío).
+    graph = CSRGraph(graph, walls)
+    walls = set()
+    graph_version += 1
+    print("DFS (CSR):", dfs("I", goal))
+    print("Avara (CSR):", avara("I", goal))
+    print("A* (CSR):", astar("I", goal))
+    print("A* bidireccional (CSR):", astar_bidireccional("I", goal))
@@ -0,0 +1,155 @@
+import heapq
+import math
+from itertools import count
+from busqueda_grilla import grid_heuristic, neighbours
+
+# Búsqueda bidireccional (A* o Dijkstra): una búsqueda avanza desde el inicio y otra
+# hacia atrás desde el objetivo, hasta que se encuentran. En grafos grandes cada una
+# explora una "bola" de la mitad del radio, en lugar de una sola bola de radio completo.
+# - Con heurística se usan potenciales promedio: p(v) = (h_objetivo(v) - h_inicio(v)) / 2
+#   hacia adelante y -p(v) hacia atrás, así las dos búsquedas ven los mismos costos reducidos.
+# - Criterio de parada: cuando tope_adelante + tope_atrás >= mu (mejor camino encontrado),
+#   ningún camino sin revisar puede ser más corto que mu.
+# Sirve para el GridMap de busqueda_grilla.py y para grafos como el de Ejercicio_5.py.
+
+
+def bidirectional_search(start, goal, forward, backward, h_goal=None, h_start=None):
+    """
+    Motor genérico. Los nodos pueden ser cualquier valor hasheable.
+    - forward(u): genera (v, costo) por cada arista u -> v.
+    - backward(v): genera (u, costo) por cada arista u -> v (el grafo invertido).
+    - h_goal(v), h_start(v): cotas consistentes de dist(v, goal) y dist(start, v);
+      si faltan, es Dijkstra bidireccional.
+    Devuelve (camino, costo, (expandidos adelante, expandidos atrás)) o None.
+    """
+    if h_goal is None or h_start is None:
+        def p(v):
+            return 0.0
+    else:
+        def p(v):
+            return (h_goal(v) - h_start(v)) / 2
+
+    # Cada lado: costos g, padres, cerrados, cola y signo del potencial
+    sides = []
+    for root, sign, step in ((start, 1, forward), (goal, -1, backward)):
+        key = sign * p(root)
+        sides.append({"g": {root: 0}, "parent": {root: None}, "closed": set(),
+                      "open": [(key, 0, root)], "sign": sign, "step": step, "expanded": 0})
+    tie = count(1)
+    # mu empieza en infinito solo como cota: el costo devuelto siempre es una suma de g
+    # (de los costos de las aristas), así que tiene su mismo tipo (int con pesos enteros)
+    mu, meeting = (0, start) if start == goal else (math.inf, None)
+
+    def top(side):
+        """Clave mínima vigente de la cola de ese lado (descarta entradas viejas)."""
+        heap = side["open"]
+        while heap and heap[0][2] in side["closed"]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else math.inf
+
+    while True:
+        top_f, top_b = top(sides[0]), top(sides[1])
+        if top_f == math.inf or top_b == math.inf or top_f + top_b >= mu:
+            break
+        # Se avanza el lado con la cola más chica (reparte el trabajo entre los dos)
+        side, other = (sides[0], sides[1]) if len(sides[0]["open"]) <= len(sides[1]["open"]) \
+            else (sides[1], sides[0])
+        _, _, u = heapq.heappop(side["open"])
+        side["closed"].add(u)
+        side["expanded"] += 1
+        g, parent, sign = side["g"], side["parent"], side["sign"]
+        for v, cost in side["step"](u):
+            if v in side["closed"]:
+                continue
+            g2 = g[u] + cost
+            if g2 < g.get(v, math.inf):
+                pv = p(v)
+                if math.isinf(pv) or math.isnan(pv):
+                    continue             # v no conecta el inicio con el objetivo
+                g[v] = g2
+                parent[v] = u
+                heapq.heappush(side["open"], (g2 + sign * pv, next(tie), v))
+            if v in other["g"] and g[v] + other["g"][v] < mu:
+                mu, meeting = g[v] + other["g"][v], v
+
+    if meeting is None:
+        return None
+    path, v = [], meeting
+    while v is not None:
+        path.append(v)
+        v = sides[0]["parent"][v]
+    path.reverse()
+    v = sides[1]["parent"][meeting]
+    while v is not None:
+        path.append(v)
+        v = sides[1]["parent"][v]
+    return path, mu, (sides[0]["expanded"], sides[1]["expanded"])
+
+
+def grid_bidirectional(gmap, start, goal, diagonal=False, heuristic=True):
+    """
+    A* bidireccional sobre un GridMap (Dijkstra bidireccional con heuristic=False).
+    Devuelve (camino, costo, (expandidos adelante, expandidos atrás)) o None,
+    con el mismo costo que busqueda_grilla.astar().
+    """
+    s, t = gmap.index(start), gmap.index(goal)
+    if gmap.blocked[t]:
+        return None
+
+    def step(i):
+        return neighbours(gmap, i, diagonal)
+
+    h_goal = h_start = None
+    if heuristic:
+        h_goal = grid_heuristic(gmap, goal, diagonal)
+        h_start = grid_heuristic(gmap, start, diagonal)
+    # La grilla no es dirigida: el grafo invertido es el mismo
+    result = bidirectional_search(s, t, step, step, h_goal, h_start)
+    if result is None:
+        return None
+    path, cost, expanded = result
+    return [gmap.cell(i) for i in path], cost, expanded
+
+
+def reverse_graph(graph):
+    """Grafo con las aristas invertidas: {v: {u: costo}} por cada arista u -> v."""
+    if hasattr(graph, "reverse"):
+        return graph.reverse()           # grafo_csr.CSRGraph ya sabe invertirse
+    reverse = {node: {} for node in graph}
+    for u, edges in graph.items():
+        for v, w in edges.items():
+            reverse.setdefault(v, {})[u] = w
+    return reverse
+
+
+def graph_bidirectional(graph, start, goal, h_goal=None, h_start=None):
+    """
+    Búsqueda bidireccional sobre un grafo dirigido {nodo: {vecino: costo}}.
+    h_goal / h_start: funciones (por ejemplo dict.get) con cotas de dist(v, goal) y dist(start, v).
+    """
+    reverse = reverse_graph(graph)
+    return bidirectional_search(start, goal,
+                                lambda u: graph.get(u, {}).items(),
+                                lambda v: reverse.get(v, {}).items(),
+                                h_goal, h_start)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from busqueda_grilla import GridMap, astar
+
+    random.seed(0)
+    size = 600
+    gmap = GridMap(size, size, bytes(1 if random.random() < 0.2 else 0 for _ in range(size * size)))
+    start, goal = (0, 0), (size - 1, size - 1)
+    gmap.blocked[0] = gmap.blocked[-1] = 0
+    t0 = time.perf_counter()
+    ref = astar(gmap, start, goal)
+    t_astar = time.perf_counter() - t0
+    for heuristic in (False, True):
+        t0 = time.perf_counter()
+        path, cost, (fw, bw) = grid_bidirectional(gmap, start, goal, heuristic=heuristic)
+        name = "A*" if heuristic else "Dijkstra"
+        print(f"{name} bidireccional: costo {cost:.0f} (A*: {ref[1]:.0f}), "
+              f"{fw} + {bw} expandidos, {time.perf_counter() - t0:.2f} s (A*: {t_astar:.2f} s)")
@@ -0,0 +1,179 @@
+import heapq
+import math
+from array import array
+from itertools import count
+from estadisticas import instrumented
+
+# Búsqueda de caminos en grillas, sin ventana de pygame.
+# Misma idea que astar() de Camino_dos_puntos.py, pero pensado para mapas grandes:
+# cada celda (fila, columna) se identifica con un índice entero fila * cols + columna,
+# y los costos g, los padres y el conjunto cerrado se guardan en arrays planos
+# en lugar de diccionarios con tuplas como clave.
+
+SQRT2 = math.sqrt(2)
+MOVES_4 = [(0, 1, 1.0), (1, 0, 1.0), (0, -1, 1.0), (-1, 0, 1.0)]    # Igual orden que Camino_dos_puntos.py
+MOVES_8 = MOVES_4 + [(1, 1, SQRT2), (1, -1, SQRT2), (-1, -1, SQRT2), (-1, 1, SQRT2)]
+
+
+class GridMap:
+    """Grilla de rows x cols; blocked[i] == 1 si la celda de índice i es pared."""
+
+    def __init__(self, rows, cols, blocked=None):
+        self.rows, self.cols = rows, cols
+        self.blocked = bytearray(rows * cols) if blocked is None else bytearray(blocked)
+        if len(self.blocked) != rows * cols:
+            raise ValueError("El tamaño de 'blocked' no coincide con rows * cols")
+        self.version = 0   # Se incrementa cada vez que cambia una pared
+
+    @classmethod
+    def from_rows(cls, grid):
+        """Crea el mapa a partir de una lista de listas como la 'grid' de Camino_dos_puntos.py."""
+        rows, cols = len(grid), len(grid[0])
+        return cls(rows, cols, bytes(1 if v else 0 for row in grid for v in row))
+
+    @classmethod
+    def from_array(cls, grid):
+        """Crea el mapa a partir de un array de NumPy (distinto de 0 = pared)."""
+        rows, cols = grid.shape
+        return cls(rows, cols, (grid != 0).astype("uint8").tobytes())
+
+    def index(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def cell(self, i):
+        return divmod(i, self.cols)
+
+    def in_bounds(self, cell):
+        return 0 <= cell[0] < self.rows and 0 <= cell[1] < self.cols
+
+    def is_blocked(self, cell):
+        return self.blocked[self.index(cell)] == 1
+
+    def set_blocked(self, cell, value=True):
+        self.blocked[self.index(cell)] = 1 if value else 0
+        self.version += 1
+
+
+def octile(dr, dc):
+    """Distancia exacta en una grilla vacía con movimientos en 8 direcciones."""
+    return dr + dc + (SQRT2 - 2) * min(dr, dc)
+
+
+def grid_heuristic(gmap, goal, diagonal=False):
+    """Heurística admisible y consistente hacia 'goal': Manhattan (4 dir.) u octil (8 dir.)."""
+    cols = gmap.cols
+    gr, gc = divmod(gmap.index(goal), cols)
+    if diagonal:
+        def h(i):
+            r, c = divmod(i, cols)
+            return octile(abs(r - gr), abs(c - gc))
+    else:
+        def h(i):
+            r, c = divmod(i, cols)
+            return abs(r - gr) + abs(c - gc)
+    return h
+
+
+def neighbours(gmap, i, diagonal=False):
+    """Vecinos transitables de la celda i: genera (índice, costo). En diagonal no se cortan esquinas."""
+    cols, blocked = gmap.cols, gmap.blocked
+    r, c = divmod(i, cols)
+    for dr, dc, cost in (MOVES_8 if diagonal else MOVES_4):
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < gmap.rows and 0 <= nc < cols):
+            continue
+        j = nr * cols + nc
+        if blocked[j]:
+            continue
+        if dr and dc and (blocked[r * cols + nc] or blocked[nr * cols + c]):
+            continue
+        yield j, cost
+
+
+def reconstruct(gmap, parent, i):
+    """Arma el camino (lista de celdas desde el inicio) siguiendo los padres desde i."""
+    path = []
+    while i != -1:
+        path.append(gmap.cell(i))
+        i = parent[i]
+    return path[::-1]
+
+
+@instrumented
+def astar(gmap, start, goal, diagonal=False, heuristic=None, stats=None):
+    """
+    A* sobre un GridMap. Devuelve (camino, costo), con el camino desde 'start' hasta
+    'goal' inclusive, o None si no hay camino.
+    - Nodos repetidos en la cola (entradas viejas) se descartan con el conjunto cerrado.
+    - Desempate determinista: a igual f se prefiere menor h y, después, el que entró primero.
+    - heuristic: opcional, función índice -> cota inferior del costo hasta 'goal'
+      (debe ser consistente); por defecto Manhattan u octil según 'diagonal'.
+    - stats: opcional, un estadisticas.SearchStats donde se registran los contadores.
+    """
+    n = gmap.rows * gmap.cols
+    s, t = gmap.index(start), gmap.index(goal)
+    if gmap.blocked[t]:
+        return None
+    h = heuristic or grid_heuristic(gmap, goal, diagonal)
+    rows, cols, blocked = gmap.rows, gmap.cols, gmap.blocked
+    moves = MOVES_8 if diagonal else MOVES_4
+
+    g = array("d", [math.inf]) * n
+    parent = array("i" if n < 2**31 else "q", [-1]) * n
+    closed = bytearray(n)
+    tie = count()
+    g[s] = 0.0
+    hs = h(s)
+    open_set = [(hs, hs, next(tie), s)]
+
+    while open_set:
+        _, _, _, current = heapq.heappop(open_set)
+        if closed[current]:
+            continue                 # Entrada vieja: ya se expandió con un costo menor
+        if current == t:
+            return reconstruct(gmap, parent, t), g[t]
+        closed[current] = 1
+        if stats is not None:
+            stats.expanded += 1
+
+        r, c = divmod(current, cols)
+        gc = g[current]
+        for dr, dc, cost in moves:
+            nr, nc = r + dr, c + dc
+            if not (0 <= nr < rows and 0 <= nc < cols):
+                continue
+            j = nr * cols + nc
+            if blocked[j] or closed[j]:
+                continue
+            if dr and dc and (blocked[r * cols + nc] or blocked[nr * cols + c]):
+                continue             # No cortar esquinas en diagonal
+            tentative_g = gc + cost
+            if tentative_g < g[j]:
+                g[j] = tentative_g
+                parent[j] = current
+                hj = h(j)
+                heapq.heappush(open_set, (tentative_g + hj, hj, next(tie), j))
+                if stats is not None:
+                    stats.generated += 1
+                    stats.peak_frontier = max(stats.peak_frontier, len(open_set))
+    return None
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    random.seed(0)
+    size = 2000
+    gmap = GridMap(size, size, bytes(1 if random.random() < 0.2 else 0 for _ in range(size * size)))
+    start, goal = (0, 0), (size - 1, size - 1)
+    gmap.blocked[gmap.index(start)] = gmap.blocked[gmap.index(goal)] = 0
+    for diagonal in (False, True):
+        t0 = time.perf_counter()
+        result = astar(gmap, start, goal, diagonal)
+        elapsed = time.perf_counter() - t0
+        moves = 8 if diagonal else 4
+        if result is None:
+            print(f"{moves} direcciones: sin camino ({elapsed:.2f} s)")
+        else:
+            print(f"{moves} direcciones: costo {result[1]:.1f}, {len(result[0])} celdas ({elapsed:.2f} s)")
@@ -0,0 +1,164 @@
+import json
+import os
+from array import array
+import numpy as np
+from grafo_csr import CSRGraph
+
+# Carga de grafos desde archivos, para no depender de los diccionarios escritos a mano
+# en Ejercicio_5.py (o del grafo de colorear de TP03/TP3.ipynb).
+# Formatos (se leen línea por línea, sin cargar el texto entero en memoria):
+#   - Lista de aristas: "origen destino [costo]" por línea (costo 1 si falta);
+#     las líneas vacías o que empiezan con '#' o '%' se ignoran.
+#   - DIMACS (.gr, como los mapas de rutas del 9th DIMACS Challenge):
+#     "c ..." comentarios, "p sp nodos aristas" encabezado y "a origen destino costo".
+#   - Paredes: archivo aparte con "a b" por línea (se bloquea la arista en los dos sentidos).
+# El resultado es un grafo_csr.CSRGraph. Con cache_dir se guardan los arrays como .npy
+# y las siguientes cargas los abren mapeados en memoria (mmap) en lugar de volver a leer el texto.
+
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and line[0] not in "#%":
+                yield line.split()
+
+
+def iter_edges(path, fmt=None):
+    """Genera (origen, destino, costo) de un archivo; fmt = "edges" o "dimacs" (por extensión si falta)."""
+    fmt = fmt or ("dimacs" if path.endswith(".gr") else "edges")
+    if fmt == "dimacs":
+        for parts in _lines(path):
+            if parts[0] == "a":
+                yield parts[1], parts[2], float(parts[3])
+            elif parts[0] not in ("c", "p"):
+                raise ValueError(f"Línea DIMACS desconocida en {path}: {' '.join(parts)}")
+    elif fmt == "edges":
+        for parts in _lines(path):
+            yield parts[0], parts[1], float(parts[2]) if len(parts) > 2 else 1.0
+    else:
+        raise ValueError(f"Formato desconocido: {fmt!r}")
+
+
+def read_walls(path):
+    """Conjunto de paredes {(a, b)} leído de un archivo con "a b" por línea."""
+    return {(parts[0], parts[1]) for parts in _lines(path)}
+
+
+def build_csr(edges, walls=(), undirected=False):
+    """
+    Arma un CSRGraph a partir de un iterable de (origen, destino, costo), sin pasar por
+    diccionarios de adyacencia: los ids y costos se van guardando en arrays compactos.
+    undirected=True agrega también cada arista en sentido contrario.
+    """
+    blocked = set(walls) | {(b, a) for a, b in walls}
+    ids, names = {}, []
+    sources, targets, weights = array("i"), array("i"), array("d")
+    for u, v, w in edges:
+        for name in (u, v):
+            if name not in ids:
+                ids[name] = len(names)
+                names.append(name)
+        if (u, v) in blocked:
+            continue
+        sources.append(ids[u])
+        targets.append(ids[v])
+        weights.append(w)
+        if undirected:
+            sources.append(ids[v])
+            targets.append(ids[u])
+            weights.append(w)
+
+    src = np.frombuffer(sources, dtype=np.int32)
+    order = np.argsort(src, kind="stable")        # Agrupa las aristas por origen
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=len(names)), out=offsets[1:])
+    w = np.frombuffer(weights, dtype=np.float64)[order]
+    if np.array_equal(w, np.round(w)):
+        w = w.astype(np.int64)                    # Costos enteros, como en Ejercicio_5.py
+    return CSRGraph.from_arrays(names, offsets, np.frombuffer(targets, dtype=np.int32)[order], w)
+
+
+def _source_info(*paths):
+    """Tamaño y fecha de los archivos de origen: si cambian, la caché ya no vale."""
+    return [[os.path.abspath(p), os.path.getsize(p), os.path.getmtime(p)] for p in paths if p]
+
+
+def save_cache(graph, cache_dir, info=None):
+    """Guarda los arrays del grafo como .npy (los nombres, como un bloque de texto UTF-8)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(os.path.join(cache_dir, "offsets.npy"), graph.offsets)
+    np.save(os.path.join(cache_dir, "targets.npy"), graph.targets)
+    np.save(os.path.join(cache_dir, "weights.npy"), graph.weights)
+    blob = "\n".join(graph.names).encode("utf-8")
+    np.save(os.path.join(cache_dir, "names.npy"), np.frombuffer(blob, dtype=np.uint8))
+    with open(os.path.join(cache_dir, "meta.json"), "w") as f:
+        json.dump({"nodes": len(graph.names), "sources": info}, f)
+
+
+def load_cache(cache_dir, info=None):
+    """Abre una caché de save_cache() con mmap; None si no existe o no coincide con 'info'."""
+    try:
+        with open(os.path.join(cache_dir, "meta.json")) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if info is not None and meta["sources"] != info:
+        return None
+
+    def npy(name):
+        return np.load(os.path.join(cache_dir, name + ".npy"), mmap_mode="r")
+
+    blob = npy("names").tobytes().decode("utf-8")
+    names = blob.split("\n") if meta["nodes"] else []
+    return CSRGraph.from_arrays(names, npy("offsets"), npy("targets"), npy("weights"))
+
+
+def load_graph(path, walls=None, fmt=None, undirected=False, cache_dir=None):
+    """
+    Lee un grafo de 'path' (y las paredes de 'walls', si se indica) como CSRGraph.
+    Con cache_dir, reutiliza la caché binaria si los archivos no cambiaron y si no la crea.
+    """
+    info = _source_info(path, walls) + [[fmt, undirected]]
+    if cache_dir is not None:
+        graph = load_cache(cache_dir, info)
+        if graph is not None:
+            return graph
+    graph = build_csr(iter_edges(path, fmt), read_walls(walls) if walls else (), undirected)
+    if cache_dir is not None:
+        save_cache(graph, cache_dir, info)
+    return graph
+
+
+def write_edge_list(graph, path):
+    """
+    Escribe un grafo en memoria como lista de aristas. Acepta {nodo: {vecino: costo}}
+    (Ejercicio_5.py) o {nodo: [vecinos]} (el grafo de colorear de TP3.ipynb, costo 1).
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for u, edges in graph.items():
+            items = edges.items() if hasattr(edges, "items") else ((v, 1) for v in edges)
+            for v, w in items:
+                f.write(f"{u} {v} {w}\n")
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+
+    # Archivo DIMACS sintético de un millón de aristas
+    random.seed(0)
+    n, m = 200_000, 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rutas.gr")
+        with open(path, "w") as f:
+            f.write(f"c grafo de prueba\np sp {n} {m}\n")
+            for _ in range(m):
+                f.write(f"a {random.randint(1, n)} {random.randint(1, n)} {random.randint(1, 100)}\n")
+        cache = os.path.join(tmp, "cache")
+        for attempt in ("primera carga (texto)", "segunda carga (caché mmap)"):
+            t0 = time.perf_counter()
+            graph = load_graph(path, cache_dir=cache)
+            print(f"{attempt}: {len(graph)} nodos, {len(graph.targets)} aristas, "
+                  f"{time.perf_counter() - t0:.2f} s")
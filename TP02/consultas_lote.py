@@ -0,0 +1,117 @@
+import os
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from grafo_csr import CSRGraph
+from cargar_grafo import load_cache, save_cache
+import Ejercicio_5
+
+# Consultas en lote para los algoritmos de Ejercicio_5.py: miles de (inicio, fin, algoritmo)
+# repartidos en un pool de procesos.
+# - Las consultas se agrupan por objetivo, así cada proceso calcula la heurística de ese
+#   objetivo una sola vez (build_heuristic la guarda en caché).
+# - El grafo no viaja con cada tarea: se guarda una vez como caché binaria de
+#   cargar_grafo.py y cada proceso la abre con mmap (el sistema comparte esas páginas).
+# - Los resultados se devuelven con un generador, a medida que terminan los grupos.
+
+ALGORITHMS = {
+    "dfs": Ejercicio_5.dfs,
+    "avara": Ejercicio_5.avara,
+    "astar": Ejercicio_5.astar,
+    "bidireccional": Ejercicio_5.astar_bidireccional,
+}
+
+
+def _use_graph(graph):
+    """Instala 'graph' (ya sin paredes) como el grafo de Ejercicio_5 en este proceso."""
+    Ejercicio_5.graph = graph
+    Ejercicio_5.walls = set()
+    Ejercicio_5.graph_version += 1
+
+
+def _attach(cache_dir):
+    """Inicializador de cada proceso del pool: abre el grafo compartido (solo lectura)."""
+    _use_graph(load_cache(cache_dir))
+
+
+def _solve_group(goal, items):
+    """Resuelve todas las consultas de un mismo objetivo: lista de (índice, (inicio, fin, algoritmo), resultado)."""
+    Ejercicio_5.build_heuristic(goal)
+    return [(i, (start, goal, algorithm), ALGORITHMS[algorithm](start, goal))
+            for i, start, algorithm in items]
+
+
+def _groups(queries, workers):
+    """
+    Agrupa las consultas por objetivo. Un objetivo se reparte en varios grupos solo si hay
+    menos objetivos que procesos (cada grupo repite el cálculo de la heurística).
+    """
+    by_goal = defaultdict(list)
+    for i, (start, goal, algorithm) in enumerate(queries):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Algoritmo desconocido: {algorithm!r} (usar {', '.join(ALGORITHMS)})")
+        by_goal[goal].append((i, start, algorithm))
+    parts = -(-workers // max(len(by_goal), 1))
+    for goal, items in by_goal.items():
+        size = -(-len(items) // parts)
+        for k in range(0, len(items), size):
+            yield goal, items[k:k + size]
+
+
+def run_batch(queries, graph=None, walls=None, workers=None):
+    """
+    Resuelve 'queries' = [(inicio, fin, algoritmo), ...] y genera (índice, consulta, resultado)
+    en el orden en que terminan; 'índice' es la posición de la consulta en la lista.
+    - graph: diccionario {nodo: {vecino: costo}}, un CSRGraph, o la carpeta de una caché
+      de cargar_grafo.py. Por defecto, el grafo y las paredes de Ejercicio_5.py.
+    - workers: cantidad de procesos (por defecto, uno por núcleo); con 1 no se crea pool.
+    """
+    queries = list(queries)
+    if graph is None:
+        graph, walls = Ejercicio_5.graph, Ejercicio_5.walls
+    workers = workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if isinstance(graph, str):
+            cache_dir = graph
+        else:
+            if not isinstance(graph, CSRGraph):
+                graph = CSRGraph(graph, walls or ())
+            cache_dir = tmp
+            save_cache(graph, cache_dir)
+
+        if workers == 1:
+            saved = Ejercicio_5.graph, Ejercicio_5.walls
+            _attach(cache_dir)
+            try:
+                for goal, items in _groups(queries, workers):
+                    yield from _solve_group(goal, items)
+            finally:
+                Ejercicio_5.graph, Ejercicio_5.walls = saved
+                Ejercicio_5.graph_version += 1    # Las heurísticas en caché eran del otro grafo
+            return
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(cache_dir,)) as pool:
+            futures = [pool.submit(_solve_group, goal, items) for goal, items in _groups(queries, workers)]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Grafo aleatorio de 20.000 nodos y 20.000 consultas hacia 50 objetivos
+    random.seed(0)
+    n = 20_000
+    graph = {f"n{i}": {f"n{random.randrange(n)}": random.randint(1, 9) for _ in range(4)}
+             for i in range(n)}
+    goals = [f"n{random.randrange(n)}" for _ in range(50)]
+    queries = [(f"n{random.randrange(n)}", random.choice(goals), "astar") for _ in range(20_000)]
+
+    for workers in (1, max(2, os.cpu_count() or 1)):
+        t0 = time.perf_counter()
+        found = sum(result is not None for _, _, result in run_batch(queries, graph, workers=workers))
+        elapsed = time.perf_counter() - t0
+        print(f"{workers} proceso(s): {len(queries)} consultas "
+              f"({found} con camino) en {elapsed:.2f} s")
@@ -0,0 +1,83 @@
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Estadísticas de búsqueda, para comparar algoritmos y heurísticas con números en lugar
+# de capturas de pantalla. Las funciones de búsqueda aceptan stats=SearchStats() y, si
+# no se pasa nada (stats=None), no hacen ningún trabajo extra más que esa comparación.
+
+
+class SearchStats:
+    """
+    Contadores de una o más búsquedas (se acumulan si se reutiliza el objeto; ver reset()).
+    - generated: nodos agregados a la frontera.
+    - expanded: nodos expandidos; reexpanded: de esos, los que ya se habían expandido antes.
+    - peak_frontier: tamaño máximo de la frontera.
+    - elapsed: tiempo de reloj en segundos.
+    - peak_memory: pico de memoria reservada en bytes (solo con memory=True, usa tracemalloc,
+      que hace más lenta la búsqueda medida).
+    """
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.reset()
+
+    def reset(self):
+        self.generated = 0
+        self.expanded = 0
+        self.reexpanded = 0
+        self.peak_frontier = 0
+        self.elapsed = 0.0
+        self.peak_memory = None
+        self.runs = 0
+
+    @contextmanager
+    def measure(self):
+        """Mide el tiempo (y la memoria, si corresponde) de lo que se ejecute dentro del with."""
+        started_tracing = False
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.elapsed += time.perf_counter() - t0
+            self.runs += 1
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                self.peak_memory = max(self.peak_memory or 0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def as_dict(self):
+        return {"generated": self.generated, "expanded": self.expanded,
+                "reexpanded": self.reexpanded, "peak_frontier": self.peak_frontier,
+                "elapsed": self.elapsed, "peak_memory": self.peak_memory}
+
+    def __repr__(self):
+        text = (f"SearchStats(generados={self.generated}, expandidos={self.expanded}, "
+                f"re-expandidos={self.reexpanded}, frontera_max={self.peak_frontier}, "
+                f"tiempo={self.elapsed * 1000:.2f} ms")
+        if self.peak_memory is not None:
+            text += f", memoria_max={self.peak_memory / 1024:.1f} KiB"
+        return text + ")"
+
+
+def instrumented(func):
+    """
+    Decorador para funciones de búsqueda con un parámetro 'stats': si se pasa un
+    SearchStats, mide tiempo y memoria de toda la llamada; si no, llama directo.
+    La función se encarga de los contadores (generados, expandidos, frontera).
+    """
+    @functools.wraps(func)
+    def wrapper(*args, stats=None, **kwargs):
+        if stats is None:
+            return func(*args, **kwargs)
+        with stats.measure():
+            return func(*args, stats=stats, **kwargs)
+    return wrapper
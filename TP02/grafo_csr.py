@@ -0,0 +1,178 @@
+from collections.abc import Mapping
+import numpy as np
+
+# Grafo compacto en formato CSR (Compressed Sparse Row) para los algoritmos de Ejercicio_5.py.
+# Los nombres de los nodos se traducen una sola vez a ids enteros 0..n-1 y las aristas
+# se guardan en tres arrays de NumPy:
+#   - offsets[i]:offsets[i + 1] es el rango de aristas que salen del nodo i,
+#   - targets[k]: id del nodo destino de la arista k,
+#   - weights[k]: costo de la arista k.
+# Las paredes se descartan al construirlo, así los algoritmos no tienen que revisarlas.
+# dfs/avara/astar de Ejercicio_5.py recorren un CSRGraph por ids (edges(i), con padres y
+# visitados en listas indexadas por id) y traducen a nombres solo el inicio, el objetivo y
+# el camino final. Además se comporta como el diccionario original ({nodo: {vecino: costo}}),
+# así que el resto del código (maze_distance, por ejemplo) funciona sin cambios.
+
+
+class _Row(Mapping):
+    """Vista de solo lectura de los vecinos de un nodo: {vecino: costo}, como en el diccionario."""
+
+    __slots__ = ("_graph", "_start", "_end")
+
+    def __init__(self, graph, start, end):
+        self._graph, self._start, self._end = graph, start, end
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __iter__(self):
+        names = self._graph.names
+        return (names[t] for t in self._graph.targets[self._start:self._end].tolist())
+
+    def __getitem__(self, name):
+        graph = self._graph
+        j = graph.ids.get(name)
+        if j is not None:
+            row = graph.targets[self._start:self._end]
+            hit = np.flatnonzero(row == j)
+            if len(hit):
+                return graph.weights[self._start + hit[0]].item()
+        raise KeyError(name)
+
+    def items(self):
+        graph = self._graph
+        names = graph.names
+        a, b = self._start, self._end
+        return [(names[t], w) for t, w in zip(graph.targets[a:b].tolist(), graph.weights[a:b].tolist())]
+
+
+class CSRGraph(Mapping):
+    """
+    Grafo dirigido en formato CSR construido a partir de un diccionario {nodo: {vecino: costo}}.
+    - walls: pares (a, b) bloqueados en los dos sentidos, que no se incluyen.
+    - names[i] / ids[nombre]: traducción entre ids enteros y nombres.
+    - version: se incrementa en cada reconstrucción (sirve como clave de caché).
+    """
+
+    def __init__(self, graph, walls=()):
+        self.version = 0
+        self._build(graph, walls)
+
+    def _build(self, graph, walls):
+        names = list(graph)
+        ids = {name: i for i, name in enumerate(names)}
+        for edges in graph.values():
+            for name in edges:
+                if name not in ids:          # Nodos que solo aparecen como destino
+                    ids[name] = len(names)
+                    names.append(name)
+        blocked = set(walls) | {(b, a) for a, b in walls}
+
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        targets, weights = [], []
+        for i, name in enumerate(names):
+            for neighbor, w in graph.get(name, {}).items():
+                if (name, neighbor) not in blocked:
+                    targets.append(ids[neighbor])
+                    weights.append(w)
+            offsets[i + 1] = len(targets)
+        self.names, self.ids = names, ids
+        self.offsets = offsets
+        self.targets = np.array(targets, dtype=np.int32)
+        self.weights = np.array(weights) if weights else np.zeros(0, dtype=np.int64)
+        self._order = self._sorted = None
+
+    @classmethod
+    def from_arrays(cls, names, offsets, targets, weights):
+        """Crea el grafo a partir de arrays CSR ya armados (por ejemplo, leídos de disco)."""
+        csr = cls.__new__(cls)
+        csr.version = 0
+        csr.names = list(names)
+        csr.ids = {name: i for i, name in enumerate(csr.names)}
+        csr.offsets, csr.targets, csr.weights = offsets, targets, weights
+        csr._order = csr._sorted = None
+        return csr
+
+    def rebuild(self, graph, walls=()):
+        """Vuelve a construir el grafo (por ejemplo, con otras paredes) e incrementa la versión."""
+        self._build(graph, walls)
+        self.version += 1
+
+    # Acceso por id, sin diccionarios
+    def edges(self, i):
+        """(targets, weights) de las aristas que salen del nodo de id i (vistas de NumPy)."""
+        a, b = self.offsets[i], self.offsets[i + 1]
+        return self.targets[a:b], self.weights[a:b]
+
+    def name_order(self):
+        """
+        (order, rank): order[r] es el id del r-ésimo nombre en orden alfabético y rank[i] la
+        posición del nombre del id i. Con rank se desempata por nombre sin comparar textos.
+        """
+        if self._order is None:
+            order = sorted(range(len(self.names)), key=self.names.__getitem__)
+            rank = [0] * len(order)
+            for r, i in enumerate(order):
+                rank[i] = r
+            self._order = order, rank
+        return self._order
+
+    def sorted_edges(self, i):
+        """Como edges(i), pero con los destinos ordenados por nombre (y después por costo)."""
+        if self._sorted is None:
+            rank = np.array(self.name_order()[1], dtype=np.int64)
+            sources = np.repeat(np.arange(len(self.names)), np.diff(self.offsets))
+            order = np.lexsort((self.weights, rank[self.targets], sources))
+            self._sorted = self.targets[order], self.weights[order]
+        a, b = self.offsets[i], self.offsets[i + 1]
+        return self._sorted[0][a:b], self._sorted[1][a:b]
+
+    def reverse(self):
+        """Grafo con las aristas invertidas (mismos ids), para búsquedas hacia atrás."""
+        sources = np.repeat(np.arange(len(self.names), dtype=np.int32), np.diff(self.offsets))
+        order = np.argsort(self.targets, kind="stable")
+        rev = CSRGraph.__new__(CSRGraph)
+        rev.version = self.version
+        rev.names, rev.ids = self.names, self.ids
+        rev.offsets = np.zeros(len(self.names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.targets, minlength=len(self.names)), out=rev.offsets[1:])
+        rev.targets = sources[order]
+        rev.weights = self.weights[order]
+        rev._order, rev._sorted = self._order, None
+        return rev
+
+    def memory(self):
+        """Bytes ocupados por los arrays CSR."""
+        return self.offsets.nbytes + self.targets.nbytes + self.weights.nbytes
+
+    # Interfaz de diccionario (por nombre), para usarlo en lugar de {nodo: {vecino: costo}}
+    def __getitem__(self, name):
+        i = self.ids[name]
+        return _Row(self, int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import random
+
+    # Grafo aleatorio grande: memoria del diccionario contra CSR
+    random.seed(0)
+    n, degree = 100_000, 4
+    graph = {f"n{i}": {f"n{random.randrange(n)}": random.randint(1, 9) for _ in range(degree)}
+             for i in range(n)}
+    dict_bytes = sys.getsizeof(graph) + sum(sys.getsizeof(e) for e in graph.values())
+    t0 = time.perf_counter()
+    csr = CSRGraph(graph)
+    print(f"{len(csr)} nodos, {len(csr.targets)} aristas en {time.perf_counter() - t0:.2f} s")
+    print(f"Diccionarios: {dict_bytes / len(csr.targets):.0f} bytes por arista "
+          f"(sin contar claves); CSR: {csr.memory() / len(csr.targets):.0f} bytes por arista")
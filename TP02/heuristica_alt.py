@@ -0,0 +1,203 @@
+import hashlib
+import heapq
+import math
+import os
+from array import array
+from collections import OrderedDict, deque
+import numpy as np
+from busqueda_grilla import astar, grid_heuristic, neighbours
+
+# Heurística ALT (A*, Landmarks, desigualdad Triangular) para consultas repetidas
+# sobre un mapa fijo. Se eligen K celdas "landmark" y se guarda la distancia real de
+# cada una a todas las celdas. Por la desigualdad triangular, para cualquier landmark L:
+#     dist(v, t) >= |dist(L, t) - dist(L, v)|
+# y el máximo sobre los landmarks es una cota inferior mucho mejor que Manhattan
+# alrededor de paredes largas (como la barrera de 'obstacles' en Camino_dos_puntos.py).
+# Las tablas se pueden guardar con np.save y volver a abrir mapeadas en memoria.
+# Además, PathCache recuerda los últimos caminos pedidos por (inicio, fin, versión del mapa).
+
+
+def distances_from(gmap, source, diagonal=False):
+    """Distancia real desde 'source' (índice) a todas las celdas: array float64, inf si no se llega."""
+    n = gmap.rows * gmap.cols
+    dist = array("d", [math.inf]) * n
+    dist[source] = 0.0
+    if not diagonal:
+        # Costos uniformes: alcanza con una búsqueda en anchura
+        queue = deque([source])
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1.0
+            for j, _ in neighbours(gmap, i):
+                if d < dist[j]:
+                    dist[j] = d
+                    queue.append(j)
+    else:
+        heap = [(0.0, source)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+            for j, cost in neighbours(gmap, i, diagonal=True):
+                if d + cost < dist[j]:
+                    dist[j] = d + cost
+                    heapq.heappush(heap, (d + cost, j))
+    return np.frombuffer(dist, dtype=np.float64).copy()
+
+
+def _fingerprint(gmap):
+    """Huella de las paredes, para no usar tablas calculadas sobre otro mapa."""
+    return int.from_bytes(hashlib.blake2b(bytes(gmap.blocked), digest_size=7).digest(), "little")
+
+
+class Landmarks:
+    """
+    Tablas de distancias de K landmarks sobre un GridMap (table[k, i] = dist(landmark k, celda i)).
+    Los landmarks se eligen "lo más lejos posible" entre sí: cada uno es la celda alcanzable
+    más alejada de los ya elegidos, que es donde mejor funciona la cota.
+    """
+
+    def __init__(self, gmap, k=8, diagonal=False, seed=None, table=None, landmarks=None):
+        self.gmap = gmap
+        self.diagonal = diagonal
+        self.version = gmap.version
+        if table is not None:
+            self.table, self.landmarks = table, list(landmarks)
+        else:
+            self._select(k, seed)
+        self._rows = [memoryview(row) for row in self.table]
+
+    def _select(self, k, seed):
+        free = np.flatnonzero(np.frombuffer(bytes(self.gmap.blocked), dtype=np.uint8) == 0)
+        if len(free) == 0:
+            raise ValueError("El mapa no tiene celdas libres")
+        first = int(np.random.default_rng(seed).choice(free))
+        nearest = distances_from(self.gmap, first, self.diagonal)   # Distancia al landmark más cercano
+        nearest[~np.isfinite(nearest)] = -1.0
+        landmarks, tables = [], []
+        for _ in range(k):
+            candidate = int(np.argmax(nearest))
+            if nearest[candidate] <= 0 and landmarks:
+                break                      # No quedan celdas alcanzables nuevas
+            table = distances_from(self.gmap, candidate, self.diagonal)
+            landmarks.append(candidate)
+            tables.append(table)
+            nearest = np.minimum(nearest, np.where(np.isfinite(table), table, nearest))
+        self.landmarks = landmarks
+        self.table = np.stack(tables)
+
+    def heuristic(self, goal):
+        """
+        Función índice -> cota inferior de la distancia a 'goal', para astar(heuristic=...).
+        Toma el máximo entre la cota ALT y la heurística de siempre (Manhattan u octil).
+        """
+        if self.gmap.version != self.version:
+            raise ValueError("El mapa cambió desde que se calcularon los landmarks")
+        t = self.gmap.index(goal)
+        base = grid_heuristic(self.gmap, goal, self.diagonal)
+        # Solo sirven los landmarks desde los que se llega al objetivo; si uno de ellos
+        # no llega a la celda, la celda está en otra componente (cota infinita, correcto).
+        useful = [(row, row[t]) for row in self._rows if row[t] != math.inf]
+        if not useful:
+            return base
+
+        def h(i):
+            return max(base(i), max(abs(row[i] - dt) for row, dt in useful))
+        return h
+
+    def save(self, directory):
+        """Guarda las tablas en 'directory' (tabla.npy y landmarks.npy)."""
+        os.makedirs(directory, exist_ok=True)
+        meta = [self.gmap.rows, self.gmap.cols, int(self.diagonal), _fingerprint(self.gmap)]
+        np.save(os.path.join(directory, "tabla.npy"), self.table)
+        np.save(os.path.join(directory, "landmarks.npy"), np.array(meta + self.landmarks, dtype=np.int64))
+
+    @classmethod
+    def load(cls, directory, gmap):
+        """Abre tablas guardadas con save(); la tabla queda mapeada en memoria (solo lectura)."""
+        meta = np.load(os.path.join(directory, "landmarks.npy")).tolist()
+        rows, cols, diagonal, fingerprint = meta[:4]
+        if (rows, cols, fingerprint) != (gmap.rows, gmap.cols, _fingerprint(gmap)):
+            raise ValueError(f"Las tablas de {directory!r} son de otro mapa")
+        table = np.load(os.path.join(directory, "tabla.npy"), mmap_mode="r")
+        return cls(gmap, diagonal=bool(diagonal), table=table, landmarks=meta[4:])
+
+
+class PathCache:
+    """
+    Caché LRU de caminos ya calculados sobre un mapa, con clave (inicio, fin, versión del mapa):
+    si cambia una pared (gmap.set_blocked) las entradas viejas dejan de coincidir.
+    """
+
+    def __init__(self, gmap, maxsize=1024, diagonal=False, landmarks=None):
+        if landmarks is not None and landmarks.diagonal != diagonal:
+            # Las distancias en 4 direcciones sobreestiman las de 8: la cota dejaría de ser admisible
+            raise ValueError("Los landmarks se calcularon con otro tipo de movimiento (diagonal="
+                             f"{landmarks.diagonal}) que el de la caché (diagonal={diagonal})")
+        self.gmap = gmap
+        self.maxsize = maxsize
+        self.diagonal = diagonal
+        self.landmarks = landmarks
+        self.entries = OrderedDict()
+        self.hits = self.misses = 0
+
+    def query(self, start, goal):
+        """Igual que astar(gmap, start, goal): (camino, costo) o None."""
+        key = (tuple(start), tuple(goal), self.gmap.version)
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        h = None
+        if self.landmarks is not None and self.landmarks.version == self.gmap.version:
+            h = self.landmarks.heuristic(goal)
+        result = astar(self.gmap, start, goal, self.diagonal, heuristic=h)
+        self.entries[key] = result
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return result
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+    import time
+    from busqueda_grilla import GridMap
+
+    # Mapa con paredes largas con un hueco cada una: Manhattan subestima mucho
+    size = 400
+    gmap = GridMap(size, size)
+    for r in range(20, size, 40):
+        gap = random.Random(r).randrange(size)
+        for c in range(size):
+            if abs(c - gap) > 2:
+                gmap.blocked[r * size + c] = 1
+
+    t0 = time.perf_counter()
+    marks = Landmarks(gmap, k=8, seed=0)
+    print(f"{len(marks.landmarks)} landmarks en {time.perf_counter() - t0:.1f} s")
+    with tempfile.TemporaryDirectory() as tmp:
+        marks.save(tmp)
+        marks = Landmarks.load(tmp, gmap)
+
+        rng = random.Random(0)
+        free = [i for i in range(size * size) if not gmap.blocked[i]]
+        queries = [(gmap.cell(rng.choice(free)), gmap.cell(rng.choice(free))) for _ in range(30)]
+        for name, make_h in (("Manhattan", lambda goal: None), ("ALT", marks.heuristic)):
+            calls = 0
+            t0 = time.perf_counter()
+            for start, goal in queries:
+                h = make_h(goal) or grid_heuristic(gmap, goal)
+
+                def counted(i, h=h):
+                    global calls
+                    calls += 1
+                    return h(i)
+                astar(gmap, start, goal, heuristic=counted)
+            print(f"{name:>9}: {calls} nodos generados, {time.perf_counter() - t0:.2f} s")
+
+        cache = PathCache(gmap, landmarks=marks)
+        for start, goal in queries * 3:
+            cache.query(start, goal)
+        print(f"Caché: {cache.hits} aciertos, {cache.misses} fallos")
@@ -0,0 +1,390 @@
+import heapq
+import math
+from array import array
+from itertools import count
+import numpy as np
+from busqueda_grilla import octile
+
+# Jump Point Search (JPS) para grillas de costo uniforme, como la de Camino_dos_puntos.py.
+# En lugar de agregar a la cola cada vecino, JPS "salta" en línea recta (o en diagonal)
+# hasta encontrar una celda donde el camino óptimo podría doblar (un punto de salto).
+# Así se evita expandir los muchos caminos simétricos de igual costo que A* explora.
+# - jps(): saltos calculados recorriendo la grilla celda por celda.
+# - JPSPlus: precalcula con NumPy, para cada celda y dirección, la distancia al próximo
+#   punto de salto y a la próxima pared; cada salto pasa a ser una consulta O(1).
+# Los dos devuelven el mismo formato y costo que busqueda_grilla.astar().
+# Reglas de movimiento: 4 direcciones, u 8 sin cortar esquinas (igual que astar()).
+
+DIRS_4 = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+DIAGONALS = [(1, 1), (1, -1), (-1, -1), (-1, 1)]
+
+
+def _sign(v):
+    return (v > 0) - (v < 0)
+
+
+def _walkable(gmap, r, c):
+    return 0 <= r < gmap.rows and 0 <= c < gmap.cols and not gmap.blocked[r * gmap.cols + c]
+
+
+def _directions(gmap, r, c, pdr, pdc, diagonal):
+    """Direcciones a explorar desde (r, c) si se llegó moviéndose en (pdr, pdc) (poda de JPS)."""
+    w = _walkable
+    dirs = []
+    if pdr == 0 and pdc == 0:   # Nodo inicial: todas las direcciones posibles
+        dirs = [d for d in DIRS_4 if w(gmap, r + d[0], c + d[1])]
+        if diagonal:
+            dirs += [(dr, dc) for dr, dc in DIAGONALS
+                     if w(gmap, r + dr, c) and w(gmap, r, c + dc) and w(gmap, r + dr, c + dc)]
+        return dirs
+    if not diagonal:
+        if pdc:
+            dirs = [(-1, 0), (1, 0), (0, pdc)]
+        else:
+            dirs = [(0, -1), (0, 1), (pdr, 0)]
+        return [d for d in dirs if w(gmap, r + d[0], c + d[1])]
+    if pdr and pdc:
+        vertical, horizontal = w(gmap, r + pdr, c), w(gmap, r, c + pdc)
+        if vertical:
+            dirs.append((pdr, 0))
+        if horizontal:
+            dirs.append((0, pdc))
+        if vertical and horizontal:
+            dirs.append((pdr, pdc))
+    elif pdc:
+        ahead, up, down = w(gmap, r, c + pdc), w(gmap, r - 1, c), w(gmap, r + 1, c)
+        if ahead:
+            dirs.append((0, pdc))
+            if down:
+                dirs.append((1, pdc))
+            if up:
+                dirs.append((-1, pdc))
+        if down:
+            dirs.append((1, 0))
+        if up:
+            dirs.append((-1, 0))
+    else:
+        ahead, right, left = w(gmap, r + pdr, c), w(gmap, r, c + 1), w(gmap, r, c - 1)
+        if ahead:
+            dirs.append((pdr, 0))
+            if right:
+                dirs.append((pdr, 1))
+            if left:
+                dirs.append((pdr, -1))
+        if right:
+            dirs.append((0, 1))
+        if left:
+            dirs.append((0, -1))
+    return dirs
+
+
+def _search(gmap, start, goal, diagonal, jump):
+    """A* sobre los puntos de salto; 'jump(r, c, dr, dc)' devuelve el próximo punto o None."""
+    n = gmap.rows * gmap.cols
+    cols = gmap.cols
+    s, t = gmap.index(start), gmap.index(goal)
+    if gmap.blocked[t]:
+        return None
+    gr, gc = goal
+    dist = octile if diagonal else (lambda a, b: a + b)
+
+    g = array("d", [math.inf]) * n
+    parent = array("i" if n < 2**31 else "q", [-1]) * n
+    closed = bytearray(n)
+    tie = count()
+    g[s] = 0.0
+    hs = dist(abs(start[0] - gr), abs(start[1] - gc))
+    open_set = [(hs, hs, next(tie), s)]
+
+    while open_set:
+        _, _, _, current = heapq.heappop(open_set)
+        if closed[current]:
+            continue
+        if current == t:
+            return _expand_path(gmap, parent, t), g[t]
+        closed[current] = 1
+
+        r, c = divmod(current, cols)
+        p = parent[current]
+        pdr, pdc = (0, 0) if p == -1 else (_sign(r - p // cols), _sign(c - p % cols))
+        for dr, dc in _directions(gmap, r, c, pdr, pdc, diagonal):
+            point = jump(r, c, dr, dc)
+            if point is None:
+                continue
+            jr, jc = point
+            j = jr * cols + jc
+            if closed[j]:
+                continue
+            tentative_g = g[current] + dist(abs(jr - r), abs(jc - c))
+            if tentative_g < g[j]:
+                g[j] = tentative_g
+                parent[j] = current
+                hj = dist(abs(jr - gr), abs(jc - gc))
+                heapq.heappush(open_set, (tentative_g + hj, hj, next(tie), j))
+    return None
+
+
+def _expand_path(gmap, parent, t):
+    """Convierte la cadena de puntos de salto en el camino completo, celda por celda."""
+    points = []
+    while t != -1:
+        points.append(gmap.cell(t))
+        t = parent[t]
+    points.reverse()
+    path = points[:1]
+    for (r0, c0), (r1, c1) in zip(points, points[1:]):
+        dr, dc = _sign(r1 - r0), _sign(c1 - c0)
+        for k in range(1, max(abs(r1 - r0), abs(c1 - c0)) + 1):
+            path.append((r0 + k * dr, c0 + k * dc))
+    return path
+
+
+# ======== JPS: saltos recorriendo la grilla ========
+def jps(gmap, start, goal, diagonal=False):
+    """
+    Jump Point Search. Devuelve (camino, costo) como busqueda_grilla.astar(), o None.
+    Como astar(), por defecto se mueve en 4 direcciones (diagonal=False).
+    """
+    w = _walkable
+    rows, cols, blocked = gmap.rows, gmap.cols, gmap.blocked
+    gr, gc = goal
+
+    def straight(r, c, dr, dc):
+        # Una celda es punto de salto si es el objetivo o tiene un vecino forzado: un costado
+        # libre cuya celda "de atrás" es pared (el camino óptimo podría doblar ahí).
+        # La celda anterior (r - dr, c - dc) siempre está dentro de la grilla.
+        if dc:
+            i, last = r * cols + c, r * cols + (cols - 1 if dc > 0 else 0)
+            up, down = r > 0, r < rows - 1
+            while i != last:
+                i += dc
+                if blocked[i]:
+                    return None
+                if (r == gr and i - r * cols == gc) or \
+                        (up and not blocked[i - cols] and blocked[i - cols - dc]) or \
+                        (down and not blocked[i + cols] and blocked[i + cols - dc]):
+                    return divmod(i, cols)
+            return None
+        left, right = c > 0, c < cols - 1
+        step = dr * cols
+        while True:
+            r += dr
+            if not 0 <= r < rows:
+                return None
+            i = r * cols + c
+            if blocked[i]:
+                return None
+            if (r == gr and c == gc) or \
+                    (left and not blocked[i - 1] and blocked[i - 1 - step]) or \
+                    (right and not blocked[i + 1] and blocked[i + 1 - step]):
+                return r, c
+            # En 4 direcciones, al moverse en vertical también hay que probar los saltos horizontales
+            if not diagonal and (straight(r, c, 0, 1) or straight(r, c, 0, -1)):
+                return r, c
+
+    def jump(r, c, dr, dc):
+        if not (dr and dc):
+            return straight(r, c, dr, dc)
+        while True:
+            if not (w(gmap, r + dr, c) and w(gmap, r, c + dc) and w(gmap, r + dr, c + dc)):
+                return None
+            r, c = r + dr, c + dc
+            if (r, c) == goal or straight(r, c, 0, dc) or straight(r, c, dr, 0):
+                return r, c
+
+    return _search(gmap, start, goal, diagonal, jump)
+
+
+# ======== JPS+: distancias de salto precalculadas ========
+def _next_distance(mask):
+    """
+    Para cada celda (fila, col), distancia k >= 1 hasta la próxima celda con mask True
+    a su derecha en la misma fila; si no hay, la distancia hasta pasar el borde.
+    """
+    cols = mask.shape[1]
+    idx = np.where(mask, np.arange(cols), cols)
+    suffix = np.minimum.accumulate(idx[:, ::-1], axis=1)[:, ::-1]
+    following = np.full_like(idx, cols)
+    following[:, :-1] = suffix[:, 1:]
+    return following - np.arange(cols)
+
+
+def _oriented(func, mask, dr, dc):
+    """Aplica una función "hacia la derecha" (como _next_distance) en la dirección (dr, dc)."""
+    if dr:
+        mask = mask.T
+    if dr < 0 or dc < 0:
+        mask = mask[:, ::-1]
+    out = func(mask)
+    if dr < 0 or dc < 0:
+        out = out[:, ::-1]
+    return out.T if dr else out
+
+
+class JPSPlus:
+    """
+    JPS+ sobre un GridMap: las tablas se calculan una vez (y de nuevo si el mapa cambia,
+    según gmap.version) y cada búsqueda usa saltos en tiempo constante.
+    """
+
+    def __init__(self, gmap, diagonal=False):
+        self.gmap = gmap
+        self.diagonal = diagonal
+        self._build()
+
+    def _build(self):
+        gmap = self.gmap
+        rows, cols = gmap.rows, gmap.cols
+        walk = np.frombuffer(bytes(gmap.blocked), dtype=np.uint8).reshape(rows, cols) == 0
+        pad = np.zeros((rows + 2, cols + 2), dtype=bool)
+        pad[1:-1, 1:-1] = walk
+
+        def shifted(dr, dc):
+            """W[r + dr, c + dc] para cada celda (falso fuera de la grilla)."""
+            return pad[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+
+        def flat(a):
+            return array("i", np.ascontiguousarray(a, dtype=np.int32).tobytes())
+
+        self.wall, self.jump_to = {}, {}
+        straight_jp = {}
+        for dr, dc in DIRS_4:
+            wall = _oriented(_next_distance, ~walk, dr, dc) - 1
+            if dc:
+                forced = (shifted(-1, 0) & ~shifted(-1, -dc)) | (shifted(1, 0) & ~shifted(1, -dc))
+            else:
+                forced = (shifted(0, -1) & ~shifted(-dr, -1)) | (shifted(0, 1) & ~shifted(-dr, 1))
+            k = _oriented(_next_distance, forced & walk, dr, dc)
+            straight_jp[(dr, dc)] = np.where(k <= wall, k, 0)
+            self.wall[(dr, dc)] = wall
+
+        if self.diagonal:
+            for (dr, dc), jp in straight_jp.items():
+                self.jump_to[(dr, dc)] = jp
+            for dr, dc in DIAGONALS:
+                legal = shifted(dr, 0) & shifted(0, dc) & shifted(dr, dc)
+                is_jp = (straight_jp[(0, dc)] > 0) | (straight_jp[(dr, 0)] > 0)
+                wall = np.zeros((rows, cols), dtype=np.int64)
+                jp = np.zeros((rows, cols), dtype=np.int64)
+                # Recurrencia fila por fila: la celda depende de la siguiente en la diagonal
+                order = range(rows - 1, -1, -1) if dr > 0 else range(rows)
+                for r in order:
+                    nr = r + dr
+                    if not 0 <= nr < rows:
+                        continue
+                    nxt_wall = np.zeros(cols, dtype=np.int64)
+                    nxt_jp = np.zeros(cols, dtype=np.int64)
+                    nxt_is = np.zeros(cols, dtype=bool)
+                    src = slice(max(dc, 0), cols + min(dc, 0))
+                    dst = slice(max(-dc, 0), cols + min(-dc, 0))
+                    nxt_wall[dst] = wall[nr, src]
+                    nxt_jp[dst] = jp[nr, src]
+                    nxt_is[dst] = is_jp[nr, src]
+                    ok = legal[r]
+                    wall[r] = np.where(ok, nxt_wall + 1, 0)
+                    jp[r] = np.where(ok, np.where(nxt_is, 1, np.where(nxt_jp > 0, nxt_jp + 1, 0)), 0)
+                self.wall[(dr, dc)] = wall
+                self.jump_to[(dr, dc)] = jp
+        else:
+            for dr, dc in DIRS_4:
+                if dc:
+                    self.jump_to[(dr, dc)] = straight_jp[(dr, dc)]
+                    continue
+                # En vertical se frena también donde un salto horizontal encuentra algo
+                forced = (shifted(0, -1) & ~shifted(-dr, -1)) | (shifted(0, 1) & ~shifted(-dr, 1))
+                stop = (forced | (straight_jp[(0, 1)] > 0) | (straight_jp[(0, -1)] > 0)) & walk
+                k = _oriented(_next_distance, stop, dr, dc)
+                self.jump_to[(dr, dc)] = np.where(k <= self.wall[(dr, dc)], k, 0)
+
+        self._wall = {d: flat(v) for d, v in self.wall.items()}
+        self._jump = {d: flat(v) for d, v in self.jump_to.items()}
+        self.version = gmap.version
+
+    def _jump_fn(self, goal):
+        cols = self.gmap.cols
+        gr, gc = goal
+        wall, jump_to, diagonal = self._wall, self._jump, self.diagonal
+
+        def reaches(r, c, dr, dc):
+            """¿Un salto recto desde (r, c) en (dr, dc) llega al objetivo?"""
+            if dr == 0:
+                k = (gc - c) * dc
+                return r == gr and 0 < k <= wall[(0, dc)][r * cols + c]
+            k = (gr - r) * dr
+            return c == gc and 0 < k <= wall[(dr, 0)][r * cols + c]
+
+        def jump(r, c, dr, dc):
+            i = r * cols + c
+            limit = wall[(dr, dc)][i]
+            candidates = [jump_to[(dr, dc)][i]]
+            if dr and dc:
+                # Celdas de la diagonal en la fila o columna del objetivo
+                m = (gr - r) * dr
+                if 0 < m <= limit:
+                    qc = c + m * dc
+                    if qc == gc or reaches(gr, qc, 0, dc):
+                        candidates.append(m)
+                m = (gc - c) * dc
+                if 0 < m <= limit:
+                    qr = r + m * dr
+                    if qr == gr or reaches(qr, gc, dr, 0):
+                        candidates.append(m)
+            elif dc or diagonal:
+                if reaches(r, c, dr, dc):
+                    candidates.append(abs(gc - c) + abs(gr - r))
+            else:
+                # Vertical en 4 direcciones: la celda en la fila del objetivo, si desde ahí
+                # un salto horizontal (o el propio objetivo) lo alcanza
+                m = (gr - r) * dr
+                if 0 < m <= limit and (c == gc or reaches(gr, c, 0, _sign(gc - c))):
+                    candidates.append(m)
+            k = min((k for k in candidates if k > 0), default=0)
+            if k == 0:
+                return None
+            return r + k * dr, c + k * dc
+
+        return jump
+
+    def search(self, start, goal):
+        """Busca con JPS+; devuelve (camino, costo) como busqueda_grilla.astar(), o None."""
+        if self.version != self.gmap.version:
+            self._build()
+        return _search(self.gmap, start, goal, self.diagonal, self._jump_fn(goal))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from busqueda_grilla import GridMap, astar
+
+    # Mapa grande abierto con paredes dispersas (el caso típico para JPS)
+    random.seed(0)
+    size = 1000
+    gmap = GridMap(size, size)
+    for _ in range(300):
+        r, c = random.randrange(size), random.randrange(size)
+        length = random.randint(10, 200)
+        for k in range(length):
+            if random.random() < 0.5 and c + k < size:
+                gmap.blocked[r * size + c + k] = 1
+            elif r + k < size:
+                gmap.blocked[(r + k) * size + c] = 1
+    start, goal = (0, 0), (size - 1, size - 1)
+    gmap.blocked[0] = gmap.blocked[-1] = 0
+
+    for diagonal in (True, False):
+        t0 = time.perf_counter()
+        ref = astar(gmap, start, goal, diagonal)
+        t_astar = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        res = jps(gmap, start, goal, diagonal)
+        t_jps = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        plus = JPSPlus(gmap, diagonal)
+        t_build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        res_plus = plus.search(start, goal)
+        t_plus = time.perf_counter() - t0
+        print(f"{8 if diagonal else 4} direcciones: A* {ref[1]:.1f} ({t_astar:.2f} s), "
+              f"JPS {res[1]:.1f} ({t_jps:.2f} s), JPS+ {res_plus[1]:.1f} "
+              f"({t_plus:.3f} s + {t_build:.2f} s de tablas)")
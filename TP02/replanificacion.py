@@ -0,0 +1,250 @@
+import heapq
+import math
+from array import array
+from itertools import count
+from busqueda_grilla import MOVES_4, MOVES_8, octile
+
+# Replanificación incremental con D* Lite (Koenig y Likhachev) sobre un GridMap.
+# A diferencia de astar(), la búsqueda se hace desde el objetivo hacia el inicio y
+# se conserva entre llamadas: g[i] es la distancia de la celda i al objetivo y rhs[i]
+# la estimación "un paso adelante". Cuando cambian algunas paredes solo se corrigen
+# las celdas cuyo g deja de ser consistente, en lugar de repetir toda la búsqueda.
+# El inicio puede moverse (el agente avanza por el camino) sin reiniciar la cola.
+
+INF = math.inf
+EPS = 1e-9      # En diagonal las sumas de sqrt(2) difieren en el último bit según el orden
+
+
+def key_less(a, b):
+    """a < b entre claves (k1, k2), tomando como iguales los valores que difieren menos que EPS."""
+    if a[0] < b[0] - EPS:
+        return True
+    return a[0] <= b[0] + EPS and a[1] < b[1] - EPS
+
+
+class DStarLite:
+    """
+    Planificador incremental entre 'start' y 'goal' sobre 'gmap'.
+    - path(): (camino, costo) como busqueda_grilla.astar(), o None si no hay camino.
+    - update_cells(changes): cambia paredes y repara el camino.
+    - move_start(cell): el agente se movió; el árbol de búsqueda se reutiliza.
+    - expanded / total_expanded: celdas expandidas en la última reparación / en total.
+    Una arista vale infinito si alguna de sus dos celdas es pared (o, en diagonal,
+    si corta una esquina), así el grafo es simétrico como pide D* Lite.
+    """
+
+    def __init__(self, gmap, start, goal, diagonal=False):
+        self.gmap = gmap
+        self.diagonal = diagonal
+        self.moves = MOVES_8 if diagonal else MOVES_4
+        n = gmap.rows * gmap.cols
+        self.start = gmap.index(start)
+        self.goal = gmap.index(goal)
+        self._last = self.start
+        self.km = 0.0
+        self.g = array("d", [INF]) * n
+        self.rhs = array("d", [INF]) * n
+        self._queued = {}            # índice -> clave vigente en la cola
+        self._heap = []
+        self._tie = count()
+        self.expanded = 0
+        self.total_expanded = 0
+
+        self.rhs[self.goal] = 0.0
+        self._push(self.goal)
+        self._compute()
+
+    # ======== Piezas de D* Lite ========
+    def _h(self, a, b):
+        ar, ac = divmod(a, self.gmap.cols)
+        br, bc = divmod(b, self.gmap.cols)
+        dr, dc = abs(ar - br), abs(ac - bc)
+        return octile(dr, dc) if self.diagonal else dr + dc
+
+    def _key(self, i):
+        m = min(self.g[i], self.rhs[i])
+        return (m + self._h(self.start, i) + self.km, m)
+
+    def _push(self, i):
+        key = self._key(i)
+        self._queued[i] = key
+        heapq.heappush(self._heap, (key, next(self._tie), i))
+
+    def _top(self):
+        """Primera entrada vigente de la cola (descarta las viejas); None si está vacía."""
+        heap = self._heap
+        while heap:
+            key, _, i = heap[0]
+            if self._queued.get(i) == key:
+                return key, i
+            heapq.heappop(heap)
+        return None
+
+    def _around(self, i):
+        """Celdas vecinas de i dentro de la grilla, con el costo de la arista (INF si está cortada)."""
+        gmap = self.gmap
+        rows, cols, blocked = gmap.rows, gmap.cols, gmap.blocked
+        r, c = divmod(i, cols)
+        for dr, dc, cost in self.moves:
+            nr, nc = r + dr, c + dc
+            if not (0 <= nr < rows and 0 <= nc < cols):
+                continue
+            j = nr * cols + nc
+            if blocked[i] or blocked[j] or \
+                    (dr and dc and (blocked[r * cols + nc] or blocked[nr * cols + c])):
+                yield j, INF
+            else:
+                yield j, cost
+
+    def _update_vertex(self, i):
+        if i != self.goal:
+            g = self.g
+            self.rhs[i] = min((cost + g[j] for j, cost in self._around(i)), default=INF)
+        self._queued.pop(i, None)
+        if self.g[i] != self.rhs[i]:
+            self._push(i)
+
+    def _compute(self):
+        g, rhs = self.g, self.rhs
+        s = self.start
+        expanded = 0
+        while True:
+            top = self._top()
+            if top is None or (not key_less(top[0], self._key(s)) and rhs[s] == g[s]):
+                break
+            k_old, u = top
+            heapq.heappop(self._heap)
+            del self._queued[u]
+            k_new = self._key(u)
+            if key_less(k_old, k_new):
+                self._push(u)                 # La clave quedó vieja (km cambió): reinsertar
+                continue
+            expanded += 1
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]                 # Sobreconsistente: se fija su distancia
+                for j, _ in self._around(u):
+                    self._update_vertex(j)
+            else:
+                g[u] = INF                    # Subconsistente: se "desarma" y se recalcula
+                self._update_vertex(u)
+                for j, _ in self._around(u):
+                    self._update_vertex(j)
+        self.expanded = expanded
+        self.total_expanded += expanded
+
+    # ======== API ========
+    def update_cells(self, changes):
+        """
+        Aplica cambios de paredes, 'changes' = [(celda, bloqueada), ...], y repara el camino.
+        Devuelve path() con el nuevo camino; self.expanded dice cuántas celdas se re-expandieron.
+        """
+        gmap = self.gmap
+        touched = set()
+        for cell, value in changes:
+            i = gmap.index(cell)
+            if gmap.blocked[i] == (1 if value else 0):
+                continue
+            gmap.set_blocked(cell, value)
+            touched.add(i)
+            touched.update(j for j, _ in self._around(i))
+            if not self.diagonal:
+                continue
+            # En diagonal, la celda también es esquina de aristas entre sus vecinos
+            r, c = divmod(i, gmap.cols)
+            for dr, dc, _ in MOVES_8:
+                if 0 <= r + dr < gmap.rows and 0 <= c + dc < gmap.cols:
+                    touched.add((r + dr) * gmap.cols + c + dc)
+        if touched:
+            # La heurística se mide desde el inicio actual: km corrige las claves viejas
+            self.km += self._h(self._last, self.start)
+            self._last = self.start
+            for i in sorted(touched):
+                self._update_vertex(i)
+            self._compute()
+        else:
+            self.expanded = 0
+        return self.path()
+
+    def move_start(self, cell):
+        """Mueve el inicio (por ejemplo, el agente avanzó un paso por el camino)."""
+        self.start = self.gmap.index(cell)
+        # Las claves en la cola se calcularon desde el inicio anterior: km las corrige
+        self.km += self._h(self._last, self.start)
+        self._last = self.start
+        self._compute()
+
+    def path(self):
+        """Camino desde el inicio siguiendo el menor costo + g, o None si no hay camino."""
+        g, i = self.g, self.start
+        if self.rhs[i] == INF:
+            return None
+        cost = self.rhs[i]
+        path = [self.gmap.cell(i)]
+        for _ in range(len(g)):
+            if i == self.goal:
+                return path, cost
+            i = min(self._around(i), key=lambda e: e[1] + g[e[0]])[0]
+            path.append(self.gmap.cell(i))
+        return None
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from busqueda_grilla import GridMap, astar
+
+    # Mapa grande donde cambian pocas celdas por vez cerca del camino
+    random.seed(0)
+    size = 300
+    gmap = GridMap(size, size, bytes(1 if random.random() < 0.2 else 0 for _ in range(size * size)))
+    start, goal = (0, 0), (size - 1, size - 1)
+    gmap.blocked[0] = gmap.blocked[-1] = 0
+
+    t0 = time.perf_counter()
+    planner = DStarLite(gmap, start, goal)
+    print(f"Plan inicial: {planner.expanded} celdas expandidas ({time.perf_counter() - t0:.2f} s)")
+
+    t_inc = t_full = 0.0
+    expanded = 0
+    for _ in range(20):
+        path, _ = planner.path()
+        changes = []
+        for cell in random.sample(path[1:-1], 3):
+            changes.append((cell, True))
+        t0 = time.perf_counter()
+        result = planner.update_cells(changes)
+        t_inc += time.perf_counter() - t0
+        expanded += planner.expanded
+        t0 = time.perf_counter()
+        ref = astar(gmap, start, goal)
+        t_full += time.perf_counter() - t0
+        assert (result is None) == (ref is None) and (ref is None or result[1] == ref[1])
+    print(f"20 replanificaciones: {expanded} celdas re-expandidas, {t_inc:.2f} s "
+          f"(A* desde cero: {t_full:.2f} s)")
+
+    # Control en 4 y 8 direcciones: mapas chicos con paredes que cambian y un inicio que
+    # avanza, comparando cada costo con A* desde cero
+    small = GridMap(6, 3, bytes([0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]))
+    planner = DStarLite(small, (5, 0), (0, 1), diagonal=True)
+    assert planner.update_cells([((1, 1), True)])[1] == astar(small, (5, 0), (0, 1), True)[1]
+    checks = 0
+    for _ in range(500):
+        rows, cols = random.randint(2, 9), random.randint(2, 9)
+        diagonal = random.random() < 0.5
+        small = GridMap(rows, cols, bytes(1 if random.random() < 0.25 else 0 for _ in range(rows * cols)))
+        cells = [(r, c) for r in range(rows) for c in range(cols)]
+        start, goal = random.sample(cells, 2)
+        small.set_blocked(start, False)
+        small.set_blocked(goal, False)
+        planner = DStarLite(small, start, goal, diagonal)
+        for _ in range(10):
+            result = planner.path()
+            ref = astar(small, small.cell(planner.start), goal, diagonal)
+            assert (result is None) == (ref is None) and (ref is None or abs(result[1] - ref[1]) < 1e-9)
+            checks += 1
+            if result and len(result[0]) > 1 and random.random() < 0.4:
+                planner.move_start(result[0][1])
+            else:
+                planner.update_cells([(cell, random.random() < 0.5) for cell in random.sample(cells, 2)
+                                      if cell not in (goal, small.cell(planner.start))])
+    print(f"{checks} costos iguales a los de A* (4 y 8 direcciones)")
@@ -3,6 +3,8 @@ import sys
 import random
 import math
 import time
+from tateti_exacto import perfect_move, load_table
+from bitboard import BitBoard, simulated_annealing as bitboard_annealing
 
 # ======== Configuración inicial ========
 WIDTH, HEIGHT = 300, 300
@@ -14,6 +16,12 @@ BLACK = (0, 0, 0)
 RED = (255, 0, 0)
 BLUE = (0, 0, 255)
 
+# Jugador de la IA: "recocido" (recocido simulado), "bitboard" (el mismo recocido sobre el
+# tablero de bits de bitboard.py) o "perfecto" (tabla de tateti_exacto.py, que nunca pierde
+# y responde con una sola lectura de la tabla)
+AI_MODE = "recocido"
+AI_MODES = ("recocido", "bitboard", "perfecto")
+
 pygame.init()
 FONT = pygame.font.SysFont(None, 40)
 SMALL_FONT = pygame.font.SysFont(None, 30)
@@ -158,9 +166,12 @@ def simulated_annealing(board, player, T_init=10, alpha=0.95, steps=500):
     return -1  # No hay movimientos posibles
 
 # ======== Juego principal ========
-def play_game(T_init, alpha=0.95, steps=500):  # Corregido: usar steps=500 consistentemente
+def play_game(T_init, alpha=0.95, steps=500, mode=AI_MODE):  # Corregido: usar steps=500 consistentemente
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption(f"Ta-te-ti - Recocido Simulado (T={T_init}, Steps={steps})")
+    if mode == "perfecto":
+        pygame.display.set_caption("Ta-te-ti - Jugador perfecto")
+    else:
+        pygame.display.set_caption(f"Ta-te-ti - Recocido Simulado (T={T_init}, Steps={steps})")
 
     board = [" "] * 9
     turn = "X"  # Jugador empieza
@@ -204,7 +215,12 @@ def play_game(T_init, alpha=0.95, steps=500):  # Corregido: usar steps=500 consi
         if not game_over and turn == "O":
             pygame.time.delay(500)  # Pausa para ver el turno
             
-            move = simulated_annealing(board, "O", T_init, alpha, steps)
+            if mode == "perfecto":
+                move = perfect_move(board, "O")
+            elif mode == "bitboard":
+                move = bitboard_annealing(BitBoard.from_list(board), "O", T_init, alpha, steps)
+            else:
+                move = simulated_annealing(board, "O", T_init, alpha, steps)
             
             if move != -1:  # Si hay movimientos válidos
                 board[move] = "O"
@@ -266,6 +282,13 @@ def main():
     alpha = 0.95  # Factor de enfriamiento
     steps = 500   # Número de iteraciones (ahora consistentemente 500)
     
+    mode = input(f"Modo de la IA, {', '.join(AI_MODES)} ({AI_MODE} por defecto): ").strip().lower() or AI_MODE
+    if mode not in AI_MODES:
+        print("Modo no válido. Usando valor por defecto.")
+        mode = AI_MODE
+    if mode == "perfecto":
+        load_table()   # Carga (o calcula la primera vez) la tabla antes de empezar
+
     restart = True
     while restart:
         try:
@@ -279,7 +302,7 @@ def main():
             T_init = temperatures[current_temp_index]
         
         # Jugar con la temperatura seleccionada
-        restart = play_game(T_init, alpha, steps)
+        restart = play_game(T_init, alpha, steps, mode)
         
         # Cambiar a la siguiente temperatura para la próxima partida
         if restart:
@@ -1,7 +1,6 @@
 # Importar funciones
 import random
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ========== DATOS DEL PROBLEMA ==========
 # Lista de pesos de las 10 cajas (kg)
@@ -171,6 +170,8 @@ def genetic_algorithm():
 
 # ========== EJECUCIÓN Y RESULTADOS ==========
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt   # Solo para el gráfico (así otros módulos pueden importar los datos)
+
     print("Ejecutando algoritmo genético para el problema de la grúa...")
     print(f"Capacidad máxima: {MAX_CAPACITY} kg")
     print(f"Número de cajas: {N_BOXES}")
@@ -0,0 +1,211 @@
+import math
+import random
+
+# Tablero de bits para Ta-te-ti y sus variantes N x N con k en línea (por ejemplo 15 x 15
+# con 5 en línea, el gomoku). A diferencia de la lista de 9 textos de Ejercicio5.py:
+#   - cada jugador es un entero cuyos bits son sus casillas (bit i = casilla i),
+#   - las líneas ganadoras (todas las ventanas de k casillas en filas, columnas y
+#     diagonales) se calculan una sola vez como máscaras de bits,
+#   - se llevan las fichas de cada jugador en cada línea; al poner o sacar una ficha solo
+#     se actualizan las líneas que pasan por esa casilla, y con ellas la evaluación.
+# Así evaluar una jugada cuesta O(líneas por la casilla) en vez de recorrer todo el tablero.
+
+PLAYERS = ("X", "O")
+WIN_SCORE = 1000
+
+
+def _line_weights(k, top, low):
+    """
+    Puntaje de una línea con c fichas de un solo jugador (c = 0..k): 'top' con k - 1
+    (a una jugada de ganar) y 'low' * 4**(c - 1) para las demás. Con k = 3 son los
+    valores de enhanced_evaluate (100/90 y 5/4).
+    """
+    weights = [0] + [low * 4 ** (c - 1) for c in range(1, k)] + [0]
+    weights[k - 1] = top
+    return weights
+
+
+class BitBoard:
+    """
+    Tablero n x n con k en línea. Las casillas se numeran fila * n + columna, como en
+    Ejercicio5.py; los jugadores son "X" (humano) y "O" (IA), y la evaluación es desde
+    el punto de vista de "O", como enhanced_evaluate.
+    """
+
+    def __init__(self, n=3, k=3):
+        if not 1 <= k <= n:
+            raise ValueError("Se necesita 1 <= k <= n")
+        self.n, self.k = n, k
+        self.size = n * n
+        self.full_mask = (1 << self.size) - 1
+
+        # Máscaras de las líneas ganadoras y líneas que pasan por cada casilla
+        self.lines, self.line_cells = [], []
+        for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            for r in range(n):
+                for c in range(n):
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if not (0 <= end_r < n and 0 <= end_c < n):
+                        continue
+                    cells = [(r + dr * j) * n + c + dc * j for j in range(k)]
+                    self.line_cells.append(cells)
+                    self.lines.append(sum(1 << i for i in cells))
+        self.cell_lines = [[] for _ in range(self.size)]
+        for li, cells in enumerate(self.line_cells):
+            for i in cells:
+                self.cell_lines[i].append(li)
+
+        # Bonificaciones por casilla (centro y esquinas, como en enhanced_evaluate)
+        self.cell_bonus = [[0] * self.size, [0] * self.size]   # [para X, para O]
+        for i in (0, n - 1, self.size - n, self.size - 1):
+            self.cell_bonus[0][i], self.cell_bonus[1][i] = -5, 7
+        if n % 2 == 1:
+            center = self.size // 2
+            self.cell_bonus[0][center], self.cell_bonus[1][center] = -75, 50
+        self.o_weights = _line_weights(k, 100, 5)
+        self.x_weights = _line_weights(k, 90, 4)
+        self.clear()
+
+    @classmethod
+    def from_list(cls, board, n=3, k=3):
+        """Crea el tablero a partir de una lista como la de Ejercicio5.py ("X", "O" o " ")."""
+        bb = cls(n, k)
+        for i, v in enumerate(board):
+            if v != " ":
+                bb.make(i, v)
+        bb.history.clear()
+        return bb
+
+    def to_list(self):
+        return ["X" if self.bits[0] >> i & 1 else "O" if self.bits[1] >> i & 1 else " "
+                for i in range(self.size)]
+
+    def clear(self):
+        self.bits = [0, 0]
+        self.counts = [[0] * len(self.lines), [0] * len(self.lines)]
+        self.score = 0          # Evaluación sin contar victorias ni empate
+        self.winner = None      # Primero en completar una línea: "X", "O" o None
+        self.complete = [0, 0]  # Líneas completas de cada jugador
+        self.history = []       # Pila de jugadas (casilla, jugador, ganador anterior) para undo()
+
+    def _line_score(self, li):
+        o, x = self.counts[1][li], self.counts[0][li]
+        if x == 0:
+            return self.o_weights[o]
+        if o == 0:
+            return -self.x_weights[x]
+        return 0                # Línea con fichas de los dos: ya no sirve para nadie
+
+    def make(self, i, player):
+        """Pone una ficha de 'player' en la casilla i (que debe estar vacía)."""
+        p = PLAYERS.index(player)
+        bit = 1 << i
+        if (self.bits[0] | self.bits[1]) & bit:
+            raise ValueError(f"La casilla {i} no está vacía")
+        self.history.append((i, p, self.winner))
+        self.bits[p] |= bit
+        counts, k = self.counts[p], self.k
+        score = self.score + self.cell_bonus[p][i]
+        for li in self.cell_lines[i]:
+            score -= self._line_score(li)
+            counts[li] += 1
+            score += self._line_score(li)
+            if counts[li] == k:
+                self.complete[p] += 1
+                if self.winner is None:
+                    self.winner = player
+        self.score = score
+
+    def undo(self):
+        """Deshace la última jugada de make()."""
+        i, p, winner = self.history.pop()
+        self.bits[p] &= ~(1 << i)
+        counts = self.counts[p]
+        score = self.score - self.cell_bonus[p][i]
+        for li in self.cell_lines[i]:
+            score -= self._line_score(li)
+            if counts[li] == self.k:
+                self.complete[p] -= 1
+            counts[li] -= 1
+            score += self._line_score(li)
+        self.score = score
+        self.winner = winner
+
+    def check_winner(self, player):
+        """True si 'player' tiene alguna línea completa (revisando las máscaras)."""
+        bits = self.bits[PLAYERS.index(player)]
+        return any(bits & mask == mask for mask in self.lines)
+
+    def is_full(self):
+        return (self.bits[0] | self.bits[1]) == self.full_mask
+
+    def empty_cells(self):
+        free = self.full_mask & ~(self.bits[0] | self.bits[1])
+        return [i for i in range(self.size) if free >> i & 1]
+
+    def evaluate(self):
+        """
+        Igual que enhanced_evaluate (para n = k = 3 da los mismos valores), en O(1).
+        Como enhanced_evaluate, revisa primero si "O" tiene una línea: si los dos tienen
+        alguna (un tablero que no sale de una partida) cuenta como victoria de "O".
+        """
+        if self.complete[1]:
+            return WIN_SCORE
+        if self.complete[0]:
+            return -WIN_SCORE
+        if self.is_full():
+            return 0
+        return self.score
+
+
+def simulated_annealing(board, player, T_init=10, alpha=0.95, steps=500, rng=random):
+    """
+    Recocido simulado de Ejercicio5.py sobre un BitBoard: en lugar de copiar el tablero
+    para cada vecino, se prueba la jugada con make() y se deshace con undo() si no se acepta.
+    Devuelve la casilla elegida (o -1 si no hay casillas libres); 'board' queda como estaba.
+    """
+    empty = board.empty_cells()
+    if not empty:
+        return -1
+    depth = len(board.history)
+    current_eval = best_eval = board.evaluate()
+    best_move = None
+    T = T_init
+
+    for _ in range(steps):
+        if not empty:
+            break
+        j = rng.randrange(len(empty))
+        move_idx = empty[j]
+        board.make(move_idx, player)
+        new_eval = board.evaluate()
+        delta = new_eval - current_eval
+
+        if delta > 0 or rng.random() < (math.exp(delta / T) if T > 0 else 0):
+            current_eval = new_eval
+            empty[j] = empty[-1]    # Se saca la casilla de las libres sin mover las demás
+            empty.pop()
+            if delta > 0 and new_eval > best_eval:
+                best_eval, best_move = new_eval, move_idx
+        else:
+            board.undo()
+        T = max(T * alpha, 0.01)
+
+    while len(board.history) > depth:
+        board.undo()
+    if best_move is not None:
+        return best_move
+    return rng.choice(board.empty_cells())
+
+
+if __name__ == "__main__":
+    import time
+
+    # Gomoku 15 x 15: una jugada del recocido con 500 pasos
+    board = BitBoard(15, 5)
+    for i, p in ((112, "X"), (113, "O"), (97, "X"), (127, "O")):
+        board.make(i, p)
+    t0 = time.perf_counter()
+    move = simulated_annealing(board, "O", steps=500)
+    print(f"15x15, 5 en línea: casilla {move} en {(time.perf_counter() - t0) * 1000:.1f} ms "
+          f"({len(board.lines)} líneas)")
@@ -0,0 +1,227 @@
+import numpy as np
+from Ejercicio6 import (weights as WEIGHTS, prices as PRICES, MAX_CAPACITY, POPULATION_SIZE,
+                        MUTATION_RATE, MAX_GENERATIONS, ELITISM_COUNT)
+
+# Algoritmo genético de Ejercicio6.py (problema de la grúa / mochila) con toda la población
+# en una matriz de NumPy: una fila por individuo y una columna por caja (bool).
+#   - Peso y precio de todos los individuos: un producto matriz-vector con 'weights' y 'prices'.
+#   - Cruce de un punto: se intercambian las colas de cada par con XOR, en el lugar.
+#   - Mutación: se sortea cuántos genes cambian y cuáles, en lugar de un número por gen.
+#   - Reparación: a los que exceden la capacidad se les sacan cajas hasta que entran.
+# Las operaciones se hacen por bloques de filas (CHUNK_CELLS celdas por bloque), así con
+# miles de cajas y cientos de miles de individuos los temporales no ocupan varios GB.
+# Los hijos se arman directamente en la matriz de la generación siguiente y se miden
+# (peso y precio) una sola vez por generación.
+# Los operadores son los mismos de Ejercicio6.py (ruleta, cruce de un punto, mutación por
+# gen, elitismo); cambia la forma de calcularlos y el generador aleatorio.
+
+CHUNK_CELLS = 1 << 22      # Individuos x cajas procesados por bloque
+
+
+class Knapsack:
+    """Datos del problema: pesos, precios y capacidad (por defecto, los de Ejercicio6.py)."""
+
+    def __init__(self, weights=WEIGHTS, prices=PRICES, capacity=MAX_CAPACITY):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        if self.weights.shape != self.prices.shape:
+            raise ValueError("'weights' y 'prices' deben tener el mismo largo")
+        self.capacity = capacity
+        self.n_boxes = len(self.weights)
+        # Los productos se hacen en float32 (más rápido); se usa float64 si no alcanza la precisión
+        exact32 = max(self.weights.sum(), self.prices.sum()) < 2 ** 24 and \
+            np.array_equal(self.weights, np.round(self.weights)) and \
+            np.array_equal(self.prices, np.round(self.prices))
+        self._dtype = np.float32 if exact32 else np.float64
+        self._wp = np.stack([self.weights, self.prices], axis=1).astype(self._dtype)
+
+    def chunk_rows(self):
+        return max(1, CHUNK_CELLS // max(self.n_boxes, 1))
+
+    def measure(self, population):
+        """(pesos, precios) totales de cada individuo, por bloques de filas."""
+        n = len(population)
+        result = np.empty((n, 2), dtype=np.float64)
+        step = min(self.chunk_rows(), n)
+        block = np.empty((step, self.n_boxes), dtype=self._dtype)    # Se reutiliza en cada bloque
+        for a in range(0, n, step):
+            rows = population[a:a + step]
+            block[:len(rows)] = rows
+            result[a:a + len(rows)] = block[:len(rows)] @ self._wp
+        return result[:, 0], result[:, 1]
+
+    def evaluate_fitness(self, population):
+        """Fitness de toda la población: precio total, o 0 si excede la capacidad."""
+        weight, price = self.measure(population)
+        return np.where(weight > self.capacity, 0.0, price)
+
+    def repair(self, population, rng, weight=None, price=None):
+        """
+        Saca cajas de los individuos que exceden la capacidad (modifica 'population').
+        Se recorren las cajas desde una posición al azar (dando la vuelta al final) y se
+        conservan las cargadas mientras entran; las que siguen se descargan. Devuelve los pesos finales.
+        Si se pasan 'weight' y 'price' (los de measure) se actualizan en el lugar.
+        """
+        if weight is None:
+            weight, price = self.measure(population)
+        rows = np.flatnonzero(weight > self.capacity)
+        if len(rows) == 0:
+            return weight
+        shift = int(rng.integers(self.n_boxes))
+        w = self.weights.astype(self._dtype)
+        step = min(self.chunk_rows(), len(rows))
+        buffer = np.empty((step, self.n_boxes), dtype=self._dtype)   # Se reutiliza en cada bloque
+        for a in range(0, len(rows), step):
+            idx = rows[a:a + step]
+            block = population[idx]
+            loaded = buffer[:len(idx)]
+            loaded[...] = block
+            loaded *= w
+            # Carga acumulada empezando en la caja 'shift' (y dando la vuelta), sin rotar la
+            # matriz: se acumula cada tramo en el lugar y al primero se le suma el total del segundo
+            np.cumsum(loaded[:, shift:], axis=1, out=loaded[:, shift:])
+            if shift:
+                np.cumsum(loaded[:, :shift], axis=1, out=loaded[:, :shift])
+                loaded[:, :shift] += loaded[:, -1:]
+            block &= loaded <= self.capacity
+            population[idx] = block
+            loaded[...] = block                      # Peso y precio de lo que quedó, como en measure
+            measured = loaded @ self._wp
+            weight[idx] = measured[:, 0]
+            if price is not None:
+                price[idx] = measured[:, 1]
+        return weight
+
+    def create_population(self, size, rng):
+        """Población inicial al azar (cada caja con probabilidad 1/2), ya reparada."""
+        population = rng.integers(0, 2, (size, self.n_boxes), dtype=np.bool_)
+        self.repair(population, rng)
+        return population
+
+
+def select_parents(fitness, count, rng):
+    """Ruleta: índices de 'count' padres, con probabilidad proporcional al fitness."""
+    total = fitness.sum()
+    if total == 0:
+        return rng.integers(0, len(fitness), size=count)   # Todos igual de malos
+    cumulative = np.cumsum(fitness)
+    return np.searchsorted(cumulative, rng.random(count) * cumulative[-1], side="right").clip(0, len(fitness) - 1)
+
+
+def crossover(parents1, parents2, rng):
+    """
+    Cruce de un punto para cada par de filas, en el lugar: desde el punto de corte se
+    intercambian las colas, así 'parents1' y 'parents2' pasan a ser los hijos. Devuelve (hijos1, hijos2).
+    """
+    n_boxes = parents1.shape[1]
+    if n_boxes < 2:
+        return parents1, parents2
+    points = rng.integers(1, n_boxes, size=len(parents1))
+    swap = parents1 ^ parents2
+    swap &= np.arange(n_boxes) >= points[:, None]     # Solo las colas
+    parents1 ^= swap
+    parents2 ^= swap
+    return parents1, parents2
+
+
+def mutate(population, rate, rng):
+    """
+    Invierte cada gen con probabilidad 'rate', modificando 'population'. Se sortea cuántos
+    genes cambian (binomial) y cuáles (sin repetir), que es lo mismo que un sorteo por gen.
+    """
+    rows, cols = population.shape
+    flips = rng.binomial(rows * cols, rate)
+    if flips:
+        r, c = np.divmod(rng.choice(rows * cols, flips, replace=False, shuffle=False), cols)
+        population[r, c] ^= True
+    return population
+
+
+def next_generation(problem, population, fitness, rng, mutation_rate=MUTATION_RATE,
+                    elitism=ELITISM_COUNT, out=None):
+    """
+    Arma la generación siguiente: los 'elitism' mejores pasan sin cambios y el resto sale
+    de cruce y mutación de padres elegidos por ruleta (y se repara). Se escribe en 'out'
+    (una matriz del mismo tamaño, para no reservar memoria en cada generación).
+    Devuelve (población nueva, fitness).
+    """
+    size = len(population)
+    out = np.empty_like(population) if out is None else out
+    elite = np.argsort(-fitness, kind="stable")[:elitism]
+    out[:len(elite)] = population[elite]
+
+    step = max(1, problem.chunk_rows() // 2)
+    start = len(elite)
+    while start < size:
+        pairs = min(step, -(-(size - start) // 2))
+        parents = select_parents(fitness, 2 * pairs, rng)
+        count = min(2 * pairs, size - start)
+        if count == 2 * pairs:
+            # Los padres se copian a su lugar en 'out' y ahí mismo se cruzan y mutan
+            children = out[start:start + count]
+            np.take(population, parents, axis=0, out=children)
+        else:
+            children = population[parents]     # Último bloque impar: sobra un hijo
+        crossover(children[:pairs], children[pairs:], rng)
+        mutate(children[:count], mutation_rate, rng)
+        if count < 2 * pairs:
+            out[start:start + count] = children[:count]
+        start += count
+
+    weight, price = problem.measure(out)
+    problem.repair(out[len(elite):], rng, weight[len(elite):], price[len(elite):])
+    return out, np.where(weight > problem.capacity, 0.0, price)
+
+
+def genetic_algorithm(problem=None, population_size=POPULATION_SIZE, mutation_rate=MUTATION_RATE,
+                      generations=MAX_GENERATIONS, elitism=ELITISM_COUNT, seed=None, verbose=True):
+    """
+    Igual que genetic_algorithm() de Ejercicio6.py, con la población como matriz.
+    Devuelve (mejor individuo como array de 0/1, mejor fitness, historia del mejor fitness).
+    """
+    problem = problem or Knapsack()
+    rng = np.random.default_rng(seed)
+    population = problem.create_population(population_size, rng)
+    fitness = problem.evaluate_fitness(population)
+    spare = np.empty_like(population)
+    best_individual, best_fitness, history = None, 0, []
+
+    for generation in range(generations):
+        i = int(np.argmax(fitness))
+        if fitness[i] > best_fitness:
+            best_fitness = fitness[i].item()
+            best_individual = population[i].astype(np.uint8)
+        history.append(best_fitness)
+        if verbose and generation % 10 == 0:
+            print(f"Generación {generation}: Mejor fitness = {best_fitness}")
+
+        new_population, fitness = next_generation(problem, population, fitness, rng,
+                                                  mutation_rate, elitism, out=spare)
+        population, spare = new_population, population
+
+    return best_individual, best_fitness, history
+
+
+if __name__ == "__main__":
+    import time
+
+    # El problema de Ejercicio6.py
+    best, value, _ = genetic_algorithm(seed=0, verbose=False)
+    print(f"Ejercicio6 (10 cajas): mejor precio ${value:.0f}, cajas {(np.flatnonzero(best) + 1).tolist()}")
+
+    # Una instancia grande: 5.000 cajas y 100.000 individuos (dos matrices de 500 MB)
+    rng = np.random.default_rng(1)
+    n_boxes, size, generations = 5_000, 100_000, 5
+    w = rng.integers(10, 1000, n_boxes)
+    problem = Knapsack(w, w + rng.integers(-5, 100, n_boxes), capacity=int(w.sum() // 10))
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    population = problem.create_population(size, rng)
+    fitness = problem.evaluate_fitness(population)
+    spare = np.empty_like(population)
+    print(f"{n_boxes} cajas, {size} individuos: población inicial en {time.perf_counter() - t0:.2f} s")
+    for generation in range(generations):
+        t0 = time.perf_counter()
+        new_population, fitness = next_generation(problem, population, fitness, rng, 0.001, out=spare)
+        population, spare = new_population, population
+        print(f"Generación {generation}: {time.perf_counter() - t0:.2f} s, mejor precio ${fitness.max():.0f}")
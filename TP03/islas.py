@@ -0,0 +1,153 @@
+import multiprocessing as mp
+import numpy as np
+from ga_vectorizado import Knapsack, next_generation
+from Ejercicio6 import POPULATION_SIZE, MUTATION_RATE, MAX_GENERATIONS, ELITISM_COUNT
+
+# Modelo de islas para el algoritmo genético de la mochila (ga_vectorizado.py).
+# Varias subpoblaciones ("islas") evolucionan por separado, cada una en su proceso, y cada
+# 'interval' generaciones cada isla manda copias de sus 'migrants' mejores individuos a otra,
+# donde reemplazan a los peores. Topologías:
+#   - "ring": la isla i le manda a la i + 1 (la última a la primera),
+#   - "random": en cada migración se sortea a quién le manda cada una (todas con la misma
+#     semilla, así cada isla sabe de quién recibe sin coordinarse).
+# Al final se junta lo de todas: el mejor individuo y la historia de cada isla.
+
+
+def migration_targets(n_islands, topology, seed, epoch):
+    """targets[i] = isla a la que manda la isla i en la migración número 'epoch'."""
+    if topology == "ring":
+        return [(i + 1) % n_islands for i in range(n_islands)]
+    if topology != "random":
+        raise ValueError(f"Topología desconocida: {topology!r} (usar 'ring' o 'random')")
+    if n_islands < 2:
+        return list(range(n_islands))
+    rng = np.random.default_rng([seed, epoch])
+    while True:
+        targets = rng.permutation(n_islands)
+        if not (targets == np.arange(n_islands)).any():     # Nadie se manda a sí misma
+            return targets.tolist()
+
+
+class Island:
+    """Una subpoblación con su propio generador aleatorio y su historia del mejor fitness."""
+
+    def __init__(self, problem, size, seed, mutation_rate=MUTATION_RATE, elitism=ELITISM_COUNT):
+        self.problem = problem
+        self.mutation_rate, self.elitism = mutation_rate, elitism
+        self.rng = np.random.default_rng(seed)
+        self.population = problem.create_population(size, self.rng)
+        self.fitness = problem.evaluate_fitness(self.population)
+        self._spare = np.empty_like(self.population)
+        self.best_individual, self.best_fitness, self.history = None, 0, []
+        self._record()
+
+    def _record(self):
+        """Revisa la población actual y agrega el mejor fitness hasta ahora a la historia."""
+        i = int(np.argmax(self.fitness))
+        if self.fitness[i] > self.best_fitness:
+            self.best_fitness = self.fitness[i].item()
+            self.best_individual = self.population[i].astype(np.uint8)
+        self.history.append(self.best_fitness)
+
+    def evolve(self, generations):
+        """Avanza 'generations' generaciones; se revisa cada población nueva, también la última."""
+        for _ in range(generations):
+            population, self.fitness = next_generation(self.problem, self.population, self.fitness, self.rng,
+                                                       self.mutation_rate, self.elitism, out=self._spare)
+            self.population, self._spare = population, self.population
+            self._record()
+
+    def emigrants(self, count):
+        """Copias de los 'count' mejores: (individuos, fitness)."""
+        best = np.argsort(-self.fitness, kind="stable")[:count]
+        return self.population[best].copy(), self.fitness[best].copy()
+
+    def immigrate(self, individuals, fitness):
+        """Los recién llegados reemplazan a los peores de la isla."""
+        worst = np.argsort(self.fitness, kind="stable")[:len(individuals)]
+        self.population[worst] = individuals
+        self.fitness[worst] = fitness
+
+
+def _island_process(i, options, inboxes, results):
+    """Una isla en su propio proceso: evoluciona, manda y recibe migrantes, y al final informa."""
+    island = Island(options["problem"], options["size"], [options["seed"], i],
+                    options["mutation_rate"], options["elitism"])
+    early = {}      # Migrantes que llegaron antes de tiempo: época -> (individuos, fitness)
+    for epoch, generations in enumerate(options["schedule"]):
+        island.evolve(generations)
+        if epoch == len(options["schedule"]) - 1:
+            break
+        targets = migration_targets(len(inboxes), options["topology"], options["seed"], epoch)
+        inboxes[targets[i]].put((epoch, island.emigrants(options["migrants"])))
+        # Cada isla recibe exactamente un envío por época, pero con topología "random" una
+        # isla más rápida puede mandar ya el de la época siguiente: se guarda para después
+        while epoch not in early:
+            sent, migrants = inboxes[i].get()
+            early[sent] = migrants
+        island.immigrate(*early.pop(epoch))
+    results.put((i, island.best_individual, island.best_fitness, island.history))
+
+
+def island_model(problem=None, islands=4, island_size=POPULATION_SIZE, generations=MAX_GENERATIONS,
+                 interval=10, migrants=2, topology="ring", mutation_rate=MUTATION_RATE,
+                 elitism=ELITISM_COUNT, seed=0, processes=True):
+    """
+    Corre 'islands' subpoblaciones de 'island_size' individuos durante 'generations'
+    generaciones, migrando 'migrants' individuos cada 'interval' generaciones.
+    Con processes=False las islas se turnan en este mismo proceso (mismos resultados).
+    Devuelve (mejor individuo, mejor fitness, historia del mejor fitness entre todas las
+    islas, [historia de cada isla]); cada historia tiene generations + 1 valores (la
+    población inicial y la de cada generación).
+    """
+    problem = problem or Knapsack()
+    interval = max(1, min(interval, generations))
+    schedule = [interval] * (generations // interval)
+    if generations % interval:
+        schedule.append(generations % interval)
+    options = {"problem": problem, "size": island_size, "seed": seed, "schedule": schedule,
+               "topology": topology, "migrants": migrants, "mutation_rate": mutation_rate,
+               "elitism": elitism}
+
+    if processes:
+        inboxes = [mp.Queue() for _ in range(islands)]
+        results = mp.Queue()
+        workers = [mp.Process(target=_island_process, args=(i, options, inboxes, results))
+                   for i in range(islands)]
+        for w in workers:
+            w.start()
+        finals = sorted(results.get() for _ in range(islands))
+        for w in workers:
+            w.join()
+    else:
+        group = [Island(problem, island_size, [seed, i], mutation_rate, elitism) for i in range(islands)]
+        for epoch, gens in enumerate(schedule):
+            for island in group:
+                island.evolve(gens)
+            if epoch < len(schedule) - 1:
+                targets = migration_targets(islands, topology, seed, epoch)
+                outgoing = [island.emigrants(migrants) for island in group]
+                for i, island in enumerate(group):
+                    group[targets[i]].immigrate(*outgoing[i])
+        finals = [(i, isl.best_individual, isl.best_fitness, isl.history) for i, isl in enumerate(group)]
+
+    _, best_individual, best_fitness, _ = max(finals, key=lambda r: (r[2], -r[0]))
+    histories = [history for _, _, _, history in finals]
+    return best_individual, best_fitness, np.max(histories, axis=0).tolist(), histories
+
+
+if __name__ == "__main__":
+    import time
+
+    # Instancia grande: 2.000 cajas, 4 islas de 2.500 individuos
+    rng = np.random.default_rng(1)
+    n_boxes = 2_000
+    w = rng.integers(10, 1000, n_boxes)
+    problem = Knapsack(w, w + rng.integers(-5, 100, n_boxes), capacity=int(w.sum() // 10))
+    for topology in ("ring", "random"):
+        t0 = time.perf_counter()
+        _, value, history, histories = island_model(problem, islands=4, island_size=2_500,
+                                                    generations=40, interval=10, migrants=5,
+                                                    topology=topology, mutation_rate=0.001)
+        print(f"{topology}: mejor precio ${value:.0f} en {time.perf_counter() - t0:.1f} s; "
+              f"final de cada isla: {[h[-1] for h in histories]}")
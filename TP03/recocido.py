@@ -0,0 +1,164 @@
+import copy
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+# Recocido simulado genérico (la misma idea que simulated_annealing de Ejercicio5.py, pero
+# sin nada propio del Ta-te-ti). El problema se describe con funciones:
+#   - propose(state, rng) -> move: una jugada al azar (no un estado nuevo),
+#   - delta(state, move) -> cambio del costo si se aplicara 'move' (sin aplicarlo),
+#   - apply(state, move): aplica la jugada modificando 'state'.
+# Nunca se copia el estado para probar una jugada: solo se copia (copy_state) al dejar
+# el mejor estado visto por una jugada que empeora. Se minimiza el costo.
+# anneal_restarts() corre K cadenas independientes en un pool de procesos.
+
+
+# ======== Esquemas de enfriamiento ========
+# Son clases (y no funciones anidadas) para poder mandarlas a otros procesos.
+
+class Geometric:
+    """T = T0 * alpha**paso, con mínimo T_min (el de Ejercicio5.py: T0=10, alpha=0.95, T_min=0.01)."""
+
+    def __init__(self, T0=10, alpha=0.95, T_min=0.01):
+        self.T0, self.alpha, self.T_min = T0, alpha, T_min
+
+    def __call__(self, step, steps):
+        return max(self.T0 * self.alpha ** step, self.T_min)
+
+
+class Linear:
+    """Baja en línea recta de T0 a T_end a lo largo de los 'steps' pasos."""
+
+    def __init__(self, T0=10, T_end=0.01):
+        self.T0, self.T_end = T0, T_end
+
+    def __call__(self, step, steps):
+        return self.T0 + (self.T_end - self.T0) * step / max(steps - 1, 1)
+
+
+class Logarithmic:
+    """T = T0 / log(paso + 2): enfría muy despacio (el esquema clásico con garantías de convergencia)."""
+
+    def __init__(self, T0=10):
+        self.T0 = T0
+
+    def __call__(self, step, steps):
+        return self.T0 / math.log(step + 2)
+
+
+# ======== Motor ========
+
+def anneal(state, cost, propose, delta, apply, schedule=None, steps=10_000,
+           rng=None, copy_state=copy.deepcopy, trace_every=None):
+    """
+    Una cadena de recocido sobre 'state' (que se modifica). 'cost' es el costo inicial.
+    Devuelve (mejor estado, mejor costo, traza), donde la traza es una lista de
+    (paso, temperatura, tasa de aceptación de la ventana, costo actual), una cada
+    'trace_every' pasos (por defecto, 100 puntos en total).
+    """
+    schedule = schedule or Geometric()
+    rng = rng or random.Random()
+    trace_every = trace_every or max(steps // 100, 1)
+    best, best_cost = None, cost     # best = None mientras el mejor sea el estado actual
+    trace, accepted = [], 0
+
+    for step in range(steps):
+        T = schedule(step, steps)
+        move = propose(state, rng)
+        d = delta(state, move)
+        if d <= 0 or (T > 0 and rng.random() < math.exp(-d / T)):
+            if d > 0 and best is None:
+                best = copy_state(state)   # Se deja el mejor estado: se guarda una copia
+            apply(state, move)
+            cost += d
+            accepted += 1
+            if cost < best_cost:
+                best, best_cost = None, cost
+        if (step + 1) % trace_every == 0:
+            trace.append((step + 1, T, accepted / trace_every, cost))
+            accepted = 0
+
+    return (state if best is None else best), best_cost, trace
+
+
+def _chain(args):
+    """Una reinicialización de anneal_restarts (función de módulo, para el pool)."""
+    state, cost, seed, options = args
+    return anneal(state, cost, rng=random.Random(seed), **options)
+
+
+def anneal_restarts(state, cost, propose, delta, apply, restarts=4, workers=None, seed=0, **options):
+    """
+    K = 'restarts' cadenas independientes desde 'state', repartidas en 'workers' procesos
+    (por defecto uno por núcleo; con 1 no se crea pool). Cada cadena usa la semilla seed + r.
+    Las funciones tienen que estar definidas a nivel de módulo para poder mandarlas al pool.
+    Devuelve (mejor estado, mejor costo, [(costo, traza) de cada cadena]).
+    """
+    options.update(propose=propose, delta=delta, apply=apply)
+    copy_state = options.get("copy_state", copy.deepcopy)
+    workers = min(workers or os.cpu_count() or 1, restarts)
+    tasks = [(copy_state(state) if workers == 1 else state, cost, seed + r, options)
+             for r in range(restarts)]
+    if workers == 1:
+        results = [_chain(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_chain, tasks))
+    best_state, best_cost, _ = min(results, key=lambda r: r[1])
+    return best_state, best_cost, [(c, trace) for _, c, trace in results]
+
+
+# ======== Ejemplo: repartir tareas entre máquinas ========
+# Estado: [máquina de cada tarea, carga de cada máquina, duración de cada tarea].
+# Costo: suma de los cuadrados de las cargas (mínima cuando están parejas).
+
+def balance_state(durations, machines, rng):
+    assignment = [rng.randrange(machines) for _ in durations]
+    loads = [0] * machines
+    for job, m in enumerate(assignment):
+        loads[m] += durations[job]
+    return [assignment, loads, durations], sum(load * load for load in loads)
+
+
+def balance_propose(state, rng):
+    return rng.randrange(len(state[0])), rng.randrange(len(state[1]))
+
+
+def balance_delta(state, move):
+    assignment, loads, durations = state
+    job, new = move
+    old, d = assignment[job], durations[job]
+    if old == new:
+        return 0
+    return (loads[old] - d) ** 2 - loads[old] ** 2 + (loads[new] + d) ** 2 - loads[new] ** 2
+
+
+def balance_apply(state, move):
+    assignment, loads, durations = state
+    job, new = move
+    loads[assignment[job]] -= durations[job]
+    loads[new] += durations[job]
+    assignment[job] = new
+
+
+def balance_copy(state):
+    return [state[0][:], state[1][:], state[2]]    # Las duraciones no cambian
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = random.Random(0)
+    durations = [rng.randint(1, 100) for _ in range(10_000)]
+    state, cost = balance_state(durations, 50, rng)
+    print(f"10.000 tareas en 50 máquinas, costo inicial {cost}")
+    for workers in (1, max(2, os.cpu_count() or 1)):
+        t0 = time.perf_counter()
+        _, best, chains = anneal_restarts(state, cost, balance_propose, balance_delta, balance_apply,
+                                          restarts=4, workers=workers, steps=200_000,
+                                          schedule=Geometric(1000, 0.9999, 0.01),
+                                          copy_state=balance_copy)
+        rates = [trace[-1][2] for _, trace in chains]
+        print(f"{workers} proceso(s): mejor costo {best} en {time.perf_counter() - t0:.2f} s "
+              f"(aceptación final por cadena: {', '.join(f'{r:.2f}' for r in rates)})")
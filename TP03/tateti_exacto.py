@@ -0,0 +1,122 @@
+import os
+import numpy as np
+
+# Jugador perfecto de Ta-te-ti para Ejercicio5.py.
+# El juego tiene muy pocas posiciones (5478 alcanzables empezando X), así que se resuelven
+# todas una sola vez con minimax y se guarda la mejor jugada de cada una en una tabla.
+# Cada tablero se traduce a un índice en base 3 (" " = 0, "X" = 1, "O" = 2; la casilla i
+# vale 3**i), por lo que elegir una jugada es leer una posición de un array.
+# La tabla se guarda en disco (TABLE_PATH) y se carga al empezar; si no existe se calcula.
+
+PLAYERS = ("X", "O")
+CODE = {" ": 0, "X": 1, "O": 2}
+POW3 = [3 ** i for i in range(9)]
+SIZE = 3 ** 9
+LINES = [
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],
+    [0, 4, 8], [2, 4, 6],
+]
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tateti_tabla.npy")
+
+_table = None   # Tabla cargada: ver load_table()
+
+
+def board_index(board):
+    """Índice en base 3 de un tablero ["X", "O", " ", ...]."""
+    return sum(CODE[v] * p for v, p in zip(board, POW3))
+
+
+def _winner(cells):
+    for a, b, c in LINES:
+        if cells[a] and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return 0
+
+
+def solve():
+    """
+    Resuelve todas las posiciones alcanzables, empiece quien empiece.
+    Devuelve un array int8 de forma (4, 3**9):
+      - filas 0 y 1: mejor casilla para X / para O en ese tablero (-1 si el juego terminó
+        o la posición no es alcanzable),
+      - filas 2 y 3: valor para el que mueve (+1 gana, 0 empate, -1 pierde).
+    A igual resultado se prefiere ganar antes (o perder lo más tarde posible) y, después,
+    la casilla de menor número, así la jugada elegida es siempre la misma.
+    """
+    table = np.full((4, SIZE), -1, dtype=np.int8)
+    table[2:] = 0
+    score = {}      # (índice, jugador) -> puntaje con la profundidad (para ganar rápido)
+
+    def negamax(cells, index, player, empty):
+        key = (index, player)
+        if key in score:
+            return score[key]
+        me = player + 1
+        best, best_move = None, -1
+        for i in range(9):
+            if cells[i]:
+                continue
+            cells[i] = me
+            if _winner(cells) == me:
+                value = 10 + empty            # Gana ya: más puntaje cuanto antes
+            elif empty == 1:
+                value = 0                     # Tablero lleno: empate
+            else:
+                value = -negamax(cells, index + me * POW3[i], 1 - player, empty - 1)
+            cells[i] = 0
+            if best is None or value > best:
+                best, best_move = value, i
+        score[key] = best
+        table[player, index] = best_move
+        table[2 + player, index] = (best > 0) - (best < 0)
+        return best
+
+    for first in (0, 1):
+        negamax([0] * 9, 0, first, 9)
+    return table
+
+
+def load_table(path=TABLE_PATH):
+    """Carga la tabla de 'path' (mapeada en memoria); si no está o no sirve, la calcula y la guarda."""
+    global _table
+    try:
+        table = np.load(path, mmap_mode="r")
+        if table.shape != (4, SIZE) or table.dtype != np.int8:
+            raise ValueError(f"Tabla inválida en {path!r}")
+    except (OSError, ValueError):
+        table = solve()
+        try:
+            np.save(path, table)
+        except OSError:
+            pass    # Sin permiso de escritura: se usa la tabla en memoria
+    _table = table
+    return table
+
+
+def perfect_move(board, player):
+    """Mejor casilla (0-8) para 'player' ("X" u "O"), o -1 si el juego ya terminó."""
+    table = _table if _table is not None else load_table()
+    return int(table[PLAYERS.index(player), board_index(board)])
+
+
+def position_value(board, player):
+    """Resultado con juego perfecto para el que mueve: 1 gana, 0 empate, -1 pierde."""
+    table = _table if _table is not None else load_table()
+    return int(table[2 + PLAYERS.index(player), board_index(board)])
+
+
+if __name__ == "__main__":
+    import time
+
+    t0 = time.perf_counter()
+    table = solve()
+    print(f"Tabla calculada en {time.perf_counter() - t0:.2f} s "
+          f"({int((table[0] >= 0).sum() + (table[1] >= 0).sum())} posiciones con jugada)")
+    print("Valor del tablero vacío para X:", int(table[2, 0]), "(0 = empate con juego perfecto)")
+
+    board = [" "] * 9
+    t0 = time.perf_counter()
+    for _ in range(100_000):
+        perfect_move(board, "X")
+    print(f"Consulta: {(time.perf_counter() - t0) * 10:.2f} µs por jugada")
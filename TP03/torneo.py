@@ -0,0 +1,194 @@
+import os
+
+# Ejercicio5.py inicia pygame al importarse: sin ventana (y sin el mensaje de bienvenida)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import csv
+import itertools
+import json
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import Ejercicio5
+from Ejercicio5 import check_winner, is_full, enhanced_evaluate
+from tateti_exacto import perfect_move
+from bitboard import BitBoard, simulated_annealing as bitboard_annealing
+
+# Torneo sin ventana para la IA de recocido simulado de Ejercicio5.py.
+# La IA juega con "O" (enhanced_evaluate puntúa desde el lado de "O") contra oponentes
+# aleatorio, avaro o perfecto, para cada combinación de (T_init, alpha, steps).
+# Se alterna quién empieza y cada partida usa su propia semilla, así los resultados se
+# pueden repetir. Las partidas se reparten en procesos y el informe (victorias, empates
+# y derrotas de la IA, jugadas por segundo y percentiles de latencia) se guarda en CSV/JSON.
+
+
+# ======== Oponentes ========
+# Cada oponente es una función (tablero, jugador, rng) -> casilla.
+
+def random_player(board, player, rng):
+    return rng.choice([i for i in range(9) if board[i] == " "])
+
+
+def greedy_player(board, player, rng):
+    """Elige la jugada con mejor enhanced_evaluate para 'player' después de jugar (empates al azar)."""
+    sign = 1 if player == "O" else -1
+    best, moves = None, []
+    for i in range(9):
+        if board[i] != " ":
+            continue
+        board[i] = player
+        value = sign * enhanced_evaluate(board)
+        board[i] = " "
+        if best is None or value > best:
+            best, moves = value, [i]
+        elif value == best:
+            moves.append(i)
+    return rng.choice(moves)
+
+
+def perfect_player(board, player, rng):
+    return perfect_move(board, player)
+
+
+OPPONENTS = {"random": random_player, "greedy": greedy_player, "perfect": perfect_player}
+
+
+# ======== Partidas ========
+
+def play_match(T_init, alpha, steps, opponent, seed, ai_first, engine="lista"):
+    """
+    Una partida entre el recocido ("O") y 'opponent' ("X"). Devuelve ("W", "D" o "L"
+    desde el lado de la IA, lista de segundos que tardó cada jugada de la IA).
+    engine: "lista" (Ejercicio5.simulated_annealing) o "bitboard" (bitboard.py).
+    """
+    random.seed(seed)               # simulated_annealing usa el módulo random
+    rng = random.Random(seed + 1)
+    other = OPPONENTS[opponent]
+    board = [" "] * 9
+    turn = "O" if ai_first else "X"
+    latencies = []
+
+    while True:
+        if turn == "O":
+            t0 = time.perf_counter()
+            if engine == "bitboard":
+                move = bitboard_annealing(BitBoard.from_list(board), "O", T_init, alpha, steps)
+            else:
+                move = Ejercicio5.simulated_annealing(board, "O", T_init, alpha, steps)
+            latencies.append(time.perf_counter() - t0)
+        else:
+            move = other(board, "X", rng)
+        board[move] = turn
+        if check_winner(board, turn):
+            return ("W" if turn == "O" else "L"), latencies
+        if is_full(board):
+            return "D", latencies
+        turn = "X" if turn == "O" else "O"
+
+
+def _play_chunk(key, seeds, engine):
+    """Juega las partidas de 'seeds' para key = (T_init, alpha, steps, oponente)."""
+    T_init, alpha, steps, opponent = key
+    outcomes, latencies = {"W": 0, "D": 0, "L": 0}, []
+    for seed in seeds:
+        result, times = play_match(T_init, alpha, steps, opponent, seed, seed % 2 == 0, engine)
+        outcomes[result] += 1
+        latencies.extend(times)
+    return key, outcomes, latencies
+
+
+def run_tournament(temperatures=(1, 10, 100), alphas=(0.95,), steps=(500,),
+                   opponents=tuple(OPPONENTS), games=100, workers=None, seed=0,
+                   engine="lista", chunk=25):
+    """
+    Juega 'games' partidas por cada combinación de parámetros y oponente, repartidas en
+    tandas de 'chunk' partidas entre 'workers' procesos (por defecto uno por núcleo).
+    Devuelve una fila (diccionario) por combinación, en el orden de la grilla.
+    """
+    for name in opponents:
+        if name not in OPPONENTS:
+            raise ValueError(f"Oponente desconocido: {name!r} (usar {', '.join(OPPONENTS)})")
+    keys = list(itertools.product(temperatures, alphas, steps, opponents))
+    tasks = [(key, range(seed + k, min(seed + k + chunk, seed + games)))
+             for key in keys for k in range(0, games, chunk)]
+    outcomes = {key: {"W": 0, "D": 0, "L": 0} for key in keys}
+    latencies = defaultdict(list)
+
+    def merge(key, counts, times):
+        for r, n in counts.items():
+            outcomes[key][r] += n
+        latencies[key].extend(times)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for key, seeds in tasks:
+            merge(*_play_chunk(key, seeds, engine))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_play_chunk, key, seeds, engine) for key, seeds in tasks]
+            for future in as_completed(futures):
+                merge(*future.result())
+
+    rows = []
+    for key in keys:
+        T_init, alpha, n_steps, opponent = key
+        counts, times = outcomes[key], np.array(latencies[key])
+        p50, p90, p99 = np.percentile(times, [50, 90, 99]) * 1000 if len(times) else (0, 0, 0)
+        rows.append({
+            "T_init": T_init, "alpha": alpha, "steps": n_steps, "opponent": opponent,
+            "engine": engine, "games": games,
+            "wins": counts["W"], "draws": counts["D"], "losses": counts["L"],
+            "win_rate": counts["W"] / games, "draw_rate": counts["D"] / games,
+            "loss_rate": counts["L"] / games,
+            "ai_moves": len(times),
+            "moves_per_s": len(times) / times.sum() if times.sum() > 0 else 0.0,
+            "latency_p50_ms": float(p50), "latency_p90_ms": float(p90),
+            "latency_p99_ms": float(p99),
+        })
+    return rows
+
+
+def write_csv(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Torneo sin ventana del recocido simulado de Ejercicio5.py")
+    parser.add_argument("--temps", type=float, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--alphas", type=float, nargs="+", default=[0.95])
+    parser.add_argument("--steps", type=int, nargs="+", default=[500])
+    parser.add_argument("--opponents", nargs="+", default=list(OPPONENTS), choices=list(OPPONENTS))
+    parser.add_argument("--games", type=int, default=100, help="partidas por combinación")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", default="lista", choices=["lista", "bitboard"])
+    parser.add_argument("--csv", help="archivo CSV de salida")
+    parser.add_argument("--json", help="archivo JSON de salida")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    rows = run_tournament(args.temps, args.alphas, args.steps, args.opponents, args.games,
+                          args.workers, args.seed, args.engine)
+    print(f"{len(rows) * args.games} partidas en {time.perf_counter() - t0:.1f} s")
+    for row in rows:
+        print(f"T={row['T_init']:<6} alpha={row['alpha']:<5} steps={row['steps']:<5} "
+              f"vs {row['opponent']:<8} G/E/P {row['wins']}/{row['draws']}/{row['losses']}  "
+              f"{row['moves_per_s']:.0f} jugadas/s  p50 {row['latency_p50_ms']:.2f} ms  "
+              f"p99 {row['latency_p99_ms']:.2f} ms")
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.json:
+        write_json(rows, args.json)